@@ -0,0 +1,71 @@
+# JMeter 로그(jmeter.log)의 summariser 구간 통계를 시계열로 변환하고 오류 급증/응답 시간 수준 변화를 표시하는 스크립트
+# 사용법: python scripts/analyze_jmeter_log.py [jmeter.log] [--out reports/load/jmeter-log.json] [--error-threshold 10]
+# 로그는 한 줄씩 읽으므로 크기(수 GB)와 관계없이 메모리 사용량이 일정하며, load_test.py 실행 로그도 같은 방식으로 분석 가능
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.utils.jmeter_log import (
+    DEFAULT_BASELINE_WINDOW, DEFAULT_ERROR_THRESHOLD, DEFAULT_LATENCY_FACTOR, DEFAULT_MIN_INTERVALS,
+    AnomalyDetector, describe_flag, format_time, parse_log,
+)
+
+DEFAULT_REPORT_DIR = ROOT / "reports" / "load"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JMeter 로그 summariser 구간 통계 분석")
+    parser.add_argument("log", nargs="?", default=str(ROOT / "jmeter.log"), help="분석할 로그 파일 (기본값 jmeter.log)")
+    parser.add_argument("--label", default="summary", help="summariser 이름 (기본값 summary)")
+    parser.add_argument("--out", help=f"결과 JSON 경로 (기본값 {DEFAULT_REPORT_DIR.relative_to(ROOT)}/<로그 이름>.json)")
+    parser.add_argument("--error-threshold", type=float, default=DEFAULT_ERROR_THRESHOLD, help=f"오류 급증으로 볼 구간 오류율(%%, 기본값 {DEFAULT_ERROR_THRESHOLD:g})")
+    parser.add_argument("--latency-factor", type=float, default=DEFAULT_LATENCY_FACTOR, help=f"응답 시간 수준 변화로 볼 배수 (기본값 {DEFAULT_LATENCY_FACTOR:g})")
+    parser.add_argument("--baseline-window", type=int, default=DEFAULT_BASELINE_WINDOW, help=f"응답 시간 기준값을 계산할 직전 구간 수 (기본값 {DEFAULT_BASELINE_WINDOW})")
+    parser.add_argument("--min-intervals", type=int, default=DEFAULT_MIN_INTERVALS, help=f"수준 변화로 판단할 최소 연속 구간 수 (기본값 {DEFAULT_MIN_INTERVALS})")
+    args = parser.parse_args()
+
+    detector = AnomalyDetector(args.error_threshold, args.latency_factor, args.baseline_window, args.min_intervals)
+    with open(args.log, encoding="utf-8", errors="replace") as f:
+        series = parse_log(f, detector, label=args.label)
+    flags = detector.finish()
+    if not len(series):
+        print(f"⚠️ '{args.label} +' 구간 통계가 없습니다: {args.log}")
+        return 1
+
+    print(f"{'end':<20} {'count':>6} {'tps':>6} {'avg':>6} {'min':>6} {'max':>7} {'err%':>7} {'active':>6} {'peak':>5}")
+    for i in range(len(series)):
+        print(
+            f"{format_time(series.end[i]):<20} {series.count[i]:>6} {series.throughput[i]:>6.1f} {series.avg_ms[i]:>6} "
+            f"{series.min_ms[i]:>6} {series.max_ms[i]:>7} {series.error_pct[i]:>7.2f} {series.active[i]:>6} {series.peak_active[i]:>5}"
+        )
+    total = series.total()
+    print(
+        f"\n전체 {total['count']}건 / {total['throughput']:.2f}/s / 평균 {total['mean_ms']:.0f}ms / "
+        f"최대 {total['max_ms']}ms / 오류 {total['errors']}건 ({total['error_rate']:.2f}%)"
+    )
+    for flag in flags:
+        print(describe_flag(flag))
+    if not flags:
+        print("✅ 오류 급증/응답 시간 수준 변화 없음")
+
+    # load_test.py 결과와 같은 형식(total/intervals) + 열 단위 시계열 + 표시 목록
+    report = {
+        "source": str(args.log),
+        "total": total,
+        "intervals": series.intervals(),
+        "series": series.to_columns(),
+        "flags": flags,
+    }
+    path = Path(args.out) if args.out else DEFAULT_REPORT_DIR / f"{Path(args.log).stem}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False))
+    print(f"\n📄 결과 저장: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# conftest import 시간과 pytest 수집(collect) 시간을 측정하는 스크립트
+# 사용법: python scripts/bench_startup.py [--repeat 5] [pytest 인자...]
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# conftest만 import 하고 소요 시간과 무거운 모듈(selenium, allure) 로드 여부를 출력
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import tests.conftest
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "selenium_loaded": "selenium" in sys.modules,
+    "allure_loaded": "allure" in sys.modules,
+}))
+"""
+
+
+def measure_conftest_import():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_collection(pytest_args):
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", *pytest_args],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    return time.perf_counter() - start
+
+
+def _summary(samples):
+    return f"median {statistics.median(samples) * 1000:.0f}ms / min {min(samples) * 1000:.0f}ms / max {max(samples) * 1000:.0f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="conftest import 및 pytest 수집 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (기본값 5)")
+    args, pytest_args = parser.parse_known_args()
+
+    imports = [measure_conftest_import() for _ in range(args.repeat)]
+    collects = [measure_collection(pytest_args) for _ in range(args.repeat)]
+
+    print(f"⏱️ conftest import : {_summary([r['elapsed'] for r in imports])}")
+    print(f"⏱️ pytest 수집      : {_summary(collects)}")
+    print(f"🔍 selenium 로드 여부: {'예' if any(r['selenium_loaded'] for r in imports) else '아니오'}")
+    print(f"🔍 allure 로드 여부  : {'예' if any(r['allure_loaded'] for r in imports) else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+# 기존 API 테스트 함수를 가상 사용자로 반복 실행하는 부하 테스트 스크립트
+# 사용법: python scripts/load_test.py <노드 ID>... [--users 10] [--ramp-up 30] [--hold 120] [--ramp-down 10] [--interval 30]
+#         python scripts/load_test.py <노드 ID>... --rate 5 [--duration 300] [--max-in-flight 50]  (open-model, 도착률 고정)
+#         python scripts/load_test.py <노드 ID>... --sweep 1,2,4,8,16 [--step-hold 60] [--max-error-rate 5] [--max-p99 3000]  (용량 스윕)
+#         python scripts/load_test.py <노드 ID>[@가중치]... --soak 4h [--users 5] [--rolling 10] [--log-file reports/load/soak.log]  (소크 테스트)
+# 예: python scripts/load_test.py tests/api/test_compute.py::TestComputeCRUD::test_VM006_list_vm --users 5 --hold 300
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from dotenv import load_dotenv
+from loguru import logger
+from src.utils.capacity import ConcurrencySweep, parse_steps
+from src.utils.jmeter_log import analyze_intervals, describe_flag
+from src.utils.load import parse_duration
+
+load_dotenv()
+
+# 부하 측정을 왜곡하는 클라이언트 기능은 기본적으로 끔 (환경 변수로 명시하면 그 값을 사용)
+# - GET 병합: 가상 사용자들의 같은 요청이 하나로 합쳐져 실제 부하가 줄어듦
+# - 요청 단위 재시도/서킷 브레이커: 오류가 재시도/즉시 실패로 가려져 오류율과 응답 시간이 달라짐
+LOAD_CLIENT_DEFAULTS = {
+    "HTTP_COALESCE": "0",
+    "RETRY_MAX_ATTEMPTS": "1",
+    "CIRCUIT_BREAKER": "0",
+}
+
+DEFAULT_REPORT_DIR = ROOT / "reports" / "load"
+# 소크 테스트에서 콘솔에 INFO 로그를 출력하는 모듈 (나머지 모듈은 WARNING 이상만 출력)
+SOAK_CONSOLE_MODULES = ("__main__", "src.utils.load")
+# 소크 테스트 로그 파일 교체 크기와 보관 개수 (디스크 사용량 상한 = 크기 x (개수 + 1))
+SOAK_LOG_ROTATION = "50 MB"
+SOAK_LOG_RETENTION = 5
+
+
+def build_fixtures(client):
+    """부하 모드에서 테스트 함수에 주입하는 fixture (tests/conftest.py의 같은 이름 fixture와 동일한 값)"""
+    from src.utils.api_util import wait_for_status
+    from src.utils.reference_data import load_reference_data
+    from src.utils.teardown import delete_in_dependency_order
+    from src.utils.token_cache import get_cached_token
+    from tests.conftest import DEFAULT_ZONE_ID, create_resource, delete_resource, generate_fresh_token
+
+    token = os.getenv("ACCESS_TOKEN") or get_cached_token(generate_fresh_token)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Host": "portal.gov.elice.cloud",
+        "Content-Type": "application/json",
+    }
+    client.enable_token_refresh(headers, generate_fresh_token)
+
+    base_urls = {
+        "base_url_infra": os.getenv("BASE_URL_INFRA", "https://portal.gov.elice.cloud/api/user"),
+        "base_url_compute": os.getenv("BASE_URL_COMPUTE", "https://portal.gov.elice.cloud/api/user/resource/compute"),
+        "base_url_block_storage": os.getenv("BASE_URL_BLOCK_STORAGE", "https://portal.gov.elice.cloud/api/user/resource/storage/block_storage"),
+        "base_url_network": os.getenv("BASE_URL_NETWORK", "https://portal.gov.elice.cloud/api/user/resource/network"),
+        "base_url_object_storage": os.getenv("BASE_URL_OBJECT_STORAGE", "https://portal.gov.elice.cloud/api/user/resource/storage/object_storage"),
+    }
+
+    def resource_factory():
+        """반복마다 생성한 리소스를 반복이 끝나면 의존 관계 순서로 삭제"""
+        created = []
+
+        def _create(base_url, payload):
+            data = create_resource(base_url, headers, payload, client=client)
+            created.append({"url": base_url, "id": data["id"], "name": payload["name"], "payload": payload})
+            return {"id": data["id"], "name": payload["name"]}
+
+        yield _create
+
+        def _delete(resource):
+            try:
+                delete_resource(resource["url"], headers, resource["id"], client=client)
+                return True
+            except Exception:
+                logger.exception(f"⛔ 부하 반복 정리 실패: {resource['name']} ({resource['id']})")
+                return False
+
+        def _wait_deleted(resource):
+            return wait_for_status(f"{resource['url']}/{resource['id']}", headers, expected_status="deleted", client=client)
+
+        delete_in_dependency_order(created, _delete, _wait_deleted)
+
+    fixtures = {"api_client": client, "api_headers": headers, "resource_factory": resource_factory, **base_urls}
+    try:
+        reference = load_reference_data(base_urls["base_url_infra"], headers, client=client)
+        fixtures.update(reference_data=reference, zone_id=reference.zone_id(DEFAULT_ZONE_ID), instance_type=reference.instance_type)
+    except Exception as e:
+        logger.warning(f"⚠️ 참조 데이터를 불러오지 못해 reference_data/zone_id/instance_type fixture 없이 진행: {e}")
+    return fixtures
+
+
+def parse_mix(tests):
+    """
+    "노드 ID@가중치" 목록을 (노드 ID, 가중치) 목록으로 변환 (가중치 생략 시 1)
+    가중치만큼 시나리오를 반복 배치해 가상 사용자가 그 비율로 실행
+    """
+    mix = []
+    for test in tests:
+        node_id, _, weight = test.rpartition("@") if "@" in test else (test, "", "1")
+        if not weight.isdigit() or int(weight) < 1:
+            raise ValueError(f"가중치는 1 이상의 정수여야 합니다: {test}")
+        mix.append((node_id, int(weight)))
+    return mix
+
+
+def configure_soak_logging(log_file):
+    """
+    소크 테스트 로그 설정: 콘솔에는 구간 통계와 경고 이상만 출력하고,
+    반복마다 나오는 테스트 로그는 log_file을 지정한 경우에만 크기 제한(교체/보관 개수)이 있는 파일로 남김
+    """
+    warning = logger.level("WARNING").no
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", filter=lambda record: record["level"].no >= warning or record["name"] in SOAK_CONSOLE_MODULES)
+    if log_file:
+        logger.add(log_file, level=os.getenv("LOAD_LOG_LEVEL", "INFO"), rotation=SOAK_LOG_ROTATION, retention=SOAK_LOG_RETENTION, enqueue=True)
+
+
+def print_report(report):
+    print(f"\n{'scenario':<50} {'count':>7} {'err%':>6} {'tps':>7} {'avg':>7} {'p50':>7} {'p90':>7} {'p99':>7} {'max':>7}")
+    rows = list(report["scenarios"].items()) + [("TOTAL", report["total"])]
+    for name, entry in rows:
+        if not entry["count"]:
+            continue
+        print(
+            f"{name:<50} {entry['count']:>7} {entry['error_rate']:>6.2f} {entry['throughput']:>7.2f} {entry['mean_ms']:>7.0f} "
+            f"{entry['p50_ms']:>7.0f} {entry['p90_ms']:>7.0f} {entry['p99_ms']:>7.0f} {entry['max_ms']:>7.0f}"
+        )
+    if report.get("model") == "open":
+        corrected, uncorrected, lag = report["total"], report["uncorrected"], report["schedule_lag"]
+        if corrected["count"]:
+            print(
+                f"\n목표 도착률 {report['target_rate']:g}/s / 실제 처리량 {corrected['throughput']:.2f}/s"
+                f"\n  보정(예정 시각 기준)   p50 {corrected['p50_ms']:>7.0f}  p90 {corrected['p90_ms']:>7.0f}  p99 {corrected['p99_ms']:>7.0f}  max {corrected['max_ms']:>7.0f}"
+                f"\n  보정 전(실제 시작 기준) p50 {uncorrected['p50_ms']:>7.0f}  p90 {uncorrected['p90_ms']:>7.0f}  p99 {uncorrected['p99_ms']:>7.0f}  max {uncorrected['max_ms']:>7.0f}"
+                f"\n  시작 지연             p50 {lag['p50_ms']:>7.0f}  p90 {lag['p90_ms']:>7.0f}  p99 {lag['p99_ms']:>7.0f}  max {lag['max_ms']:>7.0f}"
+            )
+    for error, count in list(report["errors"].items())[:10]:
+        print(f"  ⛔ {count:>5}회  {error}")
+    for flag in report.get("flags", []):
+        print(describe_flag(flag, relative=True))
+
+
+def print_sweep(sweep, unit):
+    print(f"\n{unit:>8} {'tps':>8} {'avg':>7} {'p50':>7} {'p90':>7} {'p99':>7} {'err%':>6}")
+    for point in sweep["points"]:
+        marker = "  ⛔ " + point["breach"] if point["breach"] else ("  ◀ knee" if point["step"] == sweep["knee"] else "")
+        print(
+            f"{point['step']:>8} {point['throughput']:>8.2f} {point['mean_ms'] or 0:>7.0f} {point['p50_ms'] or 0:>7.0f} "
+            f"{point['p90_ms'] or 0:>7.0f} {point['p99_ms'] or 0:>7.0f} {point['error_rate']:>6.2f}{marker}"
+        )
+    capacity = sweep["capacity"]
+    if capacity is None:
+        print("\n⛔ 첫 단계부터 임계값을 넘었습니다 - 더 낮은 단계로 다시 실행하세요")
+        return
+    basis = "처리량 무릎" if sweep["knee"] is not None else "마지막 정상 단계"
+    print(f"\n📈 수용 가능 용량({basis}): {unit} {capacity['step']} / {capacity['throughput']:.2f}/s (마지막 정상 단계 {sweep['last_healthy_step']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기존 API 테스트를 가상 사용자로 반복 실행하는 부하 테스트")
+    parser.add_argument("tests", nargs="+", help="부하 시나리오로 사용할 테스트 노드 ID (파일::[클래스::]함수)")
+    parser.add_argument("--users", type=int, default=10, help="최대 가상 사용자 수 (기본값 10)")
+    parser.add_argument("--ramp-up", type=float, default=30, help="0 → 최대 사용자까지 늘리는 시간(초, 기본값 30)")
+    parser.add_argument("--hold", type=float, default=120, help="최대 사용자 유지 시간(초, 기본값 120)")
+    parser.add_argument("--ramp-down", type=float, default=10, help="최대 사용자 → 0까지 줄이는 시간(초, 기본값 10)")
+    parser.add_argument("--interval", type=float, default=30, help="구간 통계 출력 간격(초, 기본값 30)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="반복 사이 대기 시간(초, 기본값 0)")
+    parser.add_argument("--rate", type=float, help="지정하면 open-model: 응답 시간과 무관하게 초당 이 횟수만큼 시나리오 시작")
+    parser.add_argument("--duration", type=float, default=120, help="open-model 실행 시간(초, 기본값 120)")
+    parser.add_argument("--max-in-flight", type=int, default=50, help="open-model 최대 동시 실행 수 (기본값 50)")
+    parser.add_argument("--arrival", choices=("constant", "poisson"), default="constant", help="open-model 도착 간격 분포 (기본값 constant)")
+    parser.add_argument("--sweep", help="용량 스윕 단계 (예: 1,2,4,8,16) - 단계별로 부하를 늘리며 임계값을 넘으면 중단")
+    parser.add_argument("--sweep-mode", choices=("users", "rate"), default="users", help="스윕 단계 값의 의미: 가상 사용자 수 또는 초당 도착률 (기본값 users)")
+    parser.add_argument("--step-hold", type=float, default=60, help="스윕 단계별 유지 시간(초, 기본값 60)")
+    parser.add_argument("--max-error-rate", type=float, default=5.0, help="스윕 중단 오류율(%%, 기본값 5)")
+    parser.add_argument("--max-p99", type=float, help="스윕 중단 p99 응답 시간(ms, 기본값: 사용 안 함)")
+    parser.add_argument("--soak", help="소크 테스트 실행 시간 (예: 3600, 90m, 4h) - 최대 사용자를 이 시간 동안 유지하고 집계만 주기적으로 저장")
+    parser.add_argument("--rolling", type=int, default=10, help="소크 테스트 이동 통계에 합치는 최근 구간 수 (기본값 10)")
+    parser.add_argument("--log-file", help="소크 테스트 전체 로그 파일 (50MB마다 교체, 5개 보관)")
+    parser.add_argument("--report", help=f"결과 JSON 경로 (기본값 {DEFAULT_REPORT_DIR.relative_to(ROOT)}/<load|sweep|soak>-<시각>.json)")
+    args = parser.parse_args()
+    if args.soak and (args.rate or args.sweep):
+        parser.error("--soak는 --rate/--sweep과 함께 사용할 수 없습니다")
+    try:
+        steps = parse_steps(args.sweep) if args.sweep else None
+        soak = parse_duration(args.soak) if args.soak else None
+        mix = parse_mix(args.tests)
+    except ValueError as e:
+        parser.error(str(e))
+    if soak:
+        configure_soak_logging(args.log_file)
+
+    for name, value in LOAD_CLIENT_DEFAULTS.items():
+        os.environ.setdefault(name, value)
+    # 동시에 실행되는 시나리오마다 커넥션 하나를 유지할 수 있도록 풀 크기를 맞춤
+    if steps and args.sweep_mode == "users":
+        concurrency = int(steps[-1])
+    else:
+        concurrency = args.max_in_flight if (args.rate or steps) else args.users
+    os.environ.setdefault("HTTP_POOL_SIZE", str(max(concurrency, 1)))
+
+    from src.utils.http_client import get_client
+    from src.utils.latency import get_recorder
+    from src.utils.load import LoadProfile, LoadRunner, Summariser, TestScenario, write_snapshot
+    from src.utils.open_model import OpenModelGenerator
+
+    client = get_client()
+    fixtures = build_fixtures(client)
+    try:
+        scenarios = [scenario for node_id, weight in mix for scenario in [TestScenario(node_id, fixtures)] * weight]
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(str(e))
+    recorder = get_recorder()
+    prefix = "sweep" if steps else "soak" if soak else "load"
+    path = Path(args.report) if args.report else DEFAULT_REPORT_DIR / f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    config = {**vars(args), "client": {name: os.environ[name] for name in LOAD_CLIENT_DEFAULTS}}
+
+    def open_model(rate, duration):
+        return OpenModelGenerator(
+            scenarios, rate, duration, max_in_flight=args.max_in_flight,
+            interval=args.interval, arrival=args.arrival,
+        )
+
+    if steps:
+        def run_step(step, hold):
+            if args.sweep_mode == "rate":
+                return open_model(step, hold).run()
+            # 단계마다 목표 사용자 수로 바로 시작해 hold초 유지
+            return LoadRunner(scenarios, LoadProfile(int(step), 0, hold, 0), interval=args.interval, think_time=args.think_time).run()
+
+        sweep = ConcurrencySweep(run_step, steps, args.step_hold, args.max_error_rate, args.max_p99).run()
+        report = {"sweep": sweep}
+        failed = sweep["capacity"] is None
+    elif soak:
+        def aggregates(summariser, status):
+            # 요청/반복 단위 원본 없이 집계(통계 + 병합 가능한 히스토그램)만 저장
+            data = {"status": status, **summariser.report(histograms=True), "token_refreshes": client.token_refreshes, "config": config}
+            if recorder is not None:
+                data.update(endpoints=recorder.summary(), endpoint_histograms=recorder.to_dict())
+            return data
+
+        profile = LoadProfile(args.users, args.ramp_up, soak, args.ramp_down)
+        runner = LoadRunner(
+            scenarios, profile, think_time=args.think_time,
+            summariser=Summariser(args.interval, rolling=args.rolling),
+            # 구간마다 같은 파일을 덮어써 중단되어도 마지막 구간까지의 집계가 남음
+            on_flush=lambda summariser: write_snapshot(path, aggregates(summariser, "running")),
+        )
+        runner.run()
+        report = aggregates(runner.summariser, "finished")
+        report["flags"] = analyze_intervals(report["intervals"])
+        failed = bool(report["total"]["errors"])
+    else:
+        if args.rate:
+            runner = open_model(args.rate, args.duration)
+        else:
+            profile = LoadProfile(args.users, args.ramp_up, args.hold, args.ramp_down)
+            runner = LoadRunner(scenarios, profile, interval=args.interval, think_time=args.think_time)
+        report = runner.run()
+        # jmeter.log 분석과 같은 기준으로 오류 급증/응답 시간 수준 변화 표시
+        report["flags"] = analyze_intervals(report["intervals"])
+        failed = bool(report["total"]["errors"])
+    report["config"] = config
+
+    if recorder is not None:
+        report["endpoints"] = recorder.summary()
+        print(f"\n{recorder.format_table()}")
+    if steps:
+        print_sweep(report["sweep"], "users" if args.sweep_mode == "users" else "rate")
+    else:
+        print_report(report)
+
+    write_snapshot(path, report)
+    print(f"\n📄 결과 저장: {path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+# 테스트가 남긴 리소스(team2-*, vm-*, test-bs-*)를 찾아 정리하는 스크립트
+# 사용법: python scripts/sweep_orphans.py [--min-age 60] [--workers 4] [--rate 5] [--delete]
+# 기본은 dry-run(목록만 출력)이며, --delete를 지정해야 실제로 삭제함
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from dotenv import load_dotenv
+from loguru import logger
+from src.utils.api_util import wait_for_status
+from src.utils.http_client import get_client
+from src.utils.inventory import RESOURCE_TYPES, Inventory
+from src.utils.rate_limit import SharedRateLimiter
+from src.utils.teardown import delete_in_dependency_order
+
+load_dotenv()
+
+# 테스트가 생성하는 리소스 이름 접두사
+DEFAULT_PREFIXES = ("team2-", "vm-", "test-bs-")
+# 삭제 요청 속도 제한 계열 (리소스 종류와 관계없이 전체 삭제 요청에 --rate 적용, 동시에 실행한 정리 스크립트끼리도 공유)
+SWEEP_RATE_FAMILY = "sweep"
+
+BASE_URL_COMPUTE = os.getenv("BASE_URL_COMPUTE", "https://portal.gov.elice.cloud/api/user/resource/compute")
+BASE_URL_BLOCK_STORAGE = os.getenv("BASE_URL_BLOCK_STORAGE", "https://portal.gov.elice.cloud/api/user/resource/storage/block_storage")
+BASE_URL_NETWORK = os.getenv("BASE_URL_NETWORK", "https://portal.gov.elice.cloud/api/user/resource/network")
+BASE_URL_OBJECT_STORAGE = os.getenv("BASE_URL_OBJECT_STORAGE", "https://portal.gov.elice.cloud/api/user/resource/storage/object_storage")
+
+BASE_URLS = {
+    "compute": BASE_URL_COMPUTE,
+    "block_storage": BASE_URL_BLOCK_STORAGE,
+    "network": BASE_URL_NETWORK,
+    "object_storage": BASE_URL_OBJECT_STORAGE,
+}
+
+
+def _headers():
+    token = os.getenv("ACCESS_TOKEN")
+    if not token:
+        from src.utils.token_cache import get_cached_token
+        from tests.conftest import generate_fresh_token
+        token = get_cached_token(generate_fresh_token)
+    return {
+        "Authorization": f"Bearer {token}",
+        "Host": "portal.gov.elice.cloud",
+        "Content-Type": "application/json",
+    }
+
+
+def _created_at(item):
+    value = item.get("created_at")
+    if not value:
+        return None
+    try:
+        created = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return created if created.tzinfo else created.replace(tzinfo=timezone.utc)
+
+
+def find_orphans(client, headers, prefixes, min_age):
+    """
+    모든 리소스 종류를 조회해 접두사/생성 후 경과 시간 조건에 맞는 리소스를 반환
+    생성 시각을 알 수 없는 리소스는 --min-age 0일 때만 포함 (실행 중인 테스트의 리소스 보호)
+    :return: (정리 대상 목록, 목록 조회에 실패한 리소스 종류 목록)
+    """
+    # 모든 리소스 종류를 동시에 조회 (삭제 순서는 응답 필드의 참조 id로 계산)
+    inventory = Inventory(headers, client=client).register_defaults(BASE_URLS).load()
+
+    now = datetime.now(timezone.utc)
+    orphans = []
+    for kind in RESOURCE_TYPES:
+        if kind in inventory.failed_kinds:
+            logger.error(f"⛔ {kind}: 목록 조회 실패 - 정리 대상 확인 불가")
+            continue
+        items = inventory.all(kind)
+        matched = 0
+        for item in items:
+            name = item.get("name") or ""
+            resource_id = inventory.item_id(kind, item)
+            if not resource_id or not name.startswith(prefixes):
+                continue
+            created = _created_at(item)
+            if min_age > 0 and (created is None or (now - created).total_seconds() < min_age * 60):
+                continue
+            if str(item.get("status", "")).lower() in ("deleted", "deleting"):
+                continue
+            matched += 1
+            orphans.append({"kind": kind, "url": inventory.item_url(kind), "id": resource_id, "name": name, "payload": item})
+        logger.info(f"🔍 {kind}: 전체 {len(items)}건 중 정리 대상 {matched}건")
+    return orphans, inventory.failed_kinds
+
+
+def sweep(client, headers, orphans, workers, rate):
+    limiter = SharedRateLimiter(default_rate=rate)
+    failures = []
+
+    def _delete(resource):
+        url = f"{resource['url']}/{resource['id']}"
+        with limiter.slot(url, family=SWEEP_RATE_FAMILY):
+            response = client.delete(url, headers=headers)
+        if response.status_code in (200, 404):
+            logger.info(f"🗑️ 삭제 요청 완료: {resource['kind']} {resource['name']} ({resource['id']})")
+            return True
+        logger.error(f"⛔ 삭제 실패: {resource['kind']} {resource['name']} ({resource['id']}) - {response.status_code}: {response.text}")
+        failures.append(resource)
+        return False
+
+    def _wait_deleted(resource):
+        if not wait_for_status(f"{resource['url']}/{resource['id']}", headers, expected_status="deleted", client=client):
+            failures.append(resource)
+
+    delete_in_dependency_order(orphans, _delete, _wait_deleted, max_workers=workers)
+    limiter.log_stats()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="테스트가 남긴 리소스 정리 (기본 dry-run)")
+    parser.add_argument("--prefix", action="append", help=f"정리 대상 이름 접두사 (반복 지정 가능, 기본값 {', '.join(DEFAULT_PREFIXES)})")
+    parser.add_argument("--min-age", type=int, default=60, help="생성 후 최소 경과 시간(분), 0이면 나이와 무관하게 정리 (기본값 60)")
+    parser.add_argument("--workers", type=int, default=4, help="동시 삭제 요청 수 (기본값 4)")
+    parser.add_argument("--rate", type=float, default=5.0, help="초당 최대 삭제 요청 수, 0이면 제한 없음 (기본값 5)")
+    parser.add_argument("--delete", action="store_true", help="실제로 삭제 (지정하지 않으면 대상 목록만 출력)")
+    args = parser.parse_args()
+
+    prefixes = tuple(args.prefix or DEFAULT_PREFIXES)
+    client = get_client()
+    headers = _headers()
+
+    orphans, failed_kinds = find_orphans(client, headers, prefixes, args.min_age)
+    for resource in orphans:
+        created = resource["payload"].get("created_at", "-")
+        print(f"  {resource['kind']:<20} {resource['name']:<40} {resource['id']}  (created_at: {created})")
+    print(f"🧹 정리 대상 {len(orphans)}건")
+    if failed_kinds:
+        # 조회하지 못한 종류를 빈 목록으로 보고 "정리 완료"로 끝내지 않도록 실패로 종료
+        print(f"⛔ 목록 조회 실패로 확인하지 못한 리소스 종류: {', '.join(failed_kinds)}")
+    exit_code = 1 if failed_kinds else 0
+
+    if not args.delete:
+        print("ℹ️ dry-run 모드입니다. 실제로 삭제하려면 --delete 옵션을 지정하세요.")
+        return exit_code
+    if not orphans:
+        return exit_code
+
+    failures = sweep(client, headers, orphans, args.workers, args.rate)
+    print(f"✅ 정리 완료: 성공 {len(orphans) - len(failures)}건 / 실패 {len(failures)}건")
+    return 1 if failures else exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,4 +8,8 @@ def attach_screenshot(driver, name="screenshot"):
         driver.get_screenshot_as_png(),
         name=f"{name}{timestamp}",
         attachment_type=allure.attachment_type.PNG
-    )
\ No newline at end of file
+    )
+
+def attach_text(text, name="log"):
+    """Allure 리포트에 텍스트 첨부"""
+    allure.attach(text, name=name, attachment_type=allure.attachment_type.TEXT)
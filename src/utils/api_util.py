@@ -1,58 +1,230 @@
+import contextvars
+import heapq
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Optional
 from loguru import logger
+from src.utils import deadline
+from src.utils.circuit_breaker import CircuitOpenError
+from src.utils.deadline import DeadlineExceeded
+from src.utils.http_client import get_client
 
-def wait_for_status(url, headers, expected_status, timeout=60, initial_wait=1, max_wait=5, status_key="status"):
+# 한 번의 배치 대기에서 동시에 조회하는 최대 리소스 수
+MAX_POLL_WORKERS = 8
+
+
+@dataclass
+class WaitResult:
+    """
+    상태 대기(Polling) 결과
+    - 기존 `assert success` 호출부와 호환되도록 bool 평가 시 success를 반환
+    - 시간 값은 모두 대기 시작 시점 기준 경과 초
+    """
+    url: str
+    expected_status: object
+    success: bool = False
+    attempts: int = 0
+    elapsed: float = 0.0
+    total_sleep: float = 0.0
+    time_to_first_state: Optional[float] = None
+    time_to_target: Optional[float] = None
+    # 관측된 상태 전이 타임라인: [(경과 초, 상태), ...]
+    transitions: list = field(default_factory=list)
+
+    def __bool__(self):
+        return self.success
+
+    def record_state(self, elapsed, state):
+        if self.time_to_first_state is None:
+            self.time_to_first_state = elapsed
+        if not self.transitions or self.transitions[-1][1] != state:
+            self.transitions.append((round(elapsed, 3), state))
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def _check_response(response, expected_status, status_key):
+    """
+    단일 조회 응답을 목표 상태와 비교
+    :return: (settled, success, current_status) - settled가 False이면 계속 폴링
+    """
+    # 1. 삭제 확인 케이스 (404/422 응답)
+    if response.status_code in [404, 422]:
+        return True, expected_status == "deleted", "deleted"
+
+    # 2. 정상 응답(200) 시 상태 비교
+    if response.ok:
+        res_body = response.json()
+        # dict.get()을 사용하여 키가 없을 경우 None 반환
+        current_status = res_body.get(status_key)
+        settled = str(current_status).lower() == str(expected_status).lower()
+        return settled, settled, current_status
+
+    return False, False, None
+
+
+def _log_settled(url, expected_status, success, response, result):
+    if success:
+        if expected_status == "deleted":
+            logger.success(f"✅ 리소스 삭제 확인 완료 ({result.time_to_target:.1f}초, {result.attempts}회 조회)")
+        else:
+            logger.success(f"✅ 목표 상태 도달: {expected_status} ({result.time_to_target:.1f}초, {result.attempts}회 조회)")
+    else:
+        logger.warning(f"⚠️ 조회 중 리소스 사라짐 (Status: {response.status_code}): {url}")
+
+
+def wait_for_status(url, headers, expected_status, timeout=60, initial_wait=1, max_wait=5, status_key="status", client=None):
     """
     리소스의 상태가 목표 상태가 될 때까지 지수 백오프를 사용하여 반복 조회(Polling)
-    
+
     :param expected_status: 목표 상태 (예: "active", "available", "deleted")
     :param status_key: JSON 응답에서 상태를 확인할 키 이름 (기본값 "status")
+    :param client: 사용할 ApiClient (기본값: 공유 커넥션 풀 클라이언트)
+    :return: WaitResult (bool 평가 시 목표 상태 도달 여부)
+    :raises CircuitOpenError: 플랫폼 장애로 서킷이 열린 경우 (재시도하지 않음)
+    :raises DeadlineExceeded: 테스트 deadline을 넘긴 경우
     """
-    end_time = time.time() + timeout
+    client = client or get_client()
+    start_time = time.time()
+    end_time = start_time + timeout
     wait_time = initial_wait
     attempt = 0
+    result = WaitResult(url=url, expected_status=expected_status)
 
     logger.info(f"⏳ 상태 대기 시작 [{expected_status}]: {url}")
 
     while time.time() < end_time:
         attempt += 1
+        result.attempts = attempt
         try:
-            response = requests.get(url, headers=headers)
-            
-            # 1. 삭제 확인 케이스 (404/422 응답)
-            if response.status_code in [404, 422]:
-                if expected_status == "deleted":
-                    logger.success(f"✅ 리소스 삭제 확인 완료")
-                    return True
-                else:
-                    logger.warning(f"⚠️ 조회 중 리소스 사라짐 (Status: {response.status_code})")
-                    return False
-
-            # 2. 정상 응답(200) 시 상태 비교
-            if response.ok:
-                res_body = response.json()
-                # dict.get()을 사용하여 키가 없을 경우 None 반환
-                current_status = res_body.get(status_key)
-                
-                # 목표 상태 도달 확인
-                if str(current_status).lower() == str(expected_status).lower():
-                    logger.success(f"✅ 목표 상태 도달: {current_status}")
-                    return True
-                
-                # 진행 상황 로그 (매 5회 시도마다)
-                if attempt % 5 == 0:
-                    logger.info(f"🔄 대기 중... (현재: {current_status} / 목표: {expected_status})")
-            else:
+            response = client.get(url, headers=headers)
+            settled, success, current_status = _check_response(response, expected_status, status_key)
+            if settled or response.ok:
+                result.record_state(time.time() - start_time, current_status)
+
+            if settled:
+                result.elapsed = time.time() - start_time
+                result.success = success
+                if success:
+                    result.time_to_target = result.elapsed
+                _log_settled(url, expected_status, success, response, result)
+                return result
+
+            if not response.ok:
                 logger.debug(f"ℹ️ 서버 응답 대기 중... (HTTP {response.status_code})")
+            # 진행 상황 로그 (매 5회 시도마다)
+            elif attempt % 5 == 0:
+                logger.info(f"🔄 대기 중... (현재: {current_status} / 목표: {expected_status})")
 
+        except (CircuitOpenError, DeadlineExceeded):
+            # 플랫폼 장애로 서킷이 열렸거나 테스트 deadline을 넘긴 경우 재시도하지 않고 즉시 실패
+            raise
         except Exception as e:
             if attempt % 5 == 0:
                 logger.debug(f"⚠️ 연결 재시도 중... ({str(e)[:30]})")
-            
-        # --- 지수 백오프 적용 ---
-        time.sleep(wait_time)
+
+        # --- 지수 백오프 적용 (테스트 deadline을 넘기지 않음) ---
+        deadline.sleep(wait_time)
+        result.total_sleep += wait_time
         wait_time = min(wait_time * 1.5, max_wait)
-        
+
+    result.elapsed = time.time() - start_time
     logger.error(f"⛔ {timeout}초 내에 목표 상태({expected_status})에 도달하지 못했습니다.")
-    return False
\ No newline at end of file
+    return result
+
+
+def _normalize_target(target):
+    """(url, expected_status) 또는 (url, expected_status, status_key) 형태를 3-튜플로 통일"""
+    if len(target) == 2:
+        return target[0], target[1], "status"
+    return tuple(target)
+
+
+def iter_wait_for_statuses(targets, headers, timeout=60, initial_wait=1, max_wait=5, client=None, max_workers=MAX_POLL_WORKERS):
+    """
+    여러 리소스의 상태를 하나의 스케줄러에서 동시에 폴링하고, 확정되는 순서대로 결과를 반환
+
+    - 다음 조회 시각 기준 우선순위 큐(heap)로 조회 대상을 선택
+    - 각 대상은 wait_for_status와 동일한 지수 백오프 정책을 따름
+    - 전체 대기 시간은 개별 대기 시간의 합이 아닌 최댓값에 수렴
+
+    :param targets: [(url, expected_status[, status_key]), ...]
+    :return: (index, target, WaitResult) 제너레이터
+    """
+    client = client or get_client()
+    targets = [_normalize_target(t) for t in targets]
+    if not targets:
+        return
+
+    start_time = time.time()
+    end_time = start_time + timeout
+    wait_times = [initial_wait] * len(targets)
+    results = [WaitResult(url=url, expected_status=expected) for url, expected, _ in targets]
+    # (다음 조회 시각, 대상 인덱스)
+    schedule = [(time.time(), idx) for idx in range(len(targets))]
+    heapq.heapify(schedule)
+
+    logger.info(f"⏳ 배치 상태 대기 시작 ({len(targets)}건)")
+
+    with ThreadPoolExecutor(max_workers=min(len(targets), max_workers)) as executor:
+        while schedule:
+            delay = schedule[0][0] - time.time()
+            if delay > 0:
+                deadline.sleep(delay)
+
+            due = []
+            while schedule and schedule[0][0] <= time.time():
+                due.append(heapq.heappop(schedule)[1])
+
+            # 워커 스레드도 호출한 테스트의 deadline을 따르도록 컨텍스트를 복사해 실행
+            futures = {
+                executor.submit(contextvars.copy_context().run, client.get, targets[idx][0], headers=headers): idx
+                for idx in due
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                url, expected_status, status_key = targets[idx]
+                result = results[idx]
+                result.attempts += 1
+                try:
+                    response = future.result()
+                    settled, success, current_status = _check_response(response, expected_status, status_key)
+                    if settled or response.ok:
+                        result.record_state(time.time() - start_time, current_status)
+                    if settled:
+                        result.elapsed = time.time() - start_time
+                        result.success = success
+                        if success:
+                            result.time_to_target = result.elapsed
+                        _log_settled(url, expected_status, success, response, result)
+                        yield idx, targets[idx], result
+                        continue
+                except (CircuitOpenError, DeadlineExceeded):
+                    raise
+                except Exception as e:
+                    if result.attempts % 5 == 0:
+                        logger.debug(f"⚠️ 연결 재시도 중... ({str(e)[:30]})")
+
+                # --- 지수 백오프 적용 ---
+                next_poll = time.time() + wait_times[idx]
+                if next_poll < end_time:
+                    result.total_sleep += wait_times[idx]
+                    heapq.heappush(schedule, (next_poll, idx))
+                else:
+                    result.elapsed = time.time() - start_time
+                    logger.error(f"⛔ {timeout}초 내에 목표 상태({expected_status})에 도달하지 못했습니다: {url}")
+                    yield idx, targets[idx], result
+                wait_times[idx] = min(wait_times[idx] * 1.5, max_wait)
+
+
+def wait_for_statuses(targets, headers, timeout=60, initial_wait=1, max_wait=5, client=None, max_workers=MAX_POLL_WORKERS):
+    """
+    iter_wait_for_statuses의 결과를 모두 모아 targets 순서대로 반환
+    :return: [WaitResult, ...]
+    """
+    results = [None] * len(targets)
+    for idx, _, result in iter_wait_for_statuses(targets, headers, timeout, initial_wait, max_wait, client, max_workers):
+        results[idx] = result
+    return results
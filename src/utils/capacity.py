@@ -0,0 +1,104 @@
+from loguru import logger
+
+# 이 오류율(%)을 넘는 단계에서 스윕 중단
+DEFAULT_MAX_ERROR_RATE = 5.0
+# 한 단계를 유지하는 시간(초)
+DEFAULT_STEP_HOLD = 60
+
+
+def parse_steps(value):
+    """"1,2,4,8" 형식을 오름차순 단계 목록으로 변환"""
+    steps = sorted({float(part) for part in value.split(",") if part.strip()})
+    if not steps or steps[0] <= 0:
+        raise ValueError(f"단계 값은 0보다 큰 수여야 합니다: {value}")
+    return [int(step) if step.is_integer() else step for step in steps]
+
+
+def find_knee(points):
+    """
+    처리량 곡선의 무릎(knee) 지점 (Kneedle 방식)
+
+    - 단계 값(x)과 처리량(y)을 0~1로 정규화하고, 첫 점과 마지막 점을 잇는 직선에서 곡선이 가장 멀리 위에 있는 점
+      = 부하를 더 늘려도 처리량 증가가 꺾이기 시작하는 지점
+    - 점이 3개 미만이거나 처리량이 계속 선형으로 늘면(꺾임 없음) None
+    :param points: [{"step": x, "throughput": y, ...}] (step 오름차순)
+    """
+    if len(points) < 3:
+        return None
+    xs = [point["step"] for point in points]
+    ys = [point["throughput"] for point in points]
+    x_span = xs[-1] - xs[0]
+    y_span = max(ys) - min(ys)
+    if x_span <= 0 or y_span <= 0:
+        return None
+    best, best_distance = None, 0.0
+    for point, x, y in zip(points, xs, ys):
+        distance = (y - min(ys)) / y_span - (x - xs[0]) / x_span
+        if distance > best_distance:
+            best, best_distance = point, distance
+    # 직선과 거의 겹치면 뚜렷한 꺾임이 없는 것으로 판단
+    return best if best_distance >= 0.05 else None
+
+
+class ConcurrencySweep:
+    """
+    부하를 단계적으로 늘리며 각 단계를 hold초 유지하고, 오류율 또는 p99가 임계값을 넘으면 중단
+
+    - run_step(step, hold)는 한 단계를 실행하고 Summariser.report() 형식의 결과를 반환
+      (closed-model은 가상 사용자 수, open-model은 초당 도착률이 단계 값)
+    - 단계별 처리량/응답 시간 곡선, 마지막 정상 단계(수용 가능 용량), 처리량 무릎 지점을 반환
+    """
+
+    def __init__(self, run_step, steps, hold=DEFAULT_STEP_HOLD, max_error_rate=DEFAULT_MAX_ERROR_RATE, max_p99_ms=None):
+        self.run_step = run_step
+        self.steps = list(steps)
+        self.hold = hold
+        self.max_error_rate = max_error_rate
+        self.max_p99_ms = max_p99_ms
+
+    def _breach(self, total):
+        if not total["count"]:
+            return "완료된 반복 없음"
+        if total["error_rate"] > self.max_error_rate:
+            return f"오류율 {total['error_rate']:.2f}% > {self.max_error_rate:g}%"
+        if self.max_p99_ms and total["p99_ms"] > self.max_p99_ms:
+            return f"p99 {total['p99_ms']:.0f}ms > {self.max_p99_ms:g}ms"
+        return None
+
+    def run(self):
+        points = []
+        stopped = None
+        for step in self.steps:
+            logger.info(f"📈 스윕 단계 {step} ({self.hold:g}초 유지)")
+            report = self.run_step(step, self.hold)
+            total = report["total"]
+            breach = self._breach(total)
+            point = {
+                "step": step,
+                "throughput": total["throughput"],
+                "count": total["count"],
+                "error_rate": total["error_rate"],
+                **{key: total.get(key) for key in ("mean_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms")},
+                "breach": breach,
+            }
+            points.append(point)
+            logger.info(
+                f"📈 단계 {step}: {point['throughput']:.2f}/s / p50 {point['p50_ms'] or 0:.0f}ms / "
+                f"p99 {point['p99_ms'] or 0:.0f}ms / 오류 {point['error_rate']:.2f}%"
+            )
+            if breach:
+                stopped = {"step": step, "reason": breach}
+                logger.warning(f"⛔ 단계 {step}에서 임계값 초과 - 스윕 중단 ({breach})")
+                break
+
+        healthy = [point for point in points if not point["breach"]]
+        knee = find_knee(healthy)
+        capacity = knee or (healthy[-1] if healthy else None)
+        return {
+            "points": points,
+            "stopped": stopped,
+            "last_healthy_step": healthy[-1]["step"] if healthy else None,
+            "knee": knee["step"] if knee else None,
+            "capacity": {"step": capacity["step"], "throughput": capacity["throughput"]} if capacity else None,
+            "thresholds": {"max_error_rate": self.max_error_rate, "max_p99_ms": self.max_p99_ms},
+        }
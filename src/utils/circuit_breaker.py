@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+from loguru import logger
+from src.utils.rate_limit import endpoint_family
+
+# 최근 몇 건의 요청 결과로 실패율을 계산할지
+DEFAULT_WINDOW = 20
+# 실패율을 판단하기 위한 최소 요청 수
+DEFAULT_MIN_REQUESTS = 5
+# 이 비율 이상 실패하면 서킷 오픈
+DEFAULT_FAILURE_RATE = 0.5
+# 오픈 후 복구 확인(half-open) 요청을 보내기까지 대기 시간(초)
+DEFAULT_RESET_TIMEOUT = 30
+# 플랫폼 장애로 간주하는 응답 코드 (게이트웨이/가용성 오류만 - 개별 API 버그의 500은 제외)
+FAILURE_STATUS_CODES = (502, 503, 504)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """서킷이 열려 있어 요청을 보내지 않고 즉시 실패"""
+
+
+class _Circuit:
+    def __init__(self, window):
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.reason = ""
+        self.probing = False
+
+
+def circuit_key(url):
+    """서킷 구분 키: 호스트 + 엔드포인트 계열 (base URL 단위)"""
+    parts = urlsplit(url)
+    return f"{parts.netloc}/{endpoint_family(url)}"
+
+
+class CircuitBreaker:
+    """
+    base URL(호스트 + 엔드포인트 계열)별 서킷 브레이커
+
+    - 연결 오류/타임아웃/502·503·504 비율이 임계치를 넘으면 서킷을 열고, 이후 요청은 CircuitOpenError로 즉시 실패
+    - reset_timeout이 지나면 요청 하나만 통과시켜(half-open) 복구 여부를 확인
+      성공하면 닫고, 실패하면 다시 reset_timeout 동안 연다
+    - 플랫폼 상태를 알 수 없는 결과(deadline 초과 등)는 release()로 기록 없이 넘김
+    """
+
+    def __init__(self, window=DEFAULT_WINDOW, min_requests=DEFAULT_MIN_REQUESTS,
+                 failure_rate=DEFAULT_FAILURE_RATE, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        self.window = window
+        self.min_requests = min_requests
+        self.failure_rate = failure_rate
+        self.reset_timeout = reset_timeout
+        self._circuits = {}
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls):
+        """CIRCUIT_BREAKER=0이면 None (비활성화), 그 외에는 CIRCUIT_* 환경 변수로 설정"""
+        if os.getenv("CIRCUIT_BREAKER", "1").lower() in ("0", "false", "no"):
+            return None
+        return cls(
+            window=int(os.getenv("CIRCUIT_WINDOW", DEFAULT_WINDOW)),
+            min_requests=int(os.getenv("CIRCUIT_MIN_REQUESTS", DEFAULT_MIN_REQUESTS)),
+            failure_rate=float(os.getenv("CIRCUIT_FAILURE_RATE", DEFAULT_FAILURE_RATE)),
+            reset_timeout=float(os.getenv("CIRCUIT_RESET_TIMEOUT", DEFAULT_RESET_TIMEOUT)),
+        )
+
+    def _circuit(self, key):
+        if key not in self._circuits:
+            self._circuits[key] = _Circuit(self.window)
+        return self._circuits[key]
+
+    def before_request(self, url):
+        """요청 전 호출 - 서킷이 열려 있으면 CircuitOpenError 발생 :return: 서킷 키"""
+        key = circuit_key(url)
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == CLOSED:
+                return key
+            if circuit.state == OPEN and time.time() - circuit.opened_at >= self.reset_timeout:
+                circuit.state = HALF_OPEN
+                circuit.probing = False
+            if circuit.state == HALF_OPEN and not circuit.probing:
+                circuit.probing = True
+                logger.warning(f"⚠️ 서킷 half-open [{key}] - 복구 확인 요청 전송")
+                return key
+            self.rejected += 1
+            raise CircuitOpenError(f"서킷 오픈 [{key}]: {circuit.reason}")
+
+    def record(self, key, failed, reason=""):
+        """요청 결과 기록 (failed: 연결 오류/타임아웃/502·503·504 여부)"""
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == HALF_OPEN:
+                circuit.probing = False
+                if failed:
+                    self._open(key, circuit, f"복구 확인 실패 ({reason})")
+                else:
+                    circuit.state = CLOSED
+                    circuit.outcomes.clear()
+                    logger.success(f"✅ 서킷 복구 [{key}] - 요청 재개")
+                return
+            if circuit.state != CLOSED:
+                return
+            circuit.outcomes.append(failed)
+            total = len(circuit.outcomes)
+            failures = sum(circuit.outcomes)
+            if total >= self.min_requests and failures / total >= self.failure_rate:
+                self._open(key, circuit, f"최근 {total}건 중 {failures}건 실패 (마지막: {reason})")
+
+    def release(self, key):
+        """
+        플랫폼 상태와 무관하게 끝난 요청(deadline 초과, 요청 전 예외 등) - 결과를 기록하지 않음
+        half-open 복구 확인 요청이었다면 다음 요청이 다시 복구 확인을 하도록 넘김
+        """
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == HALF_OPEN:
+                circuit.probing = False
+
+    def _open(self, key, circuit, reason):
+        circuit.state = OPEN
+        circuit.opened_at = time.time()
+        circuit.reason = reason
+        logger.error(f"⛔ 서킷 오픈 [{key}] {reason} - {self.reset_timeout:.0f}초간 요청 즉시 실패")
+
+    def open_circuits(self, families=None):
+        """
+        현재 열려 있는(아직 복구 확인 시점이 되지 않은) 서킷 목록
+        :param families: 확인할 엔드포인트 계열 (None이면 전체)
+        :return: [(키, 사유), ...]
+        """
+        now = time.time()
+        with self._lock:
+            return [
+                (key, circuit.reason) for key, circuit in self._circuits.items()
+                if circuit.state == OPEN and now - circuit.opened_at < self.reset_timeout
+                and (families is None or key.rsplit("/", 1)[-1] in families)
+            ]
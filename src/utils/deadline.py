@@ -0,0 +1,114 @@
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# 모든 HTTP 요청에 적용하는 기본 타임아웃(초) - deadline이 없어도 무한 대기하지 않음
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+# 현재 테스트의 마감 시각(epoch 초)과 설명
+# 스레드 풀로 넘기는 작업은 contextvars.copy_context().run으로 감싸야 같은 deadline을 따름
+_deadline = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """테스트 deadline을 넘겨 더 이상 요청/대기를 하지 않음"""
+
+
+def default_timeout():
+    return (
+        float(os.getenv("HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+        float(os.getenv("HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)),
+    )
+
+
+def set_deadline(seconds, label="deadline"):
+    """
+    지금부터 seconds초 뒤를 마감으로 설정 (이미 더 이른 마감이 있으면 유지)
+    :return: clear_deadline()에 넘길 토큰
+    """
+    expires_at = time.time() + seconds
+    current = _deadline.get()
+    if current is not None and current[0] <= expires_at:
+        return _deadline.set(current)
+    return _deadline.set((expires_at, f"{label}({seconds:g}초)"))
+
+
+def clear_deadline(token):
+    _deadline.reset(token)
+
+
+@contextmanager
+def deadline(seconds, label="deadline"):
+    token = set_deadline(seconds, label)
+    try:
+        yield
+    finally:
+        clear_deadline(token)
+
+
+@contextmanager
+def suspended():
+    """
+    deadline을 잠시 해제 (예: 테스트 안에서 처음 만들어지는 session fixture)
+    끝나면 해제되어 있던 시간만큼 마감을 늦춰 다시 적용
+    """
+    current = _deadline.get()
+    if current is None:
+        yield
+        return
+    started = time.time()
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+        _deadline.set((current[0] + time.time() - started, current[1]))
+
+
+def remaining():
+    """남은 시간(초), deadline이 없으면 None"""
+    current = _deadline.get()
+    return None if current is None else current[0] - time.time()
+
+
+def exceeded(action):
+    """현재 deadline 설명을 담은 DeadlineExceeded 생성"""
+    return DeadlineExceeded(f"⛔ {_deadline.get()[1]} 초과{': ' + action if action else ''}")
+
+
+def check(action=""):
+    """마감이 지났으면 DeadlineExceeded 발생"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise exceeded(action)
+
+
+def request_timeout(timeout=None, action=""):
+    """
+    요청에 사용할 (connect, read) 타임아웃
+    - 지정하지 않으면 기본 타임아웃 사용
+    - deadline이 있으면 남은 시간을 넘지 않도록 축소
+    """
+    if timeout is None:
+        connect, read = default_timeout()
+    elif isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+
+    left = remaining()
+    if left is None:
+        return connect, read
+    check(action)
+    return min(connect, left), min(read, left)
+
+
+def sleep(seconds):
+    """deadline을 넘기지 않는 sleep (남은 시간보다 길면 마감까지만 자고 DeadlineExceeded 발생)"""
+    left = remaining()
+    if left is not None and left <= seconds:
+        time.sleep(max(left, 0))
+        raise exceeded(f"{seconds:.1f}초 대기 중")
+    time.sleep(seconds)
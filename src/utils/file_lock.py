@@ -0,0 +1,58 @@
+import os
+import time
+
+
+class FileLock:
+    """
+    여러 프로세스(xdist 워커, 연속 실행)가 공유하는 간단한 파일 락
+    - O_CREAT | O_EXCL 로 락 파일을 원자적으로 생성하는 방식이라 OS 의존성이 없음
+    - 비정상 종료로 남은 락 파일은 stale_after 초가 지나면 회수
+    """
+
+    def __init__(self, path, timeout=180, stale_after=300, poll_interval=0.1):
+        self.path = str(path)
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+
+    def _is_stale(self):
+        try:
+            return time.time() - os.path.getmtime(self.path) > self.stale_after
+        except FileNotFoundError:
+            return False
+
+    def try_acquire(self):
+        """대기하지 않고 한 번만 시도 (비정상 종료로 남은 락은 회수 후 재시도) :return: 획득 여부"""
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                with os.fdopen(fd, "w") as f:
+                    f.write(str(os.getpid()))
+                return True
+            except FileExistsError:
+                if not self._is_stale():
+                    return False
+                try:
+                    os.remove(self.path)
+                except FileNotFoundError:
+                    pass
+
+    def acquire(self):
+        deadline = time.time() + self.timeout
+        while not self.try_acquire():
+            if time.time() > deadline:
+                raise TimeoutError(f"파일 락 획득 시간 초과: {self.path}")
+            time.sleep(self.poll_interval)
+
+    def release(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -0,0 +1,127 @@
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from loguru import logger
+
+# 중복 요청을 보내는 기준 분위수 (엔드포인트별 최근 응답 시간의 p95)
+DEFAULT_QUANTILE = 0.95
+# 전체 요청 대비 중복 요청 비율 상한 (플랫폼 부하가 그 이상 늘지 않도록)
+DEFAULT_MAX_RATE = 0.1
+# 분위수를 신뢰하기 위한 최소 표본 수 (그 전에는 중복 요청을 보내지 않음)
+DEFAULT_MIN_SAMPLES = 20
+# 엔드포인트별로 유지하는 최근 응답 시간 개수
+DEFAULT_WINDOW = 200
+# 너무 짧은 지연으로 중복 요청이 남발되지 않도록 하는 하한(초)
+DEFAULT_MIN_DELAY = 0.05
+# 요청/중복 요청을 실행하는 스레드 수
+DEFAULT_WORKERS = 16
+
+
+class Hedger:
+    """
+    멱등 GET의 꼬리 지연 완화를 위한 중복(hedged) 요청
+
+    - 엔드포인트(메서드 + ID를 {id}로 바꾼 경로)별 최근 응답 시간에서 p95를 계산
+    - 요청이 p95 안에 끝나지 않으면 같은 요청을 한 번 더 보내고 먼저 성공한 응답을 사용
+      (늦은 쪽은 버리며, 끝나면 커넥션은 풀로 반환됨)
+    - 중복 요청은 전체 요청의 max_rate 비율을 넘지 않음
+    """
+
+    def __init__(self, quantile=DEFAULT_QUANTILE, max_rate=DEFAULT_MAX_RATE, min_samples=DEFAULT_MIN_SAMPLES,
+                 window=DEFAULT_WINDOW, min_delay=DEFAULT_MIN_DELAY, max_workers=DEFAULT_WORKERS):
+        self.quantile = quantile
+        self.max_rate = max_rate
+        self.min_samples = max(1, min_samples)
+        self.window = window
+        self.min_delay = min_delay
+        self._samples = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @classmethod
+    def from_env(cls):
+        """HTTP_HEDGE=1일 때만 생성 (기본: 비활성화), HEDGE_* 환경 변수로 세부 설정"""
+        if os.getenv("HTTP_HEDGE", "0").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            quantile=float(os.getenv("HEDGE_QUANTILE", DEFAULT_QUANTILE)),
+            max_rate=float(os.getenv("HEDGE_MAX_RATE", DEFAULT_MAX_RATE)),
+            min_samples=int(os.getenv("HEDGE_MIN_SAMPLES", DEFAULT_MIN_SAMPLES)),
+            window=int(os.getenv("HEDGE_WINDOW", DEFAULT_WINDOW)),
+            min_delay=float(os.getenv("HEDGE_MIN_DELAY", DEFAULT_MIN_DELAY)),
+        )
+
+    def record(self, key, elapsed):
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(elapsed)
+
+    def hedge_delay(self, key):
+        """중복 요청을 보내기까지 기다릴 시간(초), 표본이 부족하면 None"""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return max(self.min_delay, ordered[int(self.quantile * (len(ordered) - 1))])
+
+    def _allow_hedge(self):
+        with self._lock:
+            if self.hedges + 1 > self.max_rate * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def _timed(self, key, send):
+        started = time.perf_counter()
+        response = send()
+        self.record(key, time.perf_counter() - started)
+        return response
+
+    def _submit(self, key, send):
+        # 실행 스레드도 호출한 테스트의 deadline을 따름
+        return self._executor.submit(contextvars.copy_context().run, self._timed, key, send)
+
+    def run(self, key, send):
+        """
+        send()를 실행하고, p95 안에 끝나지 않으면 한 번 더 실행해 먼저 성공한 결과를 반환
+        :param key: 엔드포인트 키 (예: "GET /api/user/resource/compute/{id}")
+        :param send: 요청 하나를 보내고 응답을 반환하는 함수
+        """
+        with self._lock:
+            self.requests += 1
+        delay = self.hedge_delay(key)
+        if delay is None:
+            return self._timed(key, send)
+
+        primary = self._submit(key, send)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._allow_hedge():
+            return primary.result()
+
+        logger.debug(f"🏇 {delay:.2f}초(p{self.quantile * 100:.0f}) 초과 - 중복 요청 전송: {key}")
+        hedge = self._submit(key, send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        # 둘 다 실패하면 원래 요청의 오류를 그대로 전달
+        return primary.result()
+
+    def log_stats(self):
+        if self.hedges:
+            logger.info(f"🏇 GET {self.requests}회 중 중복 요청 {self.hedges}회 / 중복 요청이 먼저 응답 {self.hedge_wins}회")
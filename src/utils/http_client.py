@@ -0,0 +1,372 @@
+import copy
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+from src.utils import deadline
+from src.utils.circuit_breaker import FAILURE_STATUS_CODES, CircuitBreaker, CircuitOpenError
+from src.utils.hedging import Hedger
+from src.utils.latency import get_recorder
+from src.utils.rate_limit import SharedRateLimiter, template_path
+from src.utils.retry import RetryPolicy
+from src.utils.token_cache import refresh_token
+
+# xdist 워커(프로세스) 하나가 호스트별로 유지하는 keep-alive 커넥션 수
+DEFAULT_POOL_SIZE = 10
+# 읽기 전용(참조 데이터) 엔드포인트 경로 접두사 - 마이크로 TTL 캐시 대상
+DEFAULT_MICRO_TTL_PATHS = ("/api/user/region", "/api/user/infra/")
+# GET 병합 대상이 될 수 있는 요청 인자 (body/stream 등이 있으면 병합하지 않음)
+_COALESCABLE_KWARGS = {"headers", "params", "timeout"}
+
+
+def _pool_size_from_env():
+    """
+    HTTP_POOL_SIZE 환경 변수로 워커당 풀 크기를 지정 (기본값 DEFAULT_POOL_SIZE)
+    xdist 환경에서는 워커마다 별도 프로세스이므로 값은 워커 단위로 적용됨
+    """
+    value = os.getenv("HTTP_POOL_SIZE")
+    if not value:
+        return DEFAULT_POOL_SIZE
+    return max(1, int(value))
+
+
+class _Flight:
+    """진행 중인 GET 요청 하나 (같은 요청을 보낸 다른 스레드는 이 결과를 기다림)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+def _request_key(url, kwargs):
+    params = kwargs.get("params")
+    if isinstance(params, dict):
+        params = tuple(sorted(params.items()))
+    headers = tuple(sorted((kwargs.get("headers") or {}).items()))
+    return url, repr(params), headers
+
+
+class ApiClient:
+    """
+    requests.Session 기반 공용 HTTP 클라이언트
+    - 호스트별 커넥션 풀 + keep-alive로 매 요청마다 TCP/TLS 핸드셰이크를 반복하지 않음
+    - requests.get/post/patch/delete와 동일한 시그니처로 사용 가능
+    - enable_token_refresh() 설정 시 expired_token 응답을 받으면 토큰을 한 번만 갱신하고 요청을 재전송
+    - 동시에 진행 중인 동일 GET(URL/params/헤더)은 하나의 요청으로 병합하고 응답을 나눠 받음 (HTTP_COALESCE=0으로 비활성화)
+    - HTTP_MICRO_TTL(초)을 지정하면 읽기 전용 경로(HTTP_MICRO_TTL_PATHS)의 200 응답을 그 시간 동안 재사용
+    - RATE_LIMIT_RPS/RATE_LIMITS를 지정하면 모든 워커가 공유하는 엔드포인트 계열별 속도 제한 적용
+    - base URL별 서킷 브레이커: 플랫폼 장애(연결 오류/타임아웃/502·503·504)가 이어지면 CircuitOpenError로 즉시 실패
+    - 멱등 요청은 일시적 장애 시 요청 단위로 재시도 (RETRY_MAX_ATTEMPTS=1이면 비활성화)
+    - 모든 요청에 connect/read 타임아웃을 적용하고, 테스트 deadline이 있으면 남은 시간 안으로 축소
+    - 모든 요청의 응답 시간/응답 코드/바이트를 엔드포인트별 히스토그램으로 집계 (HTTP_LATENCY=0이면 비활성화)
+    - HTTP_HEDGE=1이면 GET이 엔드포인트의 p95 안에 끝나지 않을 때 중복 요청을 보내 먼저 온 응답 사용
+    """
+
+    def __init__(self, pool_size=None):
+        self.pool_size = pool_size or _pool_size_from_env()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._auth_headers = None
+        self._fetch_token = None
+        # 이 클라이언트가 발급/사용한 Authorization 값 (테스트가 일부러 만든 가짜 토큰은 갱신 대상에서 제외)
+        self._issued_auth = set()
+        self._refresh_lock = threading.Lock()
+        self.token_refreshes = 0
+
+        self.coalesce = os.getenv("HTTP_COALESCE", "1").lower() not in ("0", "false", "no")
+        self.micro_ttl = float(os.getenv("HTTP_MICRO_TTL", "0"))
+        paths = os.getenv("HTTP_MICRO_TTL_PATHS")
+        self.micro_ttl_paths = tuple(p.strip() for p in paths.split(",") if p.strip()) if paths else DEFAULT_MICRO_TTL_PATHS
+        self._flight_lock = threading.Lock()
+        self._in_flight = {}
+        # {요청 키: (만료 시각, 응답)}
+        self._micro_cache = {}
+        # 병합/캐시로 절약한 GET 호출 수
+        self.coalesced = 0
+        self.micro_cache_hits = 0
+
+        # 속도 제한 (환경 변수 미설정 시 None - 비활성화)
+        self.rate_limiter = SharedRateLimiter.from_env()
+        # 서킷 브레이커 (CIRCUIT_BREAKER=0이면 None - 비활성화)
+        self.circuit_breaker = CircuitBreaker.from_env()
+        # 요청 단위 재시도 정책 (RETRY_MAX_ATTEMPTS=1이면 None - 비활성화)
+        self.retry_policy = RetryPolicy.from_env()
+        # GET 중복 요청 (HTTP_HEDGE=1일 때만 생성)
+        self.hedger = Hedger.from_env()
+        # 엔드포인트별 응답 시간 집계 (HTTP_LATENCY=0이면 None)
+        self.latency = get_recorder()
+
+    def enable_token_refresh(self, headers, fetch_token):
+        """
+        expired_token 응답 시 토큰 자동 갱신 설정
+        :param headers: 갱신된 토큰을 반영할 공용 헤더 dict (api_headers를 in-place로 수정)
+        :param fetch_token: 새 토큰을 발급하는 함수 (예: generate_fresh_token)
+        """
+        self._auth_headers = headers
+        self._fetch_token = fetch_token
+        self._issued_auth.add(headers.get("Authorization"))
+
+    def request(self, method, url, **kwargs):
+        if self.coalesce and method.upper() == "GET" and set(kwargs) <= _COALESCABLE_KWARGS:
+            return self._coalesced_get(url, kwargs)
+        return self._send(method, url, **kwargs)
+
+    def _send(self, method, url, **kwargs):
+        # 공유 헤더 dict(api_headers)는 응답을 기다리는 사이 다른 스레드의 갱신으로 바뀔 수 있으므로 보낸 값을 보관
+        sent_auth = (kwargs.get("headers") or {}).get("Authorization")
+        response = self._request_with_retry(method, url, **kwargs)
+        if self._is_expired_token(response, sent_auth):
+            new_auth = self._refresh_auth(sent_auth)
+            if new_auth:
+                headers = dict(kwargs["headers"])
+                headers["Authorization"] = new_auth
+                kwargs["headers"] = headers
+                response = self._request_with_retry(method, url, **kwargs)
+        return response
+
+    def _request_with_retry(self, method, url, **kwargs):
+        policy = self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                response = self._dispatch(method, url, **kwargs)
+            except CircuitOpenError:
+                raise
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if policy is None or not policy.should_retry(method, kwargs.get("headers"), attempt):
+                    raise
+                reason = type(e).__name__
+            else:
+                if policy is None or response.status_code not in policy.retry_statuses:
+                    return response
+                if not policy.should_retry(method, kwargs.get("headers"), attempt):
+                    return response
+                reason = f"HTTP {response.status_code}"
+            delay = policy.backoff(attempt)
+            policy.record(method, url, attempt, reason, delay)
+            deadline.sleep(delay)
+            attempt += 1
+
+    def _dispatch(self, method, url, **kwargs):
+        if self.hedger is not None and method.upper() == "GET":
+            return self.hedger.run(
+                f"GET {template_path(url)}", lambda: self._session_request(method, url, **kwargs)
+            )
+        return self._session_request(method, url, **kwargs)
+
+    def _session_request(self, method, url, **kwargs):
+        # 타임아웃 없는 요청은 보내지 않음 (deadline이 지났으면 여기서 DeadlineExceeded)
+        kwargs["timeout"] = deadline.request_timeout(kwargs.get("timeout"), f"{method} {url}")
+        breaker = self.circuit_breaker
+        key = breaker.before_request(url) if breaker else None
+        try:
+            if self.rate_limiter is None:
+                response = self._timed_request(method, url, **kwargs)
+            else:
+                with self.rate_limiter.slot(url):
+                    response = self._timed_request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            left = deadline.remaining()
+            if isinstance(e, requests.Timeout) and left is not None and left <= 0:
+                # deadline 때문에 줄어든 타임아웃이면 플랫폼 장애로도 성공으로도 집계하지 않음
+                if breaker:
+                    breaker.release(key)
+                raise deadline.exceeded(f"{method} {url}") from e
+            if breaker:
+                breaker.record(key, True, type(e).__name__)
+            raise
+        except Exception:
+            # 연결 오류/타임아웃 외의 예외(속도 제한 대기 중 deadline 초과 등)는 플랫폼 상태와 무관
+            if breaker:
+                breaker.release(key)
+            raise
+        if breaker:
+            breaker.record(key, response.status_code in FAILURE_STATUS_CODES, f"HTTP {response.status_code}")
+        return response
+
+    def _timed_request(self, method, url, **kwargs):
+        """실제 전송 구간(속도 제한 대기 제외)의 응답 시간을 기록하며 요청"""
+        if self.latency is None:
+            return self.session.request(method, url, **kwargs)
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception as e:
+            self.latency.record(method, url, time.perf_counter() - started, type(e).__name__)
+            raise
+        self.latency.record(method, url, time.perf_counter() - started, response.status_code, len(response.content))
+        return response
+
+    def _micro_ttl_for(self, url):
+        if self.micro_ttl <= 0:
+            return 0
+        return self.micro_ttl if urlsplit(url).path.startswith(self.micro_ttl_paths) else 0
+
+    def _coalesced_get(self, url, kwargs):
+        """
+        단일 실행(single-flight) GET
+        - 같은 키의 요청이 진행 중이면 새로 보내지 않고 그 응답의 복사본을 반환 (deadline이 있으면 남은 시간까지만 대기)
+        - 마이크로 TTL 대상 경로는 만료 전까지 캐시된 200 응답을 반환
+        """
+        key = _request_key(url, kwargs)
+        ttl = self._micro_ttl_for(url)
+        with self._flight_lock:
+            if ttl:
+                cached = self._micro_cache.get(key)
+                if cached and cached[0] > time.monotonic():
+                    self.micro_cache_hits += 1
+                    return copy.copy(cached[1])
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            # 먼저 보낸 요청이 늦어져도 테스트 deadline을 넘겨 기다리지 않음
+            if not flight.done.wait(deadline.remaining()):
+                raise deadline.exceeded(f"GET {url} (병합된 요청 응답 대기 중)")
+            if flight.error is not None:
+                raise flight.error
+            # 호출부마다 독립된 Response 객체를 받도록 복사 (본문은 이미 읽혀 있음)
+            return copy.copy(flight.response)
+
+        try:
+            response = self._send("GET", url, **kwargs)
+            flight.response = response
+            if ttl and response.status_code == 200:
+                with self._flight_lock:
+                    now = time.monotonic()
+                    self._micro_cache = {k: v for k, v in self._micro_cache.items() if v[0] > now}
+                    self._micro_cache[key] = (now + ttl, copy.copy(response))
+            return response
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flight_lock:
+                self._in_flight.pop(key, None)
+            flight.done.set()
+
+    def _is_expired_token(self, response, sent_auth):
+        if self._fetch_token is None or response.status_code not in (401, 403):
+            return False
+        if not sent_auth or sent_auth not in self._issued_auth:
+            return False
+        try:
+            return response.json().get("code") == "expired_token"
+        except (ValueError, AttributeError):
+            return False
+
+    def _refresh_auth(self, sent_auth):
+        """
+        단일 실행(single-flight) 토큰 갱신
+        - 프로세스 내 스레드는 락으로, xdist 워커 간에는 토큰 캐시의 파일 락으로 직렬화
+        - 먼저 갱신한 쪽이 있으면 재로그인 없이 그 토큰을 사용
+        """
+        with self._refresh_lock:
+            current_auth = self._auth_headers.get("Authorization")
+            if current_auth != sent_auth:
+                return current_auth
+
+            logger.warning("🔑 expired_token 응답 - 토큰 갱신 후 요청 재전송")
+            try:
+                token = refresh_token(self._fetch_token, stale_token=sent_auth.split(" ", 1)[-1])
+            except Exception:
+                logger.exception("⛔ 토큰 갱신 실패")
+                return None
+
+            new_auth = f"Bearer {token}"
+            self._auth_headers["Authorization"] = new_auth
+            self._issued_auth.add(new_auth)
+            self.token_refreshes += 1
+            return new_auth
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def connection_stats(self):
+        """
+        호스트별 커넥션 재사용 통계
+        :return: {host: {"requests": n, "connections": n, "reused": n}}
+        """
+        stats = {}
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                host = f"{pool.scheme}://{pool.host}:{pool.port}"
+                entry = stats.setdefault(host, {"requests": 0, "connections": 0, "reused": 0})
+                entry["requests"] += pool.num_requests
+                entry["connections"] += pool.num_connections
+        for entry in stats.values():
+            entry["reused"] = max(entry["requests"] - entry["connections"], 0)
+        return stats
+
+    def log_stats(self):
+        for host, entry in self.connection_stats().items():
+            total = entry["requests"]
+            ratio = (entry["reused"] / total * 100) if total else 0.0
+            logger.info(
+                f"🔌 커넥션 재사용 통계 [{urlsplit(host).hostname}] "
+                f"요청 {total}회 / 신규 연결 {entry['connections']}회 / 재사용률 {ratio:.1f}%"
+            )
+        if self.coalesced or self.micro_cache_hits:
+            logger.info(f"🔗 GET 병합 {self.coalesced}회 / 마이크로 캐시 적중 {self.micro_cache_hits}회 절약")
+        if self.rate_limiter is not None:
+            self.rate_limiter.log_stats()
+        if self.hedger is not None:
+            self.hedger.log_stats()
+        if self.retry_policy is not None and self.retry_policy.total_retries:
+            logger.warning(f"🔁 요청 단위 재시도 {self.retry_policy.total_retries}회")
+        if self.circuit_breaker is not None and self.circuit_breaker.rejected:
+            logger.warning(f"⛔ 서킷 오픈으로 차단된 요청 {self.circuit_breaker.rejected}회")
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스(xdist 워커) 단위로 공유되는 ApiClient 반환"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ApiClient()
+    return _client
+
+
+def close_client():
+    """공유 ApiClient 종료 (세션 종료 시 호출)"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,216 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+from src.utils.http_client import get_client
+from src.utils.pager import paginate
+
+# 리소스 종류별 (서비스, 목록 조회 경로, 단건 조회/삭제 경로, id 키 후보)
+# 경로는 서비스 base URL 기준 (compute/block_storage/network/object_storage)
+RESOURCE_TYPES = {
+    "virtual_machine": ("compute", "/virtual_machine_allocation", "/virtual_machine", ("machine_id", "id")),
+    "snapshot_scheduler": ("block_storage", "/snapshot_scheduler", "/snapshot_scheduler", ("id",)),
+    "snapshot": ("block_storage", "/snapshot", "/snapshot", ("id",)),
+    "block_storage": ("block_storage", "", "", ("id",)),
+    "network_interface": ("network", "/network_interface", "/network_interface", ("id",)),
+    "public_ip": ("network", "/public_ip", "/public_ip", ("id",)),
+    "subnet": ("network", "/subnet", "/subnet", ("id",)),
+    "virtual_network": ("network", "/virtual_network", "/virtual_network", ("id",)),
+    "user_grant": ("object_storage", "/user_grant", "/user_grant", ("id",)),
+    "object_storage_user": ("object_storage", "/user", "/user", ("id",)),
+    "object_storage": ("object_storage", "", "", ("id",)),
+}
+# id 외에 항상 인덱싱하는 필드 (그 밖에 *_id 문자열 필드는 모두 인덱싱 - attached_subnet_id 등)
+INDEXED_FIELDS = ("name", "status", "zone_id")
+
+
+def _indexable(value):
+    return isinstance(value, (str, int, bool))
+
+
+def _indexed_fields(item):
+    for key, value in item.items():
+        if _indexable(value) and (key in INDEXED_FIELDS or key.endswith("_id")):
+            yield key, value
+
+
+class _KindIndex:
+    """리소스 종류 하나의 해시 인덱스 (id → 항목, 필드 → 값 → {id: 항목})"""
+
+    def __init__(self, id_keys):
+        self.id_keys = id_keys
+        self.items = {}
+        self.fields = {}
+        self.loaded_at = None
+
+    def item_id(self, item):
+        for key in self.id_keys:
+            if item.get(key):
+                return item[key]
+        return None
+
+    def add(self, item):
+        resource_id = self.item_id(item)
+        if resource_id is None:
+            return
+        self.remove(resource_id)
+        self.items[resource_id] = item
+        for key, value in _indexed_fields(item):
+            self.fields.setdefault(key, {}).setdefault(value, {})[resource_id] = item
+
+    def remove(self, resource_id):
+        item = self.items.pop(resource_id, None)
+        if item is None:
+            return
+        for key, value in _indexed_fields(item):
+            bucket = self.fields.get(key, {}).get(value)
+            if bucket is not None:
+                bucket.pop(resource_id, None)
+                if not bucket:
+                    del self.fields[key][value]
+
+    def candidates(self, filters):
+        """
+        인덱스에 있는 필터 값 중 가장 작은 버킷을 후보로 선택
+        인덱싱하지 않는 값(None, float, list 등)이나 인덱스에 없는 값만 있으면 전체 항목 (인덱스만 보고 "없음"으로 판단하지 않음)
+        """
+        buckets = [
+            self.fields[key][value] for key, value in filters.items()
+            if key in self.fields and _indexable(value) and value in self.fields[key]
+        ]
+        return min(buckets, key=len).values() if buckets else self.items.values()
+
+
+class Inventory:
+    """
+    ECI 리소스 목록 스냅샷과 해시 인덱스
+
+    - load()로 등록된 모든 리소스 종류를 동시에 조회해 id/name/status/zone_id/*_id 기준으로 인덱싱
+    - first()/find()는 목록 재조회 없이 인덱스 조회로 응답
+      (예: first("block_storage", status="prepared"), find("network_interface", attached_subnet_id=subnet_id))
+    - 증분 갱신: refresh(max_age=...)로 오래된 종류만 재조회, refresh_item()/upsert()/remove()/discard()로 항목 단위 반영
+    """
+
+    def __init__(self, headers, client=None):
+        self.headers = headers
+        self.client = client or get_client()
+        self._specs = {}
+        self._indexes = {}
+        self._lock = threading.RLock()
+        # 마지막 load()에서 조회에 실패한 종류 (이전 스냅샷 또는 빈 목록이 남아 있음)
+        self.failed_kinds = []
+
+    def register(self, kind, list_url, item_url=None, id_keys=("id",)):
+        """
+        :param list_url: 목록 조회 URL (skip/count 페이지네이션)
+        :param item_url: 단건 조회 기준 URL (기본값: list_url)
+        :param id_keys: 항목 id로 사용할 키 후보 (앞에서부터 값이 있는 키 사용)
+        """
+        self._specs[kind] = {"list_url": list_url, "item_url": item_url or list_url}
+        self._indexes[kind] = _KindIndex(tuple(id_keys))
+        return self
+
+    def register_defaults(self, base_urls):
+        """
+        RESOURCE_TYPES의 모든 리소스 종류를 등록
+        :param base_urls: {"compute": url, "block_storage": url, "network": url, "object_storage": url}
+        """
+        for kind, (service, list_path, item_path, id_keys) in RESOURCE_TYPES.items():
+            base_url = base_urls[service]
+            self.register(kind, f"{base_url}{list_path}", f"{base_url}{item_path}", id_keys)
+        return self
+
+    def item_url(self, kind):
+        return self._specs[kind]["item_url"]
+
+    def item_id(self, kind, item):
+        return self._indexes[kind].item_id(item)
+
+    def _fetch(self, kind):
+        return list(paginate(self._specs[kind]["list_url"], self.headers, client=self.client))
+
+    def load(self, kinds=None):
+        """
+        지정한(기본: 등록된 전체) 리소스 종류를 동시에 조회해 인덱스를 새로 구성
+        조회에 실패한 종류는 failed_kinds에 남김 (호출부에서 빈 목록과 구분해 처리)
+        """
+        kinds = list(kinds or self._specs)
+        self.failed_kinds = []
+        if not kinds:
+            return self
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            futures = {kind: executor.submit(self._fetch, kind) for kind in kinds}
+        total = 0
+        for kind, future in futures.items():
+            try:
+                items = future.result()
+            except Exception as e:
+                # 조회에 실패한 종류는 이전 스냅샷을 유지
+                logger.warning(f"⚠️ 인벤토리 조회 실패 ({kind}): {e}")
+                self.failed_kinds.append(kind)
+                continue
+            index = _KindIndex(self._indexes[kind].id_keys)
+            for item in items:
+                index.add(item)
+            index.loaded_at = time.time()
+            with self._lock:
+                self._indexes[kind] = index
+            total += len(items)
+        logger.info(f"📦 인벤토리 로드 완료 ({len(kinds) - len(self.failed_kinds)}/{len(kinds)}종 / {total}건, {time.time() - started:.1f}초)")
+        return self
+
+    def refresh(self, kinds=None, max_age=0):
+        """마지막 조회 후 max_age초가 지난(또는 아직 조회하지 않은) 종류만 다시 조회"""
+        now = time.time()
+        stale = [
+            kind for kind in (kinds or self._specs)
+            if self._indexes[kind].loaded_at is None or now - self._indexes[kind].loaded_at >= max_age
+        ]
+        return self.load(stale) if stale else self
+
+    def refresh_item(self, kind, resource_id):
+        """항목 하나만 단건 조회로 갱신 (404/422면 인덱스에서 제거) :return: 최신 항목 또는 None"""
+        response = self.client.get(f"{self.item_url(kind)}/{resource_id}", headers=self.headers)
+        if response.status_code in (404, 422):
+            self.remove(kind, resource_id)
+            return None
+        response.raise_for_status()
+        item = response.json()
+        self.upsert(kind, item)
+        return item
+
+    def upsert(self, kind, item):
+        with self._lock:
+            self._indexes[kind].add(item)
+
+    def remove(self, kind, resource_id):
+        with self._lock:
+            self._indexes[kind].remove(resource_id)
+
+    def discard(self, resource_id):
+        """종류와 관계없이 id가 같은 항목을 인덱스에서 제거 (삭제한 리소스의 종류를 모르는 경우)"""
+        with self._lock:
+            for index in self._indexes.values():
+                index.remove(resource_id)
+
+    def all(self, kind):
+        with self._lock:
+            return list(self._indexes[kind].items.values())
+
+    def get(self, kind, resource_id):
+        with self._lock:
+            return self._indexes[kind].items.get(resource_id)
+
+    def find(self, kind, **filters):
+        """모든 필터(필드=값)를 만족하는 항목 목록"""
+        with self._lock:
+            candidates = self._indexes[kind].candidates(filters)
+            return [item for item in candidates if all(item.get(k) == v for k, v in filters.items())]
+
+    def first(self, kind, **filters):
+        """필터를 만족하는 첫 항목 (없으면 None)"""
+        with self._lock:
+            candidates = self._indexes[kind].candidates(filters)
+            return next((item for item in candidates if all(item.get(k) == v for k, v in filters.items())), None)
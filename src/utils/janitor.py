@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from loguru import logger
+
+# 백그라운드에서 동시에 진행할 최대 삭제 작업 수
+DEFAULT_JANITOR_WORKERS = 4
+# 삭제 요청 최대 시도 횟수
+DEFAULT_MAX_ATTEMPTS = 3
+# 재시도 간격(초) - 시도할 때마다 2배씩 증가
+DEFAULT_RETRY_DELAY = 2
+
+
+class Janitor:
+    """
+    리소스 삭제를 큐에 넣고 백그라운드 워커에서 처리하는 지연 정리기
+
+    - submit()은 바로 반환하므로 테스트는 삭제 완료를 기다리지 않고 다음으로 진행
+    - 삭제 요청이 실패하면 지수 백오프로 재시도
+    - resource_id가 다른 작업의 references에 포함되어 있으면 그 작업(삭제 + 삭제 완료 대기)이 끝난 뒤 삭제
+      (예: 권한 삭제가 끝나야 버킷/사용자 삭제)
+    - drain()은 세션 종료 시 남은 작업을 모두 기다리고 삭제 실패 목록을 보고
+    """
+
+    def __init__(self, max_workers=None, max_attempts=DEFAULT_MAX_ATTEMPTS, retry_delay=DEFAULT_RETRY_DELAY):
+        self.max_workers = max_workers or int(os.getenv("JANITOR_WORKERS", DEFAULT_JANITOR_WORKERS))
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="janitor")
+        self._lock = threading.Lock()
+        # [(future, references), ...] - 아직 끝나지 않은 작업
+        self._pending = []
+        self.completed = 0
+        self.failures = []
+
+    def submit(self, description, delete_one, wait_deleted=None, resource_id=None, references=()):
+        """
+        삭제 작업 등록
+
+        :param description: 로그/실패 보고에 사용할 리소스 설명
+        :param delete_one: 삭제 요청을 보내고 성공 여부를 반환하는 함수 (False 반환/예외 발생 시 재시도)
+        :param wait_deleted: 삭제 요청 성공 후 삭제 완료까지 대기하는 함수 (falsy 반환 시 실패로 보고)
+        :param resource_id: 삭제할 리소스 id (이 id를 참조하는 선행 작업이 끝난 뒤 실행)
+        :param references: 이 리소스가 참조하는 다른 리소스 id 목록
+        :return: Future (결과: 삭제 성공 여부)
+        """
+        with self._lock:
+            self._pending = [(f, refs) for f, refs in self._pending if not f.done()]
+            blockers = [f for f, refs in self._pending if resource_id is not None and resource_id in refs]
+            future = self._executor.submit(self._run, description, delete_one, wait_deleted, blockers)
+            self._pending.append((future, frozenset(references)))
+        return future
+
+    def _run(self, description, delete_one, wait_deleted, blockers):
+        # 선행 작업은 항상 먼저 큐에 들어가 있으므로 워커가 모두 대기 상태에 빠지지 않음
+        if blockers:
+            wait(blockers)
+
+        last_error = None
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                if delete_one():
+                    break
+                last_error = "삭제 요청 실패"
+            except Exception as e:
+                last_error = f"{type(e).__name__}: {e}"
+            if attempt < self.max_attempts:
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                logger.warning(f"⚠️ 지연 정리 재시도 ({attempt}/{self.max_attempts}, {delay}초 후): {description}")
+                time.sleep(delay)
+        else:
+            return self._fail(description, last_error)
+
+        if wait_deleted is not None:
+            try:
+                if not wait_deleted():
+                    return self._fail(description, "삭제 완료(deleted) 확인 실패")
+            except Exception as e:
+                return self._fail(description, f"{type(e).__name__}: {e}")
+
+        with self._lock:
+            self.completed += 1
+        return True
+
+    def _fail(self, description, reason):
+        logger.error(f"⛔ 지연 정리 실패: {description} - {reason}")
+        with self._lock:
+            self.failures.append((description, reason))
+        return False
+
+    def drain(self):
+        """남은 삭제 작업을 모두 기다린 뒤 결과를 보고하고 실패 목록을 반환"""
+        started = time.time()
+        self._executor.shutdown(wait=True)
+        logger.info(f"🧹 지연 정리 완료: 성공 {self.completed}건 / 실패 {len(self.failures)}건 (종료 대기 {time.time() - started:.1f}초)")
+        if self.failures:
+            report = "\n".join(f"  - {description}: {reason}" for description, reason in self.failures)
+            logger.error(f"⛔ 삭제되지 않은 리소스 목록 (수동 정리 필요)\n{report}")
+        return self.failures
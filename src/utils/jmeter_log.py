@@ -0,0 +1,240 @@
+import re
+import statistics
+from array import array
+from collections import deque
+from datetime import datetime
+
+# 로그 줄 앞의 시각 (예: 2026-01-02 17:49:30,546 또는 loguru의 2026-01-02 17:49:30.546)
+_TIMESTAMP = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})[,.](\d{3})")
+# summariser 구간 줄 (JMeter 및 src/utils/load.py Summariser 공통 형식, 뒤의 p90/p99는 Summariser만 출력)
+_SUMMARY = re.compile(
+    r"(?P<label>\w+) \+\s+(?P<count>\d+) in (?P<h>\d+):(?P<m>\d{2}):(?P<s>\d{2}) =\s+(?P<rate>[\d.]+)/s "
+    r"Avg:\s+(?P<avg>\d+) Min:\s+(?P<min>\d+) Max:\s+(?P<max>\d+) Err:\s+(?P<errors>\d+) \((?P<error_pct>[\d.]+)%\)"
+    r"(?: Active: (?P<active>\d+) Started: (?P<started>\d+) Finished: (?P<finished>\d+))?"
+)
+_THREAD_STARTED = "Thread started: "
+_THREAD_FINISHED = "Thread finished: "
+
+# 이 비율(%) 이상 오류가 난 구간을 오류 급증 구간으로 표시
+DEFAULT_ERROR_THRESHOLD = 10.0
+# 평균 응답 시간이 직전 구간들의 중앙값 대비 이 배수 이상(또는 이 배수분의 1 이하)이면 응답 시간 수준 변화 후보
+DEFAULT_LATENCY_FACTOR = 2.0
+# 응답 시간 기준값(중앙값)을 계산하는 직전 구간 수
+DEFAULT_BASELINE_WINDOW = 5
+# 같은 방향의 변화가 이 구간 수만큼 이어져야 수준 변화로 판단 (일시적인 튐 제외)
+DEFAULT_MIN_INTERVALS = 2
+
+
+def _parse_time(line):
+    match = _TIMESTAMP.match(line)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S").timestamp() + int(match.group(2)) / 1000
+
+
+def format_time(epoch):
+    return datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class AnomalyDetector:
+    """
+    구간 통계를 순서대로 받아 이상 구간을 표시하는 스트리밍 감지기 (직전 baseline_window개 값만 보관)
+
+    - error_cliff: 오류율이 error_threshold(%) 이상인 연속 구간 (시작/종료 시각, 최대 오류율)
+    - latency_shift: 평균 응답 시간이 직전 중앙값 대비 latency_factor배 이상 오르거나 내린 상태가
+      min_intervals 구간 이상 이어진 시점 (이전/이후 수준)
+    """
+
+    def __init__(self, error_threshold=DEFAULT_ERROR_THRESHOLD, latency_factor=DEFAULT_LATENCY_FACTOR,
+                 baseline_window=DEFAULT_BASELINE_WINDOW, min_intervals=DEFAULT_MIN_INTERVALS):
+        self.error_threshold = error_threshold
+        self.latency_factor = latency_factor
+        self.min_intervals = max(1, min_intervals)
+        self._baseline = deque(maxlen=baseline_window)
+        self._cliff = None
+        self._shift = None
+        self.flags = []
+
+    def feed(self, start, end, error_pct, avg_ms, count=0, errors=0):
+        """구간 하나 추가 (start/end: epoch 초)"""
+        self._feed_errors(start, end, error_pct, count, errors)
+        self._feed_latency(start, avg_ms)
+
+    def _feed_errors(self, start, end, error_pct, count, errors):
+        if error_pct >= self.error_threshold:
+            if self._cliff is None:
+                self._cliff = {"type": "error_cliff", "start": start, "end": end, "peak_error_pct": error_pct,
+                               "intervals": 0, "count": 0, "errors": 0}
+            cliff = self._cliff
+            cliff["end"] = end
+            cliff["peak_error_pct"] = max(cliff["peak_error_pct"], error_pct)
+            cliff["intervals"] += 1
+            cliff["count"] += count
+            cliff["errors"] += errors
+        elif self._cliff is not None:
+            self.flags.append(self._cliff)
+            self._cliff = None
+
+    def _feed_latency(self, start, avg_ms):
+        baseline = statistics.median(self._baseline) if len(self._baseline) >= 3 else None
+        direction = None
+        if baseline:
+            ratio = avg_ms / baseline
+            if ratio >= self.latency_factor:
+                direction = "up"
+            elif ratio <= 1 / self.latency_factor:
+                direction = "down"
+
+        if direction is None:
+            self._shift = None
+        elif self._shift is None or self._shift["direction"] != direction:
+            self._shift = {"type": "latency_shift", "direction": direction, "start": start,
+                           "baseline_ms": round(baseline, 1), "levels": [avg_ms], "reported": False}
+        else:
+            self._shift["levels"].append(avg_ms)
+
+        shift = self._shift
+        if shift is not None and not shift["reported"] and len(shift["levels"]) >= self.min_intervals:
+            shift["reported"] = True
+            self.flags.append({
+                "type": "latency_shift", "direction": direction, "start": shift["start"],
+                "baseline_ms": shift["baseline_ms"], "level_ms": round(statistics.median(shift["levels"]), 1),
+            })
+        # 수준 변화 중인 구간은 기준값에 넣지 않음 (변화가 확정되면 이후 구간들로 기준값이 옮겨감)
+        if shift is None or shift["reported"]:
+            self._baseline.append(avg_ms)
+
+    def finish(self):
+        """진행 중인 오류 급증 구간을 닫고 전체 표시 목록을 시작 시각 순으로 반환"""
+        if self._cliff is not None:
+            self.flags.append(self._cliff)
+            self._cliff = None
+        return sorted(self.flags, key=lambda flag: flag["start"])
+
+
+def describe_flag(flag, relative=False):
+    """:param relative: start/end가 실행 시작 기준 초(analyze_intervals 결과)인 경우 True"""
+    fmt = (lambda seconds: f"+{seconds:.0f}s") if relative else format_time
+    if flag["type"] == "error_cliff":
+        return (
+            f"⛔ 오류 급증 {fmt(flag['start'])} ~ {fmt(flag['end'])} "
+            f"({flag['intervals']}구간, 최대 {flag['peak_error_pct']:.1f}%, {flag['errors']}/{flag['count']}건 실패)"
+        )
+    arrow = "상승" if flag["direction"] == "up" else "하락"
+    return f"⚠️ 응답 시간 수준 {arrow} {fmt(flag['start'])}부터 (평균 {flag['baseline_ms']:.0f}ms → {flag['level_ms']:.0f}ms)"
+
+
+class JMeterLogSeries:
+    """
+    summariser 구간 통계를 열(column) 단위 array로 보관하는 시계열
+
+    - 로그 크기와 관계없이 구간 수만큼만 메모리 사용 (구간당 고정 크기 숫자 몇 개)
+    - active/peak_active는 Thread started/finished 이벤트로 다시 계산한 동시 실행 스레드 수
+      (active: 구간 끝 시점, peak_active: 구간 중 최대)
+    """
+
+    COLUMNS = {
+        "start": "d", "end": "d", "count": "l", "throughput": "d", "avg_ms": "l", "min_ms": "l", "max_ms": "l",
+        "errors": "l", "error_pct": "d", "active": "l", "peak_active": "l",
+    }
+
+    def __init__(self):
+        for name, typecode in self.COLUMNS.items():
+            setattr(self, name, array(typecode))
+
+    def __len__(self):
+        return len(self.start)
+
+    def append(self, **values):
+        for name in self.COLUMNS:
+            getattr(self, name).append(values[name])
+
+    def to_columns(self):
+        return {name: getattr(self, name).tolist() for name in self.COLUMNS}
+
+    def intervals(self):
+        """src/utils/load.py Summariser.report()의 intervals와 같은 형식의 구간 목록"""
+        if not len(self):
+            return []
+        origin = self.start[0]
+        return [
+            {
+                "count": self.count[i], "errors": self.errors[i], "error_rate": self.error_pct[i],
+                "throughput": self.throughput[i], "mean_ms": self.avg_ms[i], "min_ms": self.min_ms[i], "max_ms": self.max_ms[i],
+                "at": round(self.end[i] - origin, 1), "duration": round(self.end[i] - self.start[i], 1),
+                "active": self.active[i], "peak_active": self.peak_active[i],
+            }
+            for i in range(len(self))
+        ]
+
+    def total(self):
+        count = sum(self.count)
+        errors = sum(self.errors)
+        duration = self.end[-1] - self.start[0] if len(self) else 0
+        return {
+            "count": count,
+            "errors": errors,
+            "error_rate": round(errors / count * 100, 2) if count else 0.0,
+            "throughput": round(count / duration, 3) if duration > 0 else 0.0,
+            "mean_ms": round(sum(c * a for c, a in zip(self.count, self.avg_ms)) / count, 1) if count else None,
+            "min_ms": min((m for c, m in zip(self.count, self.min_ms) if c), default=None),
+            "max_ms": max(self.max_ms, default=None),
+        }
+
+
+def parse_log(lines, detector=None, label="summary"):
+    """
+    JMeter 로그(또는 load_test.py 로그) 줄을 한 줄씩 읽어 구간 시계열 생성
+    :param lines: 파일 객체 등 줄 단위 iterable (전체를 메모리에 올리지 않음)
+    :param detector: AnomalyDetector (구간마다 feed)
+    :return: JMeterLogSeries
+    """
+    series = JMeterLogSeries()
+    active = 0
+    peak = 0
+    for line in lines:
+        if _THREAD_STARTED in line:
+            active += 1
+            peak = max(peak, active)
+            continue
+        if _THREAD_FINISHED in line:
+            active = max(0, active - 1)
+            continue
+        if " + " not in line:
+            continue
+        match = _SUMMARY.search(line)
+        if not match or match.group("label") != label:
+            continue
+        end = _parse_time(line)
+        if end is None:
+            continue
+        duration = int(match.group("h")) * 3600 + int(match.group("m")) * 60 + int(match.group("s"))
+        # 스레드 이벤트가 없는 로그(load_test.py)는 summariser가 출력한 Active 값 사용
+        reported_active = int(match.group("active")) if match.group("active") else 0
+        values = {
+            "start": end - duration, "end": end,
+            "count": int(match.group("count")), "throughput": float(match.group("rate")),
+            "avg_ms": int(match.group("avg")), "min_ms": int(match.group("min")), "max_ms": int(match.group("max")),
+            "errors": int(match.group("errors")), "error_pct": float(match.group("error_pct")),
+            "active": active if peak else reported_active, "peak_active": peak if peak else reported_active,
+        }
+        series.append(**values)
+        if detector is not None:
+            detector.feed(values["start"], end, values["error_pct"], values["avg_ms"], values["count"], values["errors"])
+        peak = active
+    return series
+
+
+def analyze_intervals(intervals, detector=None):
+    """
+    load_test.py 결과의 intervals에 같은 이상 구간 감지 적용
+    (at/duration은 실행 시작 기준 초이므로 start/end도 실행 시작 기준 초)
+    """
+    detector = detector or AnomalyDetector()
+    for entry in intervals:
+        if not entry.get("count"):
+            continue
+        end = entry["at"]
+        detector.feed(end - entry["duration"], end, entry["error_rate"], entry.get("mean_ms") or 0,
+                      entry["count"], entry["errors"])
+    return detector.finish()
@@ -0,0 +1,253 @@
+import json
+import math
+import os
+import threading
+from pathlib import Path
+
+from loguru import logger
+from src.utils.rate_limit import template_path
+
+# 워커별 측정 결과와 병합 결과를 저장하는 디렉터리
+DEFAULT_REPORT_DIR = Path(__file__).resolve().parents[2] / "reports" / "latency"
+# 병합 결과 파일 이름 (워커별 파일은 <워커 ID>.json)
+SUMMARY_FILE = "summary.json"
+# 버킷 경계 비율 - 값은 버킷 안에서 최대 약 1% 오차로 표현됨
+BUCKET_GROWTH = 1.02
+# 이보다 작은 값(ms)은 모두 같은 버킷으로 취급
+MIN_VALUE_MS = 0.1
+# 요약에 포함하는 분위수
+PERCENTILES = (50, 90, 99)
+
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+
+class LatencyHistogram:
+    """
+    로그 버킷 기반 스트리밍 히스토그램 (밀리초)
+
+    - 값마다 버킷 카운트만 증가시키므로 요청 수와 관계없이 메모리 사용량이 일정
+      (0.1ms ~ 10분 범위도 800개 버킷 이내)
+    - 버킷별 카운트를 더하면 되므로 워커/구간별 히스토그램을 손실 없이 병합 가능
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def bucket_of(value_ms):
+        return int(math.log(max(value_ms, MIN_VALUE_MS) / MIN_VALUE_MS) / _LOG_GROWTH)
+
+    @staticmethod
+    def bucket_value(index):
+        """버킷을 대표하는 값 (하한과 상한의 기하 평균)"""
+        return MIN_VALUE_MS * BUCKET_GROWTH ** (index + 0.5)
+
+    def record(self, value_ms, count=1):
+        index = self.bucket_of(value_ms)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.total += value_ms * count
+        self.min = value_ms if self.min is None else min(self.min, value_ms)
+        self.max = value_ms if self.max is None else max(self.max, value_ms)
+
+    def merge(self, other):
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, p):
+        """p 분위수(0~100) 추정값, 비어 있으면 None"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # 버킷 대표값이 실제 최소/최대를 벗어나지 않도록 보정
+                return min(max(self.bucket_value(index), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def to_dict(self):
+        return {
+            "count": self.count, "total": self.total, "min": self.min, "max": self.max,
+            "buckets": {str(k): v for k, v in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.buckets = {int(k): v for k, v in data.get("buckets", {}).items()}
+        histogram.count = data.get("count", 0)
+        histogram.total = data.get("total", 0.0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max")
+        return histogram
+
+
+class EndpointStats:
+    """엔드포인트 하나의 응답 시간 히스토그램 + 응답 코드별 횟수 + 응답 바이트 합계"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.statuses = {}
+        self.bytes = 0
+
+    def record(self, elapsed_ms, status, size):
+        self.latency.record(elapsed_ms)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes += size
+
+    @property
+    def errors(self):
+        """응답 코드 5xx 또는 응답을 받지 못한 요청 수 (4xx는 테스트가 의도한 경우가 많아 제외)"""
+        return sum(n for status, n in self.statuses.items() if not status.isdigit() or int(status) >= 500)
+
+    def merge(self, other):
+        self.latency.merge(other.latency)
+        for status, n in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + n
+        self.bytes += other.bytes
+        return self
+
+    def summary(self):
+        histogram = self.latency
+        result = {
+            "count": histogram.count,
+            "errors": self.errors,
+            "statuses": dict(sorted(self.statuses.items())),
+            "bytes": self.bytes,
+            "mean_ms": round(histogram.mean, 2),
+            "min_ms": round(histogram.min, 2),
+            "max_ms": round(histogram.max, 2),
+        }
+        for p in PERCENTILES:
+            result[f"p{p}_ms"] = round(histogram.percentile(p), 2)
+        return result
+
+    def to_dict(self):
+        return {"latency": self.latency.to_dict(), "statuses": self.statuses, "bytes": self.bytes}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.latency = LatencyHistogram.from_dict(data["latency"])
+        stats.statuses = dict(data.get("statuses", {}))
+        stats.bytes = data.get("bytes", 0)
+        return stats
+
+
+def endpoint_key(method, url):
+    """메서드 + ID를 {id}로 바꾼 경로 (예: "GET /api/user/resource/compute/{id}")"""
+    return f"{method.upper()} {template_path(url)}"
+
+
+class LatencyRecorder:
+    """
+    HTTP 요청별 응답 시간/응답 코드/바이트를 엔드포인트 단위로 집계
+
+    - 엔드포인트 수 x 버킷 수만큼만 메모리를 사용 (요청별 기록은 남기지 않음)
+    - xdist 워커마다 파일로 저장하고(write) 세션 종료 시 병합(merge_files)
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, url, elapsed, status, size=0):
+        """
+        :param elapsed: 응답 시간(초)
+        :param status: 응답 코드 또는 응답을 받지 못한 경우 예외 이름
+        """
+        key = endpoint_key(method, url)
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats()
+            stats.record(elapsed * 1000, str(status), size)
+
+    def merge(self, other):
+        with self._lock:
+            for key, stats in other.endpoints.items():
+                self.endpoints.setdefault(key, EndpointStats()).merge(stats)
+        return self
+
+    def summary(self):
+        """{엔드포인트: {count, errors, statuses, bytes, mean/min/max/p50/p90/p99(ms)}} (요청 수 내림차순)"""
+        with self._lock:
+            items = sorted(self.endpoints.items(), key=lambda item: -item[1].latency.count)
+            return {key: stats.summary() for key, stats in items}
+
+    def format_table(self):
+        lines = [f"{'endpoint':<70} {'count':>6} {'err':>4} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}"]
+        for key, entry in self.summary().items():
+            lines.append(
+                f"{key:<70} {entry['count']:>6} {entry['errors']:>4} {entry['p50_ms']:>8.1f} "
+                f"{entry['p90_ms']:>8.1f} {entry['p99_ms']:>8.1f} {entry['max_ms']:>8.1f}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self):
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self.endpoints.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        recorder = cls()
+        recorder.endpoints = {key: EndpointStats.from_dict(value) for key, value in data.items()}
+        return recorder
+
+    def write(self, path):
+        """병합 가능한 원본(버킷) 데이터와 요약을 함께 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"summary": self.summary(), "histograms": self.to_dict()}, ensure_ascii=False, indent=2))
+
+    @classmethod
+    def merge_files(cls, paths):
+        """write()로 저장한 파일들을 하나로 병합 (읽을 수 없는 파일은 건너뜀)"""
+        merged = cls()
+        for path in paths:
+            try:
+                data = json.loads(Path(path).read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ 응답 시간 파일을 읽을 수 없어 건너뜀: {path} ({e})")
+                continue
+            merged.merge(cls.from_dict(data.get("histograms", {})))
+        return merged
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder():
+    """
+    프로세스(xdist 워커) 단위 LatencyRecorder (HTTP_LATENCY=0이면 None)
+    공용 ApiClient를 다시 만들어도 측정값이 유지되도록 클라이언트와 별도로 보관
+    """
+    global _recorder
+    if os.getenv("HTTP_LATENCY", "1").lower() in ("0", "false", "no"):
+        return None
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = LatencyRecorder()
+    return _recorder
+
+
+def report_dir():
+    return Path(os.getenv("LATENCY_REPORT_DIR") or DEFAULT_REPORT_DIR)
@@ -0,0 +1,413 @@
+import importlib
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from pathlib import Path
+
+import pytest
+from loguru import logger
+from src.utils.latency import PERCENTILES, LatencyHistogram
+
+# JMeter summariser와 같은 기본 출력 간격(초)
+DEFAULT_INTERVAL = 30
+# 보관하는 구간 요약 수 (30초 간격이면 약 8시간, 넘으면 오래된 구간부터 버림)
+DEFAULT_HISTORY = 1000
+# 오류 종류별 집계에 보관하는 최대 종류 수 (메시지에 ID가 들어간 오류가 계속 새 종류로 쌓이지 않도록)
+MAX_ERROR_TYPES = 100
+OTHER_ERRORS = "(기타 오류)"
+# 가상 사용자 수를 조정하는 주기(초)
+_CONTROL_TICK = 0.1
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)([hms])")
+# 테스트 본문에서 발생하면 실패로 집계하는 예외 (pytest.fail/skip/xfail은 Exception 하위가 아님)
+SCENARIO_FAILURES = (Exception, pytest.fail.Exception, pytest.skip.Exception, pytest.xfail.Exception)
+
+
+def _format_elapsed(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def parse_duration(value):
+    """"3600", "90m", "4h", "1h30m" 형식을 초로 변환"""
+    value = str(value).strip().lower()
+    try:
+        seconds = float(value)
+    except ValueError:
+        parts = _DURATION.findall(value)
+        if not parts or "".join(number + unit for number, unit in parts) != value:
+            raise ValueError(f"시간 형식이 아닙니다 (예: 3600, 90m, 4h, 1h30m): {value}") from None
+        seconds = sum(float(number) * {"h": 3600, "m": 60, "s": 1}[unit] for number, unit in parts)
+    if seconds <= 0:
+        raise ValueError(f"시간은 0보다 커야 합니다: {value}")
+    return seconds
+
+
+def write_snapshot(path, data):
+    """집계 결과를 임시 파일에 쓴 뒤 교체 (실행 중 중단되어도 마지막으로 완성된 파일이 남음)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f".{path.name}.tmp")
+    temp.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+    os.replace(temp, path)
+
+
+def describe_failure(scenario, error):
+    """실패 종류별 집계에 쓰는 오류 설명 (시나리오 이름 + 예외 이름 + 메시지 첫 줄)"""
+    message = str(error).strip().splitlines()
+    return f"{scenario.name}: {type(error).__name__}{': ' + message[0][:200] if message else ''}"
+
+
+def load_test_function(node_id):
+    """
+    pytest 노드 ID로 테스트 함수 조회
+    예: "tests/api/test_compute.py::TestComputeCRUD::test_VM006_list_vm"
+    :return: (테스트 클래스 또는 None, 함수)
+    """
+    path, *names = node_id.split("::")
+    if not names or len(names) > 2:
+        raise ValueError(f"노드 ID 형식이 아닙니다 (파일::[클래스::]함수): {node_id}")
+    module = importlib.import_module(Path(path).with_suffix("").as_posix().replace("/", "."))
+    cls = getattr(module, names[0]) if len(names) == 2 else None
+    func = getattr(cls or module, names[-1])
+    return cls, func
+
+
+class TestScenario:
+    """
+    기존 API 테스트 함수 하나를 부하 시나리오로 사용
+
+    - 테스트 함수의 인자 이름으로 fixtures에서 값을 찾아 전달 (pytest fixture 주입과 동일한 규칙)
+    - fixtures 값이 제너레이터 함수면 반복마다 새로 만들고, 반복이 끝나면 나머지를 실행 (yield fixture의 teardown)
+    - 클래스 기반 테스트는 가상 사용자마다 인스턴스 하나를 만들어 재사용
+    """
+
+    # pytest가 이 클래스를 테스트로 수집하지 않도록 지정
+    __test__ = False
+
+    def __init__(self, node_id, fixtures):
+        self.node_id = node_id
+        self.cls, self.func = load_test_function(node_id)
+        self.name = self.func.__name__
+        self.fixtures = fixtures
+        self.params = [name for name in inspect.signature(self.func).parameters if name != "self"]
+        missing = [name for name in self.params if name not in fixtures]
+        if missing:
+            raise ValueError(f"부하 모드에서 제공하지 않는 fixture가 필요한 테스트입니다: {node_id} - {', '.join(missing)}")
+
+    def run(self, instances):
+        """
+        테스트를 한 번 실행 (실패 시 테스트의 예외가 그대로 전달됨)
+        :param instances: 가상 사용자별 {클래스: 인스턴스} 캐시
+        """
+        with ExitStack() as stack:
+            kwargs = {}
+            for name in self.params:
+                value = self.fixtures[name]
+                if inspect.isgeneratorfunction(value):
+                    generator = value()
+                    kwargs[name] = next(generator)
+                    stack.callback(next, generator, None)
+                else:
+                    kwargs[name] = value
+            if self.cls is None:
+                self.func(**kwargs)
+                return
+            if self.cls not in instances:
+                instances[self.cls] = self.cls()
+            self.func(instances[self.cls], **kwargs)
+
+
+class LoadProfile:
+    """
+    가상 사용자 수 변화: ramp_up 동안 0 → users로 선형 증가, hold 동안 유지, ramp_down 동안 users → 0으로 감소
+    """
+
+    def __init__(self, users, ramp_up=0, hold=60, ramp_down=0):
+        self.users = max(1, users)
+        self.ramp_up = max(0, ramp_up)
+        self.hold = max(0, hold)
+        self.ramp_down = max(0, ramp_down)
+
+    @property
+    def duration(self):
+        return self.ramp_up + self.hold + self.ramp_down
+
+    def target_users(self, elapsed):
+        """경과 시간(초)에 실행 중이어야 하는 가상 사용자 수"""
+        if elapsed < 0 or elapsed >= self.duration:
+            return 0
+        if elapsed < self.ramp_up:
+            # JMeter ramp-up과 같이 i번째 사용자는 i * ramp_up / users 시점에 시작
+            return min(self.users, int(self.users * elapsed / self.ramp_up) + 1)
+        down_elapsed = elapsed - self.ramp_up - self.hold
+        if down_elapsed < 0:
+            return self.users
+        return max(0, self.users - int(self.users * down_elapsed / self.ramp_down))
+
+
+class IterationStats:
+    """구간 하나(또는 전체)의 반복 결과 집계"""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+
+    def record(self, elapsed_ms, failed):
+        self.histogram.record(elapsed_ms)
+        if failed:
+            self.errors += 1
+
+    def merge(self, other):
+        self.histogram.merge(other.histogram)
+        self.errors += other.errors
+
+    def to_dict(self):
+        return {"errors": self.errors, "histogram": self.histogram.to_dict()}
+
+    def summary(self, duration):
+        histogram = self.histogram
+        result = {
+            "count": histogram.count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / histogram.count * 100, 2) if histogram.count else 0.0,
+            "throughput": round(histogram.count / duration, 3) if duration > 0 else 0.0,
+        }
+        if histogram.count:
+            result.update(mean_ms=round(histogram.mean, 1), min_ms=round(histogram.min, 1), max_ms=round(histogram.max, 1))
+            result.update({f"p{p}_ms": round(histogram.percentile(p), 1) for p in PERCENTILES})
+        return result
+
+
+class Summariser:
+    """
+    JMeter summariser 형식의 구간/누적 통계 출력
+
+    summary +     61 in 00:00:30 =    2.0/s Avg:   870 Min:   106 Max: 21192 Err:     1 (1.64%) Active: 2 Started: 81 Finished: 79 p90: ... p99: ...
+    summary =     80 in 00:00:41 =    2.0/s Avg:   800 Min:   106 Max: 21192 Err:     1 (1.25%)
+
+    - 응답 시간은 히스토그램으로만 보관하므로 반복 횟수와 관계없이 메모리 사용량이 일정
+    - 구간별 요약(intervals)은 최근 history개, 오류 종류는 MAX_ERROR_TYPES개까지만 보관 (장시간 실행 대비)
+    - rolling > 0이면 최근 rolling개 구간의 히스토그램을 합친 이동 통계도 출력
+    - 시나리오별 전체 통계와 구간별 요약을 report()로 반환
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, label="summary", history=DEFAULT_HISTORY, rolling=0):
+        self.interval = interval
+        self.label = label
+        self._lock = threading.Lock()
+        self._started_at = None
+        self._window_started_at = None
+        self._window = IterationStats()
+        self._total = IterationStats()
+        self._scenarios = {}
+        self._error_types = {}
+        self._recent = deque(maxlen=rolling) if rolling > 0 else None
+        self.intervals = deque(maxlen=history)
+        self.flushed = 0
+
+    def start(self):
+        self._started_at = self._window_started_at = time.monotonic()
+
+    def record(self, scenario, elapsed, error=None):
+        """
+        :param elapsed: 반복 하나의 소요 시간(초)
+        :param error: 실패한 경우 오류 설명
+        """
+        elapsed_ms = elapsed * 1000
+        with self._lock:
+            self._window.record(elapsed_ms, error is not None)
+            self._scenarios.setdefault(scenario, IterationStats()).record(elapsed_ms, error is not None)
+            if error is not None:
+                if error not in self._error_types and len(self._error_types) >= MAX_ERROR_TYPES:
+                    error = OTHER_ERRORS
+                self._error_types[error] = self._error_types.get(error, 0) + 1
+
+    def due(self):
+        return time.monotonic() - self._window_started_at >= self.interval
+
+    def flush(self, active=0, started=0, finished=0):
+        """현재 구간 통계를 출력하고 누적 통계에 합친 뒤 새 구간 시작"""
+        with self._lock:
+            now = time.monotonic()
+            window, self._window = self._window, IterationStats()
+            duration = now - self._window_started_at
+            self._window_started_at = now
+            self._total.merge(window)
+            total_duration = now - self._started_at
+            if self._recent is not None:
+                self._recent.append((duration, window))
+
+        entry = window.summary(duration)
+        entry.update(at=round(total_duration, 1), duration=round(duration, 1), active=active, started=started, finished=finished)
+        with self._lock:
+            self.intervals.append(entry)
+            self.flushed += 1
+        logger.info(
+            f"{self._line('+', window, duration)} Active: {active} Started: {started} Finished: {finished}"
+            f"{self._percentiles(window)}"
+        )
+        logger.info(self._line("=", self._total, total_duration))
+        rolling = self._rolling()
+        if rolling is not None:
+            stats, rolling_duration = rolling
+            logger.info(f"{self._line('~', stats, rolling_duration)}{self._percentiles(stats)} (최근 {len(self._recent)}구간)")
+        return entry
+
+    def _rolling(self):
+        """최근 rolling개 구간을 합친 (IterationStats, 기간) - rolling을 쓰지 않으면 None"""
+        if self._recent is None:
+            return None
+        with self._lock:
+            recent = list(self._recent)
+        stats = IterationStats()
+        for _, window in recent:
+            stats.merge(window)
+        return stats, sum(duration for duration, _ in recent)
+
+    def _line(self, sign, window, duration):
+        histogram = window.histogram
+        count = histogram.count
+        rate = count / duration if duration > 0 else 0.0
+        avg = histogram.mean or 0
+        error_rate = window.errors / count * 100 if count else 0.0
+        return (
+            f"{self.label} {sign} {count:>6} in {_format_elapsed(duration)} = {rate:>6.1f}/s "
+            f"Avg: {avg:>5.0f} Min: {histogram.min or 0:>5.0f} Max: {histogram.max or 0:>5.0f} "
+            f"Err: {window.errors:>5} ({error_rate:.2f}%)"
+        )
+
+    @staticmethod
+    def _percentiles(window):
+        if not window.histogram.count:
+            return ""
+        return "".join(f" p{p}: {window.histogram.percentile(p):.0f}" for p in PERCENTILES if p != 50)
+
+    def report(self, histograms=False):
+        """
+        전체/시나리오별 통계, 오류 종류별 횟수, 최근 구간별 요약
+        :param histograms: True면 병합 가능한 히스토그램 원본(버킷)도 포함 (여러 실행 결과를 합칠 때 사용)
+        """
+        rolling = self._rolling()
+        with self._lock:
+            duration = time.monotonic() - self._started_at
+            total = IterationStats()
+            total.merge(self._total)
+            total.merge(self._window)
+            report = {
+                "duration": round(duration, 1),
+                "total": total.summary(duration),
+                "scenarios": {name: window.summary(duration) for name, window in self._scenarios.items()},
+                "errors": dict(sorted(self._error_types.items(), key=lambda item: -item[1])),
+                "intervals": list(self.intervals),
+                "interval_count": self.flushed,
+            }
+            if rolling is not None:
+                stats, rolling_duration = rolling
+                report["rolling"] = {"intervals": len(self._recent), **stats.summary(rolling_duration)}
+            if histograms:
+                report["histograms"] = {
+                    "total": total.to_dict(),
+                    "scenarios": {name: window.to_dict() for name, window in self._scenarios.items()},
+                }
+            return report
+
+
+class LoadRunner:
+    """
+    테스트 시나리오를 가상 사용자(스레드)로 반복 실행하는 closed-model 부하 실행기
+
+    - 가상 사용자는 시나리오 목록을 순서대로(사용자마다 시작 위치를 달리해) 반복 실행
+    - LoadProfile에 따라 사용자를 시작/종료하며, 종료는 진행 중인 반복이 끝난 뒤 적용
+    - interval초마다 JMeter 형식의 구간 통계 출력, 출력 후 on_flush(summariser) 호출 (중간 결과 저장 등)
+    """
+
+    def __init__(self, scenarios, profile, interval=DEFAULT_INTERVAL, think_time=0.0, summariser=None, on_flush=None):
+        if not scenarios:
+            raise ValueError("부하 시나리오가 없습니다")
+        self.scenarios = list(scenarios)
+        self.profile = profile
+        self.think_time = think_time
+        self.summariser = summariser or Summariser(interval)
+        self.on_flush = on_flush
+        self._users = []
+        self._lock = threading.Lock()
+        self.started = 0
+        self.finished = 0
+
+    def _user(self, index, stop):
+        instances = {}
+        position = index
+        try:
+            while not stop.is_set():
+                scenario = self.scenarios[position % len(self.scenarios)]
+                position += 1
+                started = time.perf_counter()
+                error = None
+                try:
+                    scenario.run(instances)
+                except SCENARIO_FAILURES as e:
+                    error = describe_failure(scenario, e)
+                self.summariser.record(scenario.name, time.perf_counter() - started, error)
+                if self.think_time > 0:
+                    stop.wait(self.think_time)
+        finally:
+            with self._lock:
+                self.finished += 1
+
+    def _active(self):
+        return [user for user in self._users if not user[1].is_set()]
+
+    def _scale(self, target):
+        active = self._active()
+        for _ in range(target - len(active)):
+            stop = threading.Event()
+            thread = threading.Thread(target=self._user, args=(self.started, stop), name=f"vu-{self.started + 1}", daemon=True)
+            self._users.append((thread, stop))
+            with self._lock:
+                self.started += 1
+            thread.start()
+        # 가장 나중에 시작한 사용자부터 종료
+        for _, stop in reversed(active[target:]):
+            stop.set()
+
+    def _flush(self):
+        entry = self.summariser.flush(
+            active=sum(1 for thread, _ in self._users if thread.is_alive()),
+            started=self.started, finished=self.finished,
+        )
+        if self.on_flush is not None:
+            try:
+                self.on_flush(self.summariser)
+            except Exception:
+                logger.exception("⛔ 구간 통계 후처리 실패")
+        return entry
+
+    def run(self):
+        """부하를 끝까지 실행하고 Summariser.report() 결과를 반환"""
+        profile = self.profile
+        logger.info(
+            f"🚀 부하 시작: 시나리오 {len({scenario.node_id for scenario in self.scenarios})}개 / 가상 사용자 {profile.users}명 "
+            f"(ramp-up {profile.ramp_up}s, hold {profile.hold}s, ramp-down {profile.ramp_down}s)"
+        )
+        self.summariser.start()
+        started_at = time.monotonic()
+        try:
+            while True:
+                elapsed = time.monotonic() - started_at
+                if elapsed >= profile.duration:
+                    break
+                self._scale(profile.target_users(elapsed))
+                if self.summariser.due():
+                    self._flush()
+                time.sleep(_CONTROL_TICK)
+        finally:
+            self._scale(0)
+            for thread, _ in self._users:
+                thread.join()
+            self._flush()
+        return self.summariser.report()
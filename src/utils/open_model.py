@@ -0,0 +1,132 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+from src.utils.load import DEFAULT_INTERVAL, SCENARIO_FAILURES, IterationStats, Summariser, describe_failure
+
+# 동시에 실행할 수 있는 최대 요청(시나리오) 수 - 넘으면 실행 대기열에서 기다리며, 그 시간도 응답 시간에 포함됨
+DEFAULT_MAX_IN_FLIGHT = 50
+ARRIVALS = ("constant", "poisson")
+
+
+class OpenModelGenerator:
+    """
+    도착률 고정(open-model) 부하 생성기
+
+    - 응답 시간과 무관하게 초당 rate건씩 예정된 시각에 시나리오를 시작 (closed-model처럼 느린 응답이 다음 요청을 늦추지 않음)
+    - 응답 시간을 실제 시작 시각이 아닌 예정 시각부터 측정해 coordinated omission을 보정
+      (서버가 느려져 실행 대기열이 쌓이면 그 대기 시간도 응답 시간에 포함)
+    - 보정값(corrected)으로 구간 통계를 출력하고, 보정 전(uncorrected) 분위수와 시작 지연을 함께 보고
+    - 블로킹 HTTP 클라이언트는 스레드 풀에서 실행 (asyncio는 일정 관리만 담당)
+    """
+
+    def __init__(self, scenarios, rate, duration, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                 interval=DEFAULT_INTERVAL, arrival="constant"):
+        if not scenarios:
+            raise ValueError("부하 시나리오가 없습니다")
+        if rate <= 0:
+            raise ValueError(f"도착률은 0보다 커야 합니다: {rate}")
+        if arrival not in ARRIVALS:
+            raise ValueError(f"지원하지 않는 도착 분포입니다: {arrival} ({', '.join(ARRIVALS)})")
+        self.scenarios = list(scenarios)
+        self.rate = rate
+        self.duration = duration
+        self.max_in_flight = max_in_flight
+        self.arrival = arrival
+        self.summariser = Summariser(interval)
+        self._uncorrected = IterationStats()
+        self._lag = IterationStats()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.scheduled = 0
+        self.in_flight = 0
+        self.completed = 0
+
+    def _arrival_times(self):
+        """시작 시점 기준 예정 시각(초) 제너레이터"""
+        at = 0.0
+        index = 0
+        while at < self.duration:
+            yield at
+            index += 1
+            at = index / self.rate if self.arrival == "constant" else at + random.expovariate(self.rate)
+
+    def _execute(self, scenario):
+        """스레드 풀에서 시나리오 한 번 실행 :return: (실제 시작 시각, 오류)"""
+        started = time.monotonic()
+        instances = getattr(self._local, "instances", None)
+        if instances is None:
+            instances = self._local.instances = {}
+        try:
+            scenario.run(instances)
+        except SCENARIO_FAILURES as e:
+            return started, describe_failure(scenario, e)
+        return started, None
+
+    async def _fire(self, loop, executor, scenario, intended):
+        with self._lock:
+            self.in_flight += 1
+        try:
+            started, error = await loop.run_in_executor(executor, self._execute, scenario)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+        finished = time.monotonic()
+        self.summariser.record(scenario.name, finished - intended, error)
+        with self._lock:
+            self._uncorrected.record((finished - started) * 1000, error is not None)
+            self._lag.record((started - intended) * 1000, False)
+
+    def _flush(self):
+        with self._lock:
+            in_flight, scheduled, completed = self.in_flight, self.scheduled, self.completed
+        return self.summariser.flush(active=in_flight, started=scheduled, finished=completed)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        tasks = set()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="arrival") as executor:
+            started_at = time.monotonic()
+            self.summariser.start()
+            for index, offset in enumerate(self._arrival_times()):
+                intended = started_at + offset
+                delay = intended - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if self.summariser.due():
+                    self._flush()
+                self.scheduled += 1
+                task = asyncio.ensure_future(self._fire(loop, executor, self.scenarios[index % len(self.scenarios)], intended))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            # 예정된 요청을 모두 보낸 뒤 남은 응답을 기다리는 동안에도 구간 통계 출력
+            while tasks:
+                await asyncio.wait(set(tasks), timeout=max(0.1, self.summariser.interval / 10))
+                if tasks and self.summariser.due():
+                    self._flush()
+        self._flush()
+
+    def run(self):
+        """부하를 끝까지 실행하고 결과를 반환 (Summariser.report() + 보정 전 통계 + 시작 지연)"""
+        logger.info(
+            f"🚀 open-model 부하 시작: 시나리오 {len(self.scenarios)}개 / 초당 {self.rate:g}건({self.arrival}) "
+            f"/ {self.duration:g}초 / 최대 동시 실행 {self.max_in_flight}"
+        )
+        asyncio.run(self._run())
+        report = self.summariser.report()
+        duration = report["duration"]
+        report["model"] = "open"
+        report["target_rate"] = self.rate
+        report["uncorrected"] = self._uncorrected.summary(duration)
+        report["schedule_lag"] = self._lag.summary(duration)
+        lag = report["schedule_lag"]
+        if lag.get("p99_ms", 0) > 1000 / self.rate:
+            logger.warning(
+                f"⚠️ 예정 시각보다 늦게 시작한 요청이 많습니다 (시작 지연 p99 {lag['p99_ms']:.0f}ms) "
+                f"- 서버가 도착률을 따라가지 못하거나 --max-in-flight가 부족합니다"
+            )
+        return report
@@ -0,0 +1,81 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+from src.utils.http_client import get_client
+
+# 한 페이지에 요청할 항목 수 (skip/count 페이지네이션)
+DEFAULT_PAGE_SIZE = 50
+
+
+def iter_pages(url, headers, page_size=DEFAULT_PAGE_SIZE, params=None, client=None, prefetch=True):
+    """
+    skip/count 페이지네이션 목록을 페이지 단위로 반환하는 제너레이터
+
+    - prefetch=True면 현재 페이지를 처리하는 동안 다음 페이지를 백그라운드에서 미리 조회
+    - 호출부가 중간에 순회를 멈추면(break/close) 더 이상 페이지를 조회하지 않음
+    - 응답 코드가 200이 아니면 requests.HTTPError 발생
+
+    :param params: skip/count 외에 함께 보낼 쿼리 파라미터 (예: filter_name_like)
+    :return: [item, ...] 제너레이터
+    """
+    client = client or get_client()
+    base_params = dict(params or {})
+
+    def _fetch(skip):
+        response = client.get(url, headers=headers, params={**base_params, "skip": skip, "count": page_size})
+        response.raise_for_status()
+        page = response.json()
+        if not isinstance(page, list):
+            raise ValueError(f"목록 응답이 아닙니다: {url} - {page}")
+        return page
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending = None
+    try:
+        skip = 0
+        page = _fetch(skip)
+        previous_first = None
+        while page:
+            # skip을 무시하는 엔드포인트에서 같은 페이지를 무한히 받지 않도록 방지
+            first = page[0].get("id") if isinstance(page[0], dict) else None
+            if first is not None and first == previous_first:
+                logger.warning(f"⚠️ 이전 페이지와 같은 응답 - skip 미지원으로 보고 중단: {url}")
+                return
+            previous_first = first
+
+            has_next = len(page) >= page_size
+            if has_next and executor:
+                # 미리 조회하는 스레드도 호출한 테스트의 deadline을 따름
+                pending = executor.submit(contextvars.copy_context().run, _fetch, skip + page_size)
+            yield page
+            if not has_next:
+                return
+            skip += page_size
+            if pending is not None:
+                page, pending = pending.result(), None
+            else:
+                page = _fetch(skip)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor:
+            executor.shutdown(wait=False)
+
+
+def paginate(url, headers, page_size=DEFAULT_PAGE_SIZE, params=None, client=None, prefetch=True):
+    """목록의 항목을 하나씩 지연 반환 (필요한 만큼만 페이지를 조회)"""
+    for page in iter_pages(url, headers, page_size, params, client, prefetch):
+        yield from page
+
+
+def find_first(url, headers, predicate, page_size=DEFAULT_PAGE_SIZE, params=None, client=None):
+    """
+    predicate를 만족하는 첫 항목을 반환하고 이후 페이지는 조회하지 않음
+    :return: 항목 dict 또는 None
+    """
+    items = paginate(url, headers, page_size, params, client)
+    try:
+        return next((item for item in items if predicate(item)), None)
+    finally:
+        items.close()
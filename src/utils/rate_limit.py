@@ -0,0 +1,174 @@
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from loguru import logger
+from src.utils import deadline
+from src.utils.file_lock import FileLock
+
+# 모든 xdist 워커가 공유하는 상태 파일 디렉터리 (엔드포인트 계열별 파일 하나)
+DEFAULT_STATE_DIR = Path(__file__).resolve().parents[2] / ".rate_limit"
+# 요청 경로로 구분하는 엔드포인트 계열 (앞에서부터 먼저 일치하는 계열 사용)
+ENDPOINT_FAMILIES = ("compute", "block_storage", "network", "object_storage", "infra")
+# 계열별 허용 버스트(연속 요청 수)
+DEFAULT_BURST = 1
+# 동시 요청 슬롯을 기다리는 최대 시간(초)
+DEFAULT_SLOT_TIMEOUT = 300
+# 슬롯 파일이 이 시간(초)보다 오래되면 비정상 종료한 워커가 남긴 것으로 보고 회수 (요청 타임아웃보다 충분히 길게)
+SLOT_STALE_AFTER = 600
+# 모든 슬롯이 사용 중일 때 다시 확인하는 간격(초)
+_SLOT_POLL_INTERVAL = 0.005
+# 경로에서 리소스 ID로 보고 {id}로 바꾸는 세그먼트 (UUID 또는 숫자)
+_ID_SEGMENT = re.compile(r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)$")
+
+
+def endpoint_family(url):
+    """URL 경로에 포함된 서비스 이름으로 엔드포인트 계열 결정 (없으면 "default")"""
+    segments = urlsplit(url).path.split("/")
+    for family in ENDPOINT_FAMILIES:
+        if family in segments:
+            return family
+    return "default"
+
+
+def template_path(url):
+    """URL 경로의 리소스 ID를 {id}로 바꾼 엔드포인트 템플릿 (예: /api/user/resource/compute/{id})"""
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in urlsplit(url).path.split("/"))
+
+
+def _parse_limits(value):
+    """"network=5,compute=2" 형식을 {계열: 초당 요청 수}로 변환"""
+    limits = {}
+    for part in (value or "").split(","):
+        if "=" in part:
+            family, rate = part.split("=", 1)
+            limits[family.strip()] = float(rate)
+    return limits
+
+
+class SharedRateLimiter:
+    """
+    엔드포인트 계열별 토큰 버킷 속도 제한 (xdist 워커 간 공유)
+
+    - 버킷 상태(다음 요청 가능 시각)를 계열별 파일에 저장하고 FileLock으로 갱신하므로
+      워커 수와 관계없이 전체 요청 속도가 설정값을 넘지 않음
+    - 요청마다 슬롯을 예약하고, 예약 시각까지는 락 밖에서 대기 (GCRA 방식)
+    - max_in_flight는 모든 워커 합산 계열별 동시 요청 수 제한
+      (계열별 max_in_flight개의 슬롯 파일 중 하나를 요청 동안 점유하고, 모두 사용 중이면 빌 때까지 대기)
+    """
+
+    def __init__(self, default_rate=0, limits=None, burst=DEFAULT_BURST, max_in_flight=0, state_dir=None,
+                 slot_timeout=DEFAULT_SLOT_TIMEOUT):
+        self.default_rate = default_rate
+        self.limits = limits or {}
+        self.burst = max(1, burst)
+        self.max_in_flight = max_in_flight
+        self.slot_timeout = slot_timeout
+        self.state_dir = Path(state_dir or DEFAULT_STATE_DIR)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 계열별 지표: 요청 수, 대기한 요청 수, 총 대기 시간, 최대 대기 시간
+        self.metrics = {}
+
+    @classmethod
+    def from_env(cls):
+        """
+        RATE_LIMIT_RPS(전체 기본값) 또는 RATE_LIMITS(계열별)가 설정된 경우에만 생성 (기본: 비활성화)
+        RATE_LIMIT_BURST, RATE_LIMIT_MAX_IN_FLIGHT, RATE_LIMIT_STATE_DIR로 세부 설정
+        """
+        default_rate = float(os.getenv("RATE_LIMIT_RPS", "0"))
+        limits = _parse_limits(os.getenv("RATE_LIMITS"))
+        max_in_flight = int(os.getenv("RATE_LIMIT_MAX_IN_FLIGHT", "0"))
+        if default_rate <= 0 and not limits and max_in_flight <= 0:
+            return None
+        return cls(
+            default_rate=default_rate,
+            limits=limits,
+            burst=int(os.getenv("RATE_LIMIT_BURST", DEFAULT_BURST)),
+            max_in_flight=max_in_flight,
+            state_dir=os.getenv("RATE_LIMIT_STATE_DIR"),
+        )
+
+    def rate_for(self, family):
+        return self.limits.get(family, self.default_rate)
+
+    def _reserve(self, family, rate):
+        """다음 요청 가능 시각을 예약하고 대기해야 할 시간(초)을 반환"""
+        interval = 1.0 / rate
+        tolerance = (self.burst - 1) * interval
+        path = self.state_dir / f"{family}.state"
+        with FileLock(f"{path}.lock", timeout=30, stale_after=5, poll_interval=0.001):
+            now = time.time()
+            try:
+                tat = float(path.read_text())
+            except (FileNotFoundError, ValueError):
+                tat = now
+            tat = max(tat, now)
+            path.write_text(repr(tat + interval))
+        return max(0.0, tat - tolerance - now)
+
+    def _acquire_in_flight(self, family):
+        """
+        계열별 슬롯 파일 중 비어 있는 하나를 점유해 반환 (모두 사용 중이면 빌 때까지 대기)
+        대기는 slot_timeout과 테스트 deadline 중 먼저 오는 시점까지 (deadline이 먼저면 DeadlineExceeded)
+        """
+        locks = [
+            FileLock(self.state_dir / f"{family}.slot{i}", stale_after=SLOT_STALE_AFTER)
+            for i in range(self.max_in_flight)
+        ]
+        # 워커들이 같은 슬롯부터 경쟁하지 않도록 시작 위치를 섞음
+        offset = random.randrange(len(locks))
+        locks = locks[offset:] + locks[:offset]
+        give_up_at = time.time() + self.slot_timeout
+        while True:
+            for lock in locks:
+                if lock.try_acquire():
+                    return lock
+            deadline.check(f"동시 요청 슬롯 대기 중 [{family}]")
+            if time.time() > give_up_at:
+                raise TimeoutError(f"동시 요청 슬롯 대기 시간 초과 [{family}] (최대 {self.max_in_flight}개)")
+            left = deadline.remaining()
+            time.sleep(_SLOT_POLL_INTERVAL if left is None else max(0.0, min(_SLOT_POLL_INTERVAL, left)))
+
+    def _record(self, family, waited):
+        with self._lock:
+            entry = self.metrics.setdefault(family, {"requests": 0, "throttled": 0, "wait": 0.0, "max_wait": 0.0})
+            entry["requests"] += 1
+            if waited > 0.001:
+                entry["throttled"] += 1
+                entry["wait"] += waited
+                entry["max_wait"] = max(entry["max_wait"], waited)
+
+    @contextmanager
+    def slot(self, url, family=None):
+        """
+        요청 하나를 보내는 동안 유지하는 슬롯 (속도 제한 대기 + 동시 요청 수 제한)
+        :param family: 제한을 적용할 계열 (기본값: url 경로로 결정)
+        """
+        family = family or endpoint_family(url)
+        started = time.time()
+        in_flight = self._acquire_in_flight(family) if self.max_in_flight > 0 else None
+        try:
+            rate = self.rate_for(family)
+            if rate > 0:
+                delay = self._reserve(family, rate)
+                if delay > 0:
+                    # 예약 시각이 deadline 이후면 마감까지만 기다리고 DeadlineExceeded
+                    deadline.sleep(delay)
+            self._record(family, time.time() - started)
+            yield
+        finally:
+            if in_flight is not None:
+                in_flight.release()
+
+    def log_stats(self):
+        for family, entry in sorted(self.metrics.items()):
+            logger.info(
+                f"🚦 속도 제한 통계 [{family}] 요청 {entry['requests']}회 / 대기 {entry['throttled']}회 / "
+                f"총 대기 {entry['wait']:.1f}초 / 최대 대기 {entry['max_wait']:.2f}초"
+            )
@@ -0,0 +1,136 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from loguru import logger
+from src.utils.file_lock import FileLock
+from src.utils.http_client import get_client
+
+# 참조 데이터 종류별 조회 경로 (base_url_infra 기준)
+REFERENCE_ENDPOINTS = {
+    "region": "/region",
+    "zone": "/infra/zone",
+    "instance_type": "/infra/instance_type",
+    "block_storage_image": "/infra/block_storage_image",
+}
+# 프로젝트 루트의 캐시 파일 (모든 xdist 워커와 이후 실행이 공유)
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / ".reference_cache.json"
+# 디스크 캐시 유효 시간(초), 0이면 디스크 캐시를 사용하지 않음
+DEFAULT_CACHE_TTL = 3600
+
+
+class ReferenceData:
+    """
+    region/zone/instance_type/block_storage_image 목록의 인메모리 인덱스
+    - id, name, region_id 기준 조회를 dict 조회 한 번으로 처리
+    """
+
+    def __init__(self, data, fetched_at=None):
+        self.data = data
+        self.fetched_at = fetched_at or time.time()
+        self._by_id = {}
+        self._by_name = {}
+        self._by_region = {}
+        for kind, items in data.items():
+            self._by_id[kind] = {item["id"]: item for item in items if "id" in item}
+            self._by_name[kind] = {}
+            self._by_region[kind] = {}
+            for item in items:
+                if item.get("name") is not None:
+                    self._by_name[kind].setdefault(item["name"], item)
+                if item.get("region_id") is not None:
+                    self._by_region[kind].setdefault(item["region_id"], []).append(item)
+
+    def all(self, kind):
+        return self.data.get(kind, [])
+
+    def get(self, kind, key):
+        """id 또는 name으로 항목 조회 (없으면 None)"""
+        return self._by_id.get(kind, {}).get(key) or self._by_name.get(kind, {}).get(key)
+
+    def in_region(self, kind, region_id):
+        return self._by_region.get(kind, {}).get(region_id, [])
+
+    def zone(self, key):
+        return self.get("zone", key)
+
+    def instance_type(self, key):
+        return self.get("instance_type", key)
+
+    def zone_id(self, preferred=None):
+        """
+        사용할 zone id 반환
+        preferred(id 또는 name)가 존재하면 그 zone, 없으면 첫 번째 zone
+        """
+        zone = self.zone(preferred) if preferred else None
+        if zone is None:
+            zones = self.all("zone")
+            if not zones:
+                raise LookupError("조회 가능한 zone이 없습니다.")
+            if preferred:
+                logger.warning(f"⚠️ zone '{preferred}'을(를) 찾을 수 없어 첫 번째 zone 사용: {zones[0].get('name')}")
+            zone = zones[0]
+        return zone["id"]
+
+
+def _cache_path():
+    return Path(os.getenv("REFERENCE_CACHE_PATH", DEFAULT_CACHE_PATH))
+
+
+def _cache_ttl():
+    return int(os.getenv("REFERENCE_CACHE_TTL", DEFAULT_CACHE_TTL))
+
+
+def _read_cache(path, base_url):
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if entry.get("base_url") != base_url or entry.get("fetched_at", 0) + _cache_ttl() < time.time():
+        return None
+    return entry
+
+
+def _write_cache(path, base_url, data):
+    entry = {"base_url": base_url, "fetched_at": time.time(), "data": data}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
+    return entry
+
+
+def fetch_reference_data(base_url_infra, headers, client=None):
+    """참조 데이터 목록을 동시에 조회 :return: {kind: [item, ...]}"""
+    client = client or get_client()
+
+    def _fetch(kind):
+        response = client.get(f"{base_url_infra}{REFERENCE_ENDPOINTS[kind]}", headers=headers)
+        assert response.status_code == 200, f"⛔ [FAIL] 참조 데이터 조회 실패 ({kind}) - {response.status_code}: {response.text}"
+        return kind, response.json()
+
+    with ThreadPoolExecutor(max_workers=len(REFERENCE_ENDPOINTS)) as executor:
+        return dict(executor.map(_fetch, REFERENCE_ENDPOINTS))
+
+
+def load_reference_data(base_url_infra, headers, client=None):
+    """
+    참조 데이터를 디스크 캐시에서 읽거나, 없거나 만료되었으면 조회 후 캐시에 저장
+    조회는 파일 락 안에서 수행하므로 여러 워커가 동시에 시작해도 한 번만 일어남
+    """
+    if _cache_ttl() <= 0:
+        return ReferenceData(fetch_reference_data(base_url_infra, headers, client))
+
+    path = _cache_path()
+    entry = _read_cache(path, base_url_infra)
+    if entry is None:
+        with FileLock(f"{path}.lock"):
+            # 락을 기다리는 동안 다른 워커가 이미 저장했을 수 있으므로 다시 확인
+            entry = _read_cache(path, base_url_infra)
+            if entry is None:
+                logger.info("📚 참조 데이터(region/zone/instance_type/image) 조회")
+                entry = _write_cache(path, base_url_infra, fetch_reference_data(base_url_infra, headers, client))
+    return ReferenceData(entry["data"], entry["fetched_at"])
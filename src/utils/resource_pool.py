@@ -0,0 +1,138 @@
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from loguru import logger
+from src.utils.api_util import wait_for_status, wait_for_statuses
+from src.utils.http_client import get_client
+from src.utils.teardown import delete_in_dependency_order
+
+# 리소스 종류별로 미리 만들어 둘 개수 (xdist 워커 단위)
+DEFAULT_POOL_SIZE = 1
+# 풀이 모두 대여 중일 때 반납을 기다리는 최대 시간(초)
+DEFAULT_LEASE_TIMEOUT = 300
+
+
+class ResourcePool:
+    """
+    읽기 전용 테스트에 대여해 주는 사전 생성 리소스 풀
+
+    - register()로 리소스 종류(생성 URL, payload 생성 함수, 준비 상태)를 등록
+    - provision()에서 모든 종류를 동시에 생성하고 준비 상태까지 한 번에 대기
+    - lease()로 테스트 동안 독점 대여 후 반납, teardown()에서 의존 관계 순서로 삭제
+      (Janitor를 넘기면 삭제를 큐에 넣어, 풀 리소스를 참조하는 지연 삭제 작업이 끝난 뒤 삭제)
+    """
+
+    def __init__(self, headers, client=None, size=None):
+        self.headers = headers
+        self.client = client or get_client()
+        self.size = size or int(os.getenv("RESOURCE_POOL_SIZE", DEFAULT_POOL_SIZE))
+        self._specs = {}
+        self._available = {}
+        self._created = []
+
+    def register(self, kind, url, payload_factory, ready_status=None, status_url=None):
+        """
+        :param kind: 풀 키 (예: "bucket", "user")
+        :param url: 생성/삭제 기준 URL
+        :param payload_factory: 매번 새 payload(dict)를 반환하는 함수
+        :param ready_status: 대여 전에 기다릴 상태 (None이면 대기하지 않음)
+        :param status_url: 상태 조회 기준 URL (기본값: url)
+        """
+        self._specs[kind] = {
+            "url": url,
+            "payload_factory": payload_factory,
+            "ready_status": ready_status,
+            "status_url": status_url or url,
+        }
+        self._available[kind] = queue.Queue()
+
+    def _create(self, kind):
+        spec = self._specs[kind]
+        payload = spec["payload_factory"]()
+        response = self.client.post(spec["url"], headers=self.headers, json=payload)
+        assert response.status_code == 200, f"⛔ [FAIL] 풀 리소스 생성 실패 ({kind}): {response.text}"
+        resource = {"id": response.json()["id"], "name": payload["name"]}
+        self._created.append({"kind": kind, "url": spec["url"], "payload": payload, **resource})
+        return kind, resource
+
+    def provision(self):
+        jobs = [kind for kind in self._specs for _ in range(self.size)]
+        if not jobs:
+            return
+        logger.info(f"🏊 리소스 풀 사전 생성 시작 ({', '.join(self._specs)} x {self.size})")
+        try:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                created = list(executor.map(self._create, jobs))
+            self._wait_ready(created)
+        except Exception:
+            # 일부만 생성되었거나 준비 대기 중 실패(CircuitOpenError, DeadlineExceeded 등)한 경우에도 남김없이 정리
+            self.teardown()
+            raise
+
+        for kind, resource in created:
+            self._available[kind].put(resource)
+
+    def _wait_ready(self, created):
+        """준비 상태가 필요한 리소스를 한 번에 동시 대기 (하나라도 준비되지 않으면 AssertionError)"""
+        targets = []
+        for kind, resource in created:
+            ready_status = self._specs[kind]["ready_status"]
+            if ready_status:
+                targets.append((f"{self._specs[kind]['status_url']}/{resource['id']}", ready_status))
+        if not targets:
+            return
+        results = wait_for_statuses(targets, self.headers, client=self.client)
+        not_ready = [
+            f"{result.url} (기대: {result.expected_status}, 관측: {result.transitions[-1][1] if result.transitions else '없음'})"
+            for result in results if not result
+        ]
+        assert not not_ready, f"⛔ [FAIL] 풀 리소스가 준비 상태가 되지 않음: {', '.join(not_ready)}"
+
+    @contextmanager
+    def lease(self, kind, timeout=DEFAULT_LEASE_TIMEOUT):
+        """테스트 동안 리소스를 독점 대여하고 종료 시 반납"""
+        resource = self._available[kind].get(timeout=timeout)
+        try:
+            yield resource
+        finally:
+            self._available[kind].put(resource)
+
+    def _delete(self, resource):
+        url = f"{resource['url']}/{resource['id']}"
+        try:
+            response = self.client.delete(url, headers=self.headers)
+        except Exception:
+            logger.exception(f"Teardown 실패: 풀 리소스 {resource['kind']} {resource['id']} 삭제 중 에러 발생")
+            return False
+        if response.status_code not in (200, 404):
+            logger.error(f"Teardown 실패: 풀 리소스 {resource['kind']} {resource['id']} - {response.status_code}: {response.text}")
+            return False
+        return True
+
+    def _wait_deleted(self, resource):
+        status_url = self._specs[resource["kind"]]["status_url"]
+        return wait_for_status(f"{status_url}/{resource['id']}", self.headers, expected_status="deleted", client=self.client)
+
+    def teardown(self, janitor=None):
+        """
+        생성한 풀 리소스 삭제
+        :param janitor: 지연 정리 모드의 Janitor - 풀 리소스를 참조하는 작업(예: user_grant 삭제)이 큐에 남아 있으면
+                        그 작업이 끝난 뒤 삭제하고, 삭제 완료(deleted)까지 확인 (결과는 janitor.drain()에서 보고)
+        """
+        if not self._created:
+            return
+        logger.info(f"🧹 리소스 풀 정리 ({len(self._created)}건)")
+        created, self._created = self._created, []
+        if janitor is None:
+            delete_in_dependency_order(created, self._delete, self._wait_deleted)
+            return
+        for resource in created:
+            janitor.submit(
+                f"풀 리소스 {resource['kind']} {resource['name']} ({resource['url']}/{resource['id']})",
+                lambda resource=resource: self._delete(resource),
+                wait_deleted=lambda resource=resource: self._wait_deleted(resource),
+                resource_id=resource["id"],
+                references=[v for v in resource["payload"].values() if isinstance(v, str)],
+            )
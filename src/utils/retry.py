@@ -0,0 +1,100 @@
+import os
+import random
+import threading
+import time
+from collections import deque
+
+from loguru import logger
+
+# 요청당 최대 시도 횟수 (1이면 재시도 안 함)
+DEFAULT_MAX_ATTEMPTS = 3
+# 지수 백오프 기준/상한(초) - 실제 대기는 0 ~ min(상한, 기준 * 2^n) 사이 임의 값 (full jitter)
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_CAP = 5.0
+# 테스트 하나에서 허용하는 전체 재시도 횟수
+DEFAULT_BUDGET_PER_TEST = 10
+# 일시적 장애로 보고 재시도하는 응답 코드
+DEFAULT_RETRY_STATUSES = (502, 503, 504)
+# 재전송해도 결과가 같은 메서드
+# DELETE는 두 번째 삭제가 409를 반환하는 API라 기본 대상에서 제외
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+# 이 헤더가 있으면 POST/PATCH 등도 재시도 대상
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+# 보관하는 재시도 기록 수 (begin_test 없이 계속 실행되는 부하/소크 테스트에서 무한히 쌓이지 않도록)
+MAX_EVENTS = 200
+
+
+class RetryPolicy:
+    """
+    요청 단위 재시도 정책 (테스트 전체 재실행 대신 실패한 요청만 재전송)
+
+    - 멱등 메서드 또는 Idempotency-Key 헤더가 있는 요청만 재시도
+    - 연결 오류/타임아웃/502·503·504에서 jitter가 적용된 지수 백오프로 재시도
+    - 테스트별 재시도 예산을 넘으면 더 이상 재시도하지 않음
+    - 모든 재시도를 기록해 테스트 리포트에 남김 (begin_test / drain_events)
+    """
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, backoff_base=DEFAULT_BACKOFF_BASE,
+                 backoff_cap=DEFAULT_BACKOFF_CAP, budget_per_test=DEFAULT_BUDGET_PER_TEST,
+                 retry_statuses=DEFAULT_RETRY_STATUSES):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.budget_per_test = budget_per_test
+        self.retry_statuses = tuple(retry_statuses)
+        self._lock = threading.Lock()
+        self._budget = budget_per_test
+        self._events = deque(maxlen=MAX_EVENTS)
+        self.total_retries = 0
+
+    @classmethod
+    def from_env(cls):
+        """RETRY_MAX_ATTEMPTS=1이면 None (재시도 비활성화)"""
+        max_attempts = int(os.getenv("RETRY_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS))
+        if max_attempts <= 1:
+            return None
+        statuses = os.getenv("RETRY_STATUSES")
+        return cls(
+            max_attempts=max_attempts,
+            backoff_base=float(os.getenv("RETRY_BACKOFF_BASE", DEFAULT_BACKOFF_BASE)),
+            backoff_cap=float(os.getenv("RETRY_BACKOFF_CAP", DEFAULT_BACKOFF_CAP)),
+            budget_per_test=int(os.getenv("RETRY_BUDGET_PER_TEST", DEFAULT_BUDGET_PER_TEST)),
+            retry_statuses=[int(s) for s in statuses.split(",")] if statuses else DEFAULT_RETRY_STATUSES,
+        )
+
+    @staticmethod
+    def is_idempotent(method, headers):
+        return method.upper() in IDEMPOTENT_METHODS or bool(headers and headers.get(IDEMPOTENCY_HEADER))
+
+    def should_retry(self, method, headers, attempt):
+        """재시도 가능 여부를 판단하고, 가능하면 테스트 예산에서 1회 차감"""
+        if attempt >= self.max_attempts or not self.is_idempotent(method, headers):
+            return False
+        with self._lock:
+            if self._budget <= 0:
+                logger.warning("⚠️ 테스트 재시도 예산 소진 - 더 이상 재시도하지 않음")
+                return False
+            self._budget -= 1
+        return True
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+
+    def record(self, method, url, attempt, reason, delay):
+        logger.warning(f"🔁 요청 재시도 {attempt}/{self.max_attempts - 1} ({reason}, {delay:.2f}초 후): {method} {url}")
+        with self._lock:
+            self.total_retries += 1
+            self._events.append(f"{time.strftime('%H:%M:%S')} {method} {url} - {reason} → 재시도 #{attempt} ({delay:.2f}초 대기)")
+
+    def begin_test(self):
+        """테스트 시작 시 재시도 예산과 기록 초기화"""
+        with self._lock:
+            self._budget = self.budget_per_test
+            self._events.clear()
+
+    def drain_events(self):
+        """지금까지 기록된 재시도 목록을 반환하고 비움"""
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
@@ -0,0 +1,92 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from loguru import logger
+
+# 동시에 진행할 최대 삭제 요청 수
+MAX_TEARDOWN_WORKERS = 8
+
+
+def build_dependency_graph(resources):
+    """
+    생성 payload를 기준으로 리소스 간 의존 관계를 계산
+    payload 값 중 다른 생성 리소스의 id와 같은 값이 있으면 그 리소스에 의존하는 것으로 간주
+    (예: NIC.attached_subnet_id → 서브넷, 서브넷.attached_network_id → 가상 네트워크,
+         user_grant.object_storage_id / object_storage_user_id → 버킷 / 사용자)
+
+    :param resources: [{"id": ..., "payload": {...}, ...}, ...]
+    :return: {index: {의존 대상 index, ...}}
+    """
+    index_by_id = {resource["id"]: idx for idx, resource in enumerate(resources)}
+    depends_on = {idx: set() for idx in range(len(resources))}
+    for idx, resource in enumerate(resources):
+        for value in (resource.get("payload") or {}).values():
+            target = index_by_id.get(value) if isinstance(value, str) else None
+            if target is not None and target != idx:
+                depends_on[idx].add(target)
+    return depends_on
+
+
+def deletion_order(depends_on):
+    """
+    의존하는 쪽이 먼저 오도록 정렬한 삭제 순서(index 목록)
+    (순환 의존이 있으면 남은 리소스는 원래 순서대로 뒤에 붙임)
+    """
+    pending_dependents = {idx: 0 for idx in depends_on}
+    for targets in depends_on.values():
+        for target in targets:
+            pending_dependents[target] += 1
+
+    order = []
+    ready = [idx for idx, count in pending_dependents.items() if count == 0]
+    while ready:
+        idx = ready.pop(0)
+        order.append(idx)
+        for target in sorted(depends_on[idx]):
+            pending_dependents[target] -= 1
+            if pending_dependents[target] == 0:
+                ready.append(target)
+    order.extend(idx for idx in depends_on if idx not in order)
+    return order
+
+
+def delete_in_dependency_order(resources, delete_one, wait_deleted, max_workers=MAX_TEARDOWN_WORKERS):
+    """
+    의존 관계를 지키면서 서로 독립적인 리소스는 동시에 삭제
+
+    - 자신에게 의존하는 리소스가 모두 삭제된 리소스부터 삭제 요청
+    - 삭제 완료(deleted)까지 기다리는 것은 뒤에 삭제될 의존 대상이 있는 경우에만 수행
+    - 한 리소스의 삭제가 실패해도 나머지 리소스 삭제는 계속 진행
+
+    :param delete_one: resource를 받아 삭제 요청을 보내고 성공 여부를 반환하는 함수
+    :param wait_deleted: resource를 받아 삭제 완료까지 대기하는 함수 (삭제 요청이 실패한 리소스는 대기하지 않음)
+    """
+    if not resources:
+        return
+
+    depends_on = build_dependency_graph(resources)
+    # 아직 삭제되지 않은, 나에게 의존하는 리소스 수
+    pending_dependents = {idx: 0 for idx in depends_on}
+    for idx, targets in depends_on.items():
+        for target in targets:
+            pending_dependents[target] += 1
+
+    def _teardown(idx):
+        resource = resources[idx]
+        if delete_one(resource) and depends_on[idx]:
+            wait_deleted(resource)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {executor.submit(_teardown, idx): idx for idx, count in pending_dependents.items() if count == 0}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = running.pop(future)
+                if future.exception() is not None:
+                    resource = resources[idx]
+                    logger.opt(exception=future.exception()).error(
+                        f"Teardown 실패: 리소스 ID {resource['id']} (이름: {resource.get('name')}) 삭제 중 에러 발생"
+                    )
+                for target in depends_on[idx]:
+                    pending_dependents[target] -= 1
+                    if pending_dependents[target] == 0:
+                        running[executor.submit(_teardown, target)] = target
@@ -0,0 +1,99 @@
+import base64
+import json
+import os
+import time
+from pathlib import Path
+
+from loguru import logger
+from src.utils.file_lock import FileLock
+
+# 프로젝트 루트의 캐시 파일 (모든 xdist 워커와 이후 실행이 공유)
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / ".token_cache.json"
+# 만료까지 남은 시간이 이 값(초)보다 작으면 새로 발급
+DEFAULT_REFRESH_MARGIN = 300
+# JWT가 아니어서 만료 시각을 알 수 없는 토큰의 유효 시간(초)
+DEFAULT_OPAQUE_TTL = 1800
+
+
+def _cache_path():
+    return Path(os.getenv("TOKEN_CACHE_PATH", DEFAULT_CACHE_PATH))
+
+
+def _refresh_margin():
+    return int(os.getenv("TOKEN_REFRESH_MARGIN", DEFAULT_REFRESH_MARGIN))
+
+
+def decode_jwt_expiry(token):
+    """
+    JWT payload의 exp(만료 시각, epoch 초)를 반환
+    서명 검증은 하지 않으며, JWT 형식이 아니거나 exp가 없으면 None 반환
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, AttributeError, TypeError):
+        return None
+
+
+def _read_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_cache(path, token):
+    expires_at = decode_jwt_expiry(token)
+    if expires_at is None:
+        expires_at = time.time() + int(os.getenv("TOKEN_CACHE_TTL", DEFAULT_OPAQUE_TTL))
+    entry = {"token": token, "expires_at": expires_at, "fetched_at": time.time()}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    # 다른 워커가 잠금 없이 읽어도 반쯤 쓰인 파일을 보지 않도록 원자적으로 교체
+    os.replace(tmp_path, path)
+    return entry
+
+
+def _is_fresh(entry):
+    return bool(entry and entry.get("token")) and entry.get("expires_at", 0) - _refresh_margin() > time.time()
+
+
+def get_cached_token(fetch_token):
+    """
+    캐시된 토큰을 반환하고, 없거나 곧 만료되면 fetch_token()으로 새로 발급받아 캐시
+
+    - 유효한 캐시가 있으면 락 없이 바로 반환 (일반적인 경로)
+    - 발급은 파일 락 안에서 수행하므로 여러 워커가 동시에 시작해도 로그인은 한 번만 일어남
+    """
+    entry = _read_cache(_cache_path())
+    if _is_fresh(entry):
+        return entry["token"]
+    return refresh_token(fetch_token)
+
+
+def refresh_token(fetch_token, stale_token=None):
+    """
+    토큰을 강제로 갱신 (서버가 expired_token을 응답한 경우 등)
+
+    :param stale_token: 만료된 것으로 확인된 토큰. 캐시에 이와 다른 유효한 토큰이 있으면
+                        다른 워커가 이미 갱신한 것이므로 재로그인 없이 그 토큰을 반환
+    """
+    path = _cache_path()
+    with FileLock(f"{path}.lock"):
+        # 락을 기다리는 동안 다른 워커가 이미 갱신했을 수 있으므로 다시 확인
+        entry = _read_cache(path)
+        if _is_fresh(entry) and entry["token"] != stale_token:
+            logger.info("🔑 다른 워커가 발급한 캐시 토큰 사용")
+            return entry["token"]
+
+        logger.info("🔑 캐시된 토큰이 없거나 만료됨 - 새 토큰 발급")
+        token = fetch_token()
+        if not token:
+            raise RuntimeError("토큰 발급에 실패했습니다.")
+        entry = _write_cache(path, token)
+        logger.info(f"🔑 토큰 캐시 저장 완료 (만료: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['expires_at']))})")
+        return token
@@ -0,0 +1,18 @@
+# UI(Selenium) 테스트 전용 pytest 플러그인 (opt-in)
+# 사용법: pytest -p src.utils.ui_plugin <UI 테스트 경로>
+# API 테스트만 실행할 때는 로드되지 않으므로 selenium/allure 스크린샷 관련 import 비용이 없음
+import pytest
+from src.utils.allure_helper import attach_screenshot
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """테스트 실패 시 자동으로 스크린샷 첨부"""
+    outcome = yield
+    result = outcome.get_result()
+
+    # 테스트 단계가 실패(FAILED)일 때만
+    if result.when == "call" and result.failed:
+        driver = item.funcargs.get("driver")
+        if driver:
+            attach_screenshot(driver, name=item.name)
@@ -1,22 +1,53 @@
 from email import errors
-import requests
 import pytest
 import uuid
 import allure
 
+from requests import HTTPError
+from src.utils.http_client import get_client
+from src.utils.pager import find_first
 
-def get_prepared_block_storage_id(api_headers, base_url_block_storage):
+
+# 인벤토리 스냅샷에 prepared 블록 스토리지가 없을 때 목록을 다시 조회하는 최소 간격(초)
+INVENTORY_MAX_AGE = 30
+
+
+def _find_prepared_in_inventory(inventory):
+    """
+    인벤토리의 prepared 후보를 단건 조회로 확인한 뒤 반환
+    (다른 테스트/워커가 연결하거나 삭제한 블록 스토리지는 refresh_item이 인덱스 상태를 갱신/제거하므로 다음 후보로 넘어감)
+    """
+    for candidate in inventory.find("block_storage", status="prepared"):
+        try:
+            current = inventory.refresh_item("block_storage", candidate["id"])
+        except HTTPError:
+            inventory.remove("block_storage", candidate["id"])
+            continue
+        if current and current.get("status") == "prepared":
+            return current
+    return None
+
+
+def get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory=None):
     """
     prepared 상태의 block storage ID를 찾아 반환
     없으면 새로 생성
+    inventory가 주어지면 목록을 다시 조회하지 않고 인덱스에서 찾아 단건 조회로 현재 상태를 확인
+    (인덱스에 없으면 INVENTORY_MAX_AGE초가 지난 경우에만 목록을 다시 조회 - 이전에 생성한 블록 스토리지가 prepared가 되면 재사용)
     """
-    response = requests.get(base_url_block_storage, headers=api_headers)
-    if response.status_code == 200:
-        block_storages = response.json()
-        # prepared 상태의 block storage 찾기
-        for bs in block_storages:
-            if bs.get("status") == "prepared":
-                return bs["id"]
+    if inventory is not None:
+        bs = _find_prepared_in_inventory(inventory)
+        if bs is None:
+            inventory.refresh(["block_storage"], max_age=INVENTORY_MAX_AGE)
+            bs = _find_prepared_in_inventory(inventory)
+    else:
+        # prepared 상태의 block storage 찾기 (찾으면 이후 페이지는 조회하지 않음)
+        try:
+            bs = find_first(base_url_block_storage, api_headers, lambda bs: bs.get("status") == "prepared")
+        except HTTPError:
+            bs = None
+    if bs:
+        return bs["id"]
     
     # prepared 상태가 없으면 새로 생성
     payload = {
@@ -27,7 +58,7 @@ def get_prepared_block_storage_id(api_headers, base_url_block_storage):
         "image_id": None,
         "snapshot_id": None
     }
-    create_response = requests.post(base_url_block_storage, headers=api_headers, json=payload)
+    create_response = get_client().post(base_url_block_storage, headers=api_headers, json=payload)
     if create_response.status_code == 200:
         new_bs = create_response.json()
         return new_bs["id"]
@@ -39,12 +70,12 @@ def get_prepared_block_storage_id(api_headers, base_url_block_storage):
 class TestBlockStorageCRUD:
     """블록 스토리지 API 테스트 클래스"""
 
-    def test_BS001_list_exists_look_up(self, api_headers, base_url_block_storage):
+    def test_BS001_list_exists_look_up(self, api_client, api_headers, base_url_block_storage):
         """BS-001: 데이터가 있는 경우 목록 조회"""
         headers = api_headers
         url = f"{base_url_block_storage}?skip=0&count=20"
         
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         assert response.status_code == 200
@@ -56,18 +87,18 @@ class TestBlockStorageCRUD:
     @allure.story("예외 케이스")
     @allure.story("xfail")    
     @pytest.mark.xfail(reason="실제 환경에서는 목록을 비워둘 수 없음")
-    def test_BS002_list_emptylook_up(self, api_headers, base_url_block_storage):
+    def test_BS002_list_emptylook_up(self, api_client, api_headers, base_url_block_storage):
         """BS-002: 데이터가 없는 경우 조회"""
         headers = api_headers
         url = f"{base_url_block_storage}?skip=0&count=20"
         
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         assert response.status_code == 200
         assert res_data == [], f"데이터가 비어있어야 하지만 {len(res_data)}개의 데이터가 반환되었습니다."
 
-    def test_BS003_create_success(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS003_create_success(self, api_client, resource_factory, api_headers, base_url_block_storage):
         """BS-003: 블록 스토리지 생성 성공 및 검증"""
         url = base_url_block_storage
         headers = api_headers
@@ -86,7 +117,7 @@ class TestBlockStorageCRUD:
         
         # 2. 생성된 블록 스토리지 상세 조회 (GET)
         detail_url = f"{url}/{created_id}"
-        detail_response = requests.get(detail_url, headers=headers)
+        detail_response = api_client.get(detail_url, headers=headers)
         detail_data = detail_response.json()
         
         # 3. 상세 조회 검증
@@ -102,7 +133,7 @@ class TestBlockStorageCRUD:
         valid_statuses = ["queued", "creating", "available", "active", "assigned"]
         assert status in valid_statuses, f"예상치 못한 상태: {status} (허용: {valid_statuses})"
 
-    def test_BS004_create_fail_missing_parameters(self, api_headers, base_url_block_storage):
+    def test_BS004_create_fail_missing_parameters(self, api_client, api_headers, base_url_block_storage):
         """BS-004: 필수 파라미터 일부 누락 시 422 에러 검증"""
         url = base_url_block_storage
         headers = api_headers
@@ -119,7 +150,7 @@ class TestBlockStorageCRUD:
         }
 
         # 1. 블록 스토리지 생성 요청 (실패 예상)
-        response = requests.post(url, headers=headers, json=payload)
+        response = api_client.post(url, headers=headers, json=payload)
         res_data = response.json()
         
         # 2. 상태 코드 검증 (이미지 상의 422 확인)
@@ -137,7 +168,7 @@ class TestBlockStorageCRUD:
         )
         assert found_json_error, f"상세 에러 내용에 'JSON decode error'가 없습니다: {res_data}"
 
-    def test_BS005_create_fail_invalid_data_type(self, api_headers, base_url_block_storage):
+    def test_BS005_create_fail_invalid_data_type(self, api_client, api_headers, base_url_block_storage):
         """BS-005: 필수 파라미터에 잘못된 데이터 타입 입력 시 에러 검증"""
         url = base_url_block_storage
         headers = api_headers.copy()
@@ -157,7 +188,7 @@ class TestBlockStorageCRUD:
         """
 
         # data 파라미터로 문자열을 직접 전송
-        response = requests.post(url, headers=headers, data=invalid_raw_body)
+        response = api_client.post(url, headers=headers, data=invalid_raw_body)
         res_data = response.json()
 
         # 1. 상태 코드 검증
@@ -176,7 +207,7 @@ class TestBlockStorageCRUD:
         assert error_detail["msg"] == "JSON decode error"
         assert error_detail["ctx"]["error"] == "Expecting value"
 
-    def test_BS007_get_fail_non_existent_id(self, api_headers, base_url_block_storage):
+    def test_BS007_get_fail_non_existent_id(self, api_client, api_headers, base_url_block_storage):
         """BS-007: 존재하지 않는 ID로 블록 스토리지 조회 시 404 에러 검증"""
         
         # 1. 존재하지 않는 임의의 ID 설정 (이미지 예시 참고)
@@ -187,7 +218,7 @@ class TestBlockStorageCRUD:
         headers["Content-Type"] = "application/json"
 
         # 2. 상세 조회 요청 (GET)
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         
         # 3. 상태 코드 검증 (404 Not Found)
         assert response.status_code == 404, f"예상치 못한 상태 코드: {response.status_code}"
@@ -196,7 +227,7 @@ class TestBlockStorageCRUD:
         res_data = response.json()
         assert res_data["detail"] == "Not Found", f"에러 메시지 불일치: {res_data.get('detail')}"
 
-    def test_BS008_update_resource_name(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS008_update_resource_name(self, api_client, resource_factory, api_headers, base_url_block_storage):
         """BS-008: 블록 스토리지 이름 수정 검증"""
         # 테스트용 블록 스토리지 생성
         payload = {
@@ -219,17 +250,17 @@ class TestBlockStorageCRUD:
         }
 
         # PATCH 또는 PUT 요청 (API 명세에 따라 선택, 이미지 흐름상 수정 요청)
-        response = requests.patch(url, headers=headers, json=update_payload)
+        response = api_client.patch(url, headers=headers, json=update_payload)
         res_data = response.json()
 
         assert response.status_code == 200
         assert res_data["id"] == resource_id
         
         # 실제로 이름이 변경되었는지 상세 조회를 통해 재확인
-        get_response = requests.get(url, headers=headers)
+        get_response = api_client.get(url, headers=headers)
         assert get_response.json()["name"] == "test-team22"
 
-    def test_BS009_update_fail_invalid_tag_format(self, api_headers, base_url_block_storage):
+    def test_BS009_update_fail_invalid_tag_format(self, api_client, api_headers, base_url_block_storage):
         """BS-009: 올바르지 않은 태그 형식(JSON 문법 오류)으로 수정 시 422 에러 검증"""
         resource_id = "d3012bbe-11f3-44e6-9cd6-f485753914ee"
         url = f"{base_url_block_storage}/{resource_id}"
@@ -245,7 +276,7 @@ class TestBlockStorageCRUD:
         """
 
         # JSON 문법 오류를 보내기 위해 data= 파라미터 사용
-        response = requests.patch(url, headers=headers, data=invalid_raw_body)
+        response = api_client.patch(url, headers=headers, data=invalid_raw_body)
         res_data = response.json()
 
         # 1. 상태 코드 검증
@@ -257,7 +288,7 @@ class TestBlockStorageCRUD:
         assert "JSON decode error" in error_detail["msg"]
         assert "Expecting ',' delimiter" in error_detail["ctx"]["error"]
 
-    def test_BS010_delete_resource_success(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS010_delete_resource_success(self, api_client, resource_factory, api_headers, base_url_block_storage):
         """BS-010: 블록 스토리지 삭제 요청 성공 검증"""
         # 테스트용 블록 스토리지 생성
         payload = {
@@ -275,7 +306,7 @@ class TestBlockStorageCRUD:
         headers = api_headers
 
         # DELETE 요청 전송
-        response = requests.delete(url, headers=headers)
+        response = api_client.delete(url, headers=headers)
         res_data = response.json()
 
         # 응답 검증
@@ -283,7 +314,7 @@ class TestBlockStorageCRUD:
         assert res_data["id"] == resource_id
         assert res_data["status"] == "deleting"
 
-    def test_BS011_delete_fail_already_deleted(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS011_delete_fail_already_deleted(self, api_client, resource_factory, api_headers, base_url_block_storage):
         """BS-011: 이미 삭제된 ID 삭제 시도 시 409 Conflict 검증"""
         # 1. 테스트용 블록 스토리지 생성
         payload = {
@@ -301,11 +332,11 @@ class TestBlockStorageCRUD:
         headers = api_headers
 
         # 2. 첫 번째 삭제 요청 (성공해야 함)
-        first_delete = requests.delete(url, headers=headers)
+        first_delete = api_client.delete(url, headers=headers)
         assert first_delete.status_code == 200
 
         # 3. 두 번째 삭제 요청 (409 Conflict 예상)
-        response = requests.delete(url, headers=headers)
+        response = api_client.delete(url, headers=headers)
         res_data = response.json()
 
         # 409 Conflict 및 상세 에러 메시지 검증
@@ -319,12 +350,12 @@ class TestBlockStorageCRUD:
 class TestSanpshotCRUD:
     """스냅샷 API 테스트 클래스"""
 
-    def test_BS012_list_exists_look_up(self, api_headers, base_url_block_storage):
+    def test_BS012_list_exists_look_up(self, api_client, api_headers, base_url_block_storage):
         """BS-012: 데이터가 있는 경우 목록 조회"""
         headers = api_headers
         url = f"{base_url_block_storage}/snapshot?skip=0&count=20"
         
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         assert response.status_code == 200
@@ -336,25 +367,25 @@ class TestSanpshotCRUD:
     @allure.story("예외 케이스")
     @allure.story("xfail")    
     @pytest.mark.xfail(reason="실제 환경에서는 목록을 비워둘 수 없음")
-    def test_BS013_list_emptylook_up(self, api_headers, base_url_block_storage):
+    def test_BS013_list_emptylook_up(self, api_client, api_headers, base_url_block_storage):
         """BS-013: 데이터가 없는 경우 조회"""
         headers = api_headers
         url = f"{base_url_block_storage}/snapshot?skip=0&count=20"
         
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         assert response.status_code == 200
         assert res_data == [], f"데이터가 비어있어야 하지만 {len(res_data)}개의 데이터가 반환되었습니다."
 
-    def test_BS014_create_success(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS014_create_success(self, api_client, resource_factory, api_headers, base_url_block_storage, inventory):
         """BS-014: 스냅샷 생성 성공 및 검증"""
         url = f"{base_url_block_storage}/snapshot"
         headers = api_headers
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "name": "snapshot-878908",
-            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage),
+            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory),
         }
 
         # 1. 스냅샷 생성 (resource_factory 사용)
@@ -363,7 +394,7 @@ class TestSanpshotCRUD:
         
         # 2. 생성된 스냅샷 상세 조회 (GET)
         detail_url = f"{url}/{created_id}"
-        detail_response = requests.get(detail_url, headers=headers)
+        detail_response = api_client.get(detail_url, headers=headers)
         detail_data = detail_response.json()
         
         # 3. 상세 조회 검증
@@ -380,7 +411,7 @@ class TestSanpshotCRUD:
         valid_statuses = ["queued", "creating", "available", "active", "assigned", "prepared"]
         assert status in valid_statuses, f"예상치 못한 상태: {status} (허용: {valid_statuses})"
 
-    def test_BS015_create_fail_missing_parameters(self, api_headers, base_url_block_storage):
+    def test_BS015_create_fail_missing_parameters(self, api_client, api_headers, base_url_block_storage):
         """BS-015: 필수 파라미터 일부 누락 시 422 에러 검증"""
         url = f"{base_url_block_storage}/snapshot"
         headers = api_headers
@@ -394,7 +425,7 @@ class TestSanpshotCRUD:
         }
 
         # 1. 스냅샷 생성 요청 (실패 예상)
-        response = requests.post(url, headers=headers, json=payload)
+        response = api_client.post(url, headers=headers, json=payload)
         res_data = response.json()
         
         # 2. 상태 코드 검증 (이미지 상의 422 확인)
@@ -420,7 +451,7 @@ class TestSanpshotCRUD:
         error_loc = errors[0].get("loc", [])
         assert "block_storage_id" in error_loc, f"에러 위치가 올바르지 않습니다: {error_loc}"
     
-    def test_BS016_create_fail_invalid_data_type(self, api_headers, base_url_block_storage):
+    def test_BS016_create_fail_invalid_data_type(self, api_client, api_headers, base_url_block_storage):
         """BS-016: 필수 파라미터에 잘못된 데이터 타입 입력 시 에러 검증"""
         url = f"{base_url_block_storage}/snapshot"
         headers = api_headers.copy()
@@ -436,7 +467,7 @@ class TestSanpshotCRUD:
         """
 
         # data 파라미터로 문자열을 직접 전송
-        response = requests.post(url, headers=headers, data=invalid_raw_body)
+        response = api_client.post(url, headers=headers, data=invalid_raw_body)
         res_data = response.json()
 
         # 1. 상태 코드 검증
@@ -456,7 +487,7 @@ class TestSanpshotCRUD:
         # 이미지에 나온 구체적인 에러 메시지 확인
         assert "Input should be a valid UUID" in error_detail["msg"]
     
-    def test_BS018_get_fail_non_existent_id(self, api_headers, base_url_block_storage):
+    def test_BS018_get_fail_non_existent_id(self, api_client, api_headers, base_url_block_storage):
         """BS-018: 존재하지 않는 ID로 스냅샷 조회 시 404 에러 검증"""
         
         # 1. 존재하지 않는 임의의 ID 설정 (이미지 예시 참고)
@@ -467,7 +498,7 @@ class TestSanpshotCRUD:
         headers["Content-Type"] = "application/json"
 
         # 2. 상세 조회 요청 (GET)
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         
         # 3. 상태 코드 검증 (404 Not Found)
         assert response.status_code == 404, f"예상치 못한 상태 코드: {response.status_code}"
@@ -476,14 +507,14 @@ class TestSanpshotCRUD:
         res_data = response.json()
         assert res_data["detail"] == "Not Found", f"에러 메시지 불일치: {res_data.get('detail')}"
     
-    def test_BS019_update_resource_name(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS019_update_resource_name(self, api_client, resource_factory, api_headers, base_url_block_storage, inventory):
         """BS-019: 스냅샷 이름 수정 검증"""
         # 테스트용 스냅샷 생성
         url = f"{base_url_block_storage}/snapshot"
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "name": "snapshot-original",
-            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage),
+            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory),
         }
         created_resource = resource_factory(url, payload)
         resource_id = created_resource["id"]
@@ -497,17 +528,17 @@ class TestSanpshotCRUD:
         }
 
         # PATCH 또는 PUT 요청 (API 명세에 따라 선택, 이미지 흐름상 수정 요청)
-        response = requests.patch(url, headers=headers, json=update_payload)
+        response = api_client.patch(url, headers=headers, json=update_payload)
         res_data = response.json()
 
         assert response.status_code == 200
         assert res_data["id"] == resource_id
         
         # 실제로 이름이 변경되었는지 상세 조회를 통해 재확인
-        get_response = requests.get(url, headers=headers)
+        get_response = api_client.get(url, headers=headers)
         assert get_response.json()["name"] == "test-team22"
 
-    def test_BS020_update_fail_invalid_tag_format(self, api_headers, base_url_block_storage):
+    def test_BS020_update_fail_invalid_tag_format(self, api_client, api_headers, base_url_block_storage):
         """BS-020: 올바르지 않은 태그 형식(JSON 문법 오류)으로 수정 시 422 에러 검증"""
         resource_id = "d3012bbe-11f3-44e6-9cd6-f485753914ee"
         url = f"{base_url_block_storage}/snapshot/{resource_id}"
@@ -523,7 +554,7 @@ class TestSanpshotCRUD:
         """
 
         # JSON 문법 오류를 보내기 위해 data= 파라미터 사용
-        response = requests.patch(url, headers=headers, data=invalid_raw_body)
+        response = api_client.patch(url, headers=headers, data=invalid_raw_body)
         res_data = response.json()
 
         # 1. 상태 코드 검증
@@ -546,14 +577,14 @@ class TestSanpshotCRUD:
         # loc 정보 검증 (이미지 결과: ["body", 64])
         assert "body" in error_detail["loc"]
     
-    def test_BS021_delete_resource_success(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS021_delete_resource_success(self, api_client, resource_factory, api_headers, base_url_block_storage, inventory):
         """BS-021: 블록 스토리지 삭제 요청 성공 검증"""
         # 테스트용 스냅샷 생성
         url = f"{base_url_block_storage}/snapshot"
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "name": "snapshot-to-delete",
-            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage),
+            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory),
         }
         created_resource = resource_factory(url, payload)
         resource_id = created_resource["id"]
@@ -562,7 +593,7 @@ class TestSanpshotCRUD:
         headers = api_headers
 
         # DELETE 요청 전송
-        response = requests.delete(url, headers=headers)
+        response = api_client.delete(url, headers=headers)
         res_data = response.json()
 
         # 응답 검증
@@ -570,14 +601,14 @@ class TestSanpshotCRUD:
         assert res_data["id"] == resource_id
         assert res_data["status"] == "deleting"
 
-    def test_BS022_delete_fail_already_deleted(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS022_delete_fail_already_deleted(self, api_client, resource_factory, api_headers, base_url_block_storage, inventory):
         """BS-022: 이미 삭제된 ID 삭제 시도 시 409 Conflict 검증"""
         # 1. 테스트용 스냅샷 생성
         url = f"{base_url_block_storage}/snapshot"
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "name": "snapshot-double-delete",
-            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage),
+            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory),
         }
         created_resource = resource_factory(url, payload)
         resource_id = created_resource["id"]
@@ -586,11 +617,11 @@ class TestSanpshotCRUD:
         headers = api_headers
 
         # 2. 첫 번째 삭제 요청 (성공해야 함)
-        first_delete = requests.delete(url, headers=headers)
+        first_delete = api_client.delete(url, headers=headers)
         assert first_delete.status_code == 200
 
         # 3. 두 번째 삭제 요청 (409 Conflict 예상)
-        response = requests.delete(url, headers=headers)
+        response = api_client.delete(url, headers=headers)
         res_data = response.json()
 
         # 409 Conflict 및 상세 에러 메시지 검증
@@ -604,12 +635,12 @@ class TestSanpshotCRUD:
 class Testsnapshot_schedulerCRUD:
     """스냅샷 스케쥴러API 테스트 클래스"""
 
-    def test_BS023_list_exists_look_up(self, api_headers, base_url_block_storage):
+    def test_BS023_list_exists_look_up(self, api_client, api_headers, base_url_block_storage):
         """BS-023: snapshot_scheduler 목록 조회 (빈 리스트 허용)"""
         headers = api_headers
         url = f"{base_url_block_storage}/snapshot_scheduler?skip=0&count=20"
     
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         assert response.status_code == 200
@@ -622,25 +653,25 @@ class Testsnapshot_schedulerCRUD:
     @allure.story("예외 케이스")
     @allure.story("xfail")    
     @pytest.mark.xfail(reason="실제 환경에서는 목록을 비워둘 수 없음")
-    def test_BS024_list_emptylook_up(self, api_headers, base_url_block_storage):
+    def test_BS024_list_emptylook_up(self, api_client, api_headers, base_url_block_storage):
         """BS-024: 데이터가 없는 경우 조회"""
         headers = api_headers
         url = f"{base_url_block_storage}/snapshot_scheduler?skip=0&count=20"
         
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         assert response.status_code == 200
         assert res_data == [], f"데이터가 비어있어야 하지만 {len(res_data)}개의 데이터가 반환되었습니다."
     
-    def test_BS025_create_success(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS025_create_success(self, api_client, resource_factory, api_headers, base_url_block_storage, inventory):
         """BS-025: 스냅샷 생성 성공 및 검증"""
         url = f"{base_url_block_storage}/snapshot_scheduler"
         headers = api_headers
         payload = {
           "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
           "name": "snapshot-scheduler-ea550f",
-          "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage),
+          "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory),
           "cron_expression": "2 4 * * *",
           "max_snapshots": 7,
           "tags": {}
@@ -657,7 +688,7 @@ class Testsnapshot_schedulerCRUD:
         
         # 2. 생성된 스냅샷 상세 조회 (GET)
         detail_url = f"{url}/{created_id}"
-        detail_response = requests.get(detail_url, headers=api_headers)
+        detail_response = api_client.get(detail_url, headers=api_headers)
         detail_data = detail_response.json()
         
         # 3. 상세 조회 기본 검증
@@ -673,7 +704,7 @@ class Testsnapshot_schedulerCRUD:
         valid_statuses = ["active", "available", "prepared"]
         assert status in valid_statuses, f"부적절한 상태값: {status}"
 
-    def test_BS026_create_fail_missing_parameters(self, api_headers, base_url_block_storage):
+    def test_BS026_create_fail_missing_parameters(self, api_client, api_headers, base_url_block_storage, inventory):
         """BS-026: 필수 파라미터 일부 누락 시 422 에러 검증"""
         url = f"{base_url_block_storage}/snapshot_scheduler"
         headers = api_headers
@@ -683,14 +714,14 @@ class Testsnapshot_schedulerCRUD:
         payload = {
                     "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
                     "name": "snapshot-scheduler-ea550f",
-                    "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage),
+                    "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory),
                     "cron_expression": None,
                     "max_snapshots": 7,
                     "tags": {}
         }
 
         # 1. 생성 요청 (422 예상)
-        response = requests.post(url, headers=api_headers, json=payload)
+        response = api_client.post(url, headers=api_headers, json=payload)
         res_data = response.json()
         
         # 2. 상태 코드 검증
@@ -714,7 +745,7 @@ class Testsnapshot_schedulerCRUD:
         
         assert found_cron_error, f"cron_expression 관련 에러 메시지가 없습니다: {res_data}"
 
-    def test_BS027_create_fail_invalid_data_type(self, api_headers, base_url_block_storage):
+    def test_BS027_create_fail_invalid_data_type(self, api_client, api_headers, base_url_block_storage):
         """BS-027: 필수 파라미터에 잘못된 데이터 타입(JSON 문법 오류) 입력 시 에러 검증"""
         url = f"{base_url_block_storage}/snapshot_scheduler"
         headers = api_headers.copy()
@@ -733,7 +764,7 @@ class Testsnapshot_schedulerCRUD:
         """
 
         # json= 대신 data=를 사용하여 가공되지 않은 raw string 전송
-        response = requests.post(url, headers=headers, data=invalid_raw_body)
+        response = api_client.post(url, headers=headers, data=invalid_raw_body)
         res_data = response.json()
 
         # 1. 상태 코드 검증 (이미지 상 422 Unprocessable Entity)
@@ -758,7 +789,7 @@ class Testsnapshot_schedulerCRUD:
         assert "error" in error_detail["ctx"]
         assert "Expecting" in error_detail["ctx"]["error"]
 
-    def test_BS029_get_fail_non_existent_id(self, api_headers, base_url_block_storage):
+    def test_BS029_get_fail_non_existent_id(self, api_client, api_headers, base_url_block_storage):
         """BS-029: 존재하지 않는 ID로 블록 스토리지 조회 시 404 에러 검증"""
         
         # 1. 존재하지 않는 임의의 ID 설정 (이미지 예시 참고)
@@ -769,7 +800,7 @@ class Testsnapshot_schedulerCRUD:
         headers["Content-Type"] = "application/json"
 
         # 2. 상세 조회 요청 (GET)
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         
         # 3. 상태 코드 검증 (404 Not Found)
         assert response.status_code == 404, f"예상치 못한 상태 코드: {response.status_code}"
@@ -778,7 +809,7 @@ class Testsnapshot_schedulerCRUD:
         res_data = response.json()
         assert res_data["detail"] == "Not Found", f"에러 메시지 불일치: {res_data.get('detail')}"
 
-    def test_BS030_update_resource_name(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS030_update_resource_name(self, api_client, resource_factory, api_headers, base_url_block_storage, inventory):
         """BS-030: 스냅샷 스케줄러 이름 수정 검증"""
         
         # 1. 테스트용 스냅샷 스케줄러 생성
@@ -786,7 +817,7 @@ class Testsnapshot_schedulerCRUD:
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "name": f"before-update-{uuid.uuid4().hex[:6]}",
-            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage),
+            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory),
             "cron_expression": "2 4 * * *",
             "max_snapshots": 7,
             "tags": {}
@@ -804,7 +835,7 @@ class Testsnapshot_schedulerCRUD:
         }
 
         # 3. 수정 요청 전송 (PATCH)
-        response = requests.patch(url, headers=api_headers, json=update_payload)
+        response = api_client.patch(url, headers=api_headers, json=update_payload)
         res_data = response.json()
 
         # [검증] 상태 코드 200 및 반환된 ID 일치 여부
@@ -812,12 +843,12 @@ class Testsnapshot_schedulerCRUD:
         assert res_data["id"] == resource_id, "반환된 ID가 기존 ID와 다릅니다."
         
         # 4. 실제로 이름이 변경되었는지 상세 조회(GET)로 최종 확정
-        get_response = requests.get(url, headers=api_headers)
+        get_response = api_client.get(url, headers=api_headers)
         get_data = get_response.json()
         
         assert get_data["name"] == "team2", f"이름이 변경되지 않음: {get_data.get('name')}"
     
-    def test_BS031_update_fail_invalid_tag_format(self, api_headers, base_url_block_storage):
+    def test_BS031_update_fail_invalid_tag_format(self, api_client, api_headers, base_url_block_storage):
         """BS-031: 올바르지 않은 태그 형식(JSON 문법 오류)으로 수정 시 422 에러 검증"""
         # 이미지 9번 예시 ID 반영
         resource_id = "2bbe3e69-7a41-4b2c-936c-057d79303a68" 
@@ -836,7 +867,7 @@ class Testsnapshot_schedulerCRUD:
         """
 
         # JSON 문법 오류를 보내기 위해 data= 파라미터 사용
-        response = requests.patch(url, headers=headers, data=invalid_raw_body)
+        response = api_client.patch(url, headers=headers, data=invalid_raw_body)
         res_data = response.json()
 
         # 1. 상태 코드 검증 (이미지 상 422 Unprocessable Entity)
@@ -858,7 +889,7 @@ class Testsnapshot_schedulerCRUD:
         # 4. 에러 위치 정보 검증
         assert "body" in error_detail.get("loc", [])
 
-    def test_BS032_delete_resource_success(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS032_delete_resource_success(self, api_client, resource_factory, api_headers, base_url_block_storage, inventory):
         """BS-032: 스냅샷 스케줄러 삭제 요청 성공 검증"""
         
         # 1. 테스트용 스냅샷 스케줄러 생성
@@ -866,7 +897,7 @@ class Testsnapshot_schedulerCRUD:
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "name": f"to-delete-{uuid.uuid4().hex[:6]}",
-            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage),
+            "block_storage_id": get_prepared_block_storage_id(api_headers, base_url_block_storage, inventory),
             "cron_expression": "2 4 * * *",
             "max_snapshots": 7,
             "tags": {}
@@ -878,7 +909,7 @@ class Testsnapshot_schedulerCRUD:
         url = f"{base_url_block_storage}/snapshot_scheduler/{resource_id}"
         
         # 3. DELETE 요청 전송
-        response = requests.delete(url, headers=api_headers)
+        response = api_client.delete(url, headers=api_headers)
         res_data = response.json()
 
         # 4. 응답 데이터 검증
@@ -887,7 +918,7 @@ class Testsnapshot_schedulerCRUD:
         assert res_data["status"] == "deleted", f"상태값이 'deleted'가 아닙니다: {res_data.get('status')}"
 
 
-    def test_BS033_delete_fail_already_deleted(self, resource_factory, api_headers, base_url_block_storage):
+    def test_BS033_delete_fail_already_deleted(self, api_client, resource_factory, api_headers, base_url_block_storage):
         """BS-033: 존재하지 않는 스냅샷 스케줄러 삭제 시도 시 409 Conflict 검증"""
 
         # 1. 존재하지 않는 UUID로 삭제 시도
@@ -896,7 +927,7 @@ class Testsnapshot_schedulerCRUD:
         target_url = f"{snapshot_scheduler_url}/{fake_id}"
 
         # 2. 존재하지 않는 리소스 삭제 요청
-        response = requests.delete(target_url, headers=api_headers)
+        response = api_client.delete(target_url, headers=api_headers)
         res_data = response.json()
 
         # 3. 409 Conflict 검증
@@ -1,9 +1,12 @@
-import requests
 import pytest
 import allure
 import uuid
 import time
 
+from requests import HTTPError
+from src.utils.http_client import get_client
+from src.utils.pager import paginate
+
 # 후보군 instance_type_id (TC28에서 create fallback에 사용)
 INSTANCE_TYPE_CANDIDATES = [
     "320909e3-44ce-4018-8b55-7e837cd84a15",
@@ -17,7 +20,7 @@ class TestComputeCRUD:
     deleted_vm_verified = False
     
     # VM-001 생성, 수정, 삭제 (resource_factory 적용)
-    def test_VM_create_rename_delete(self, api_headers, base_url_compute):
+    def test_VM_create_rename_delete(self, api_client, api_headers, base_url_compute):
 
         # 1) VM 생성
         vm_name = f"vm-{uuid.uuid4().hex[:6]}"
@@ -43,7 +46,7 @@ class TestComputeCRUD:
 
         # 생성 직후 단건 조회로 payload 반영 확인
         get_url = f"{base_url_compute}/virtual_machine/{vm_id}"
-        r_get = requests.get(get_url, headers=api_headers)
+        r_get = api_client.get(get_url, headers=api_headers)
         assert r_get.status_code == 200, f"⛔ [FAIL] 생성 직후 조회 실패 - {r_get.status_code}: {r_get.text}"
 
         vm_one = r_get.json()
@@ -56,11 +59,11 @@ class TestComputeCRUD:
         patch_url = f"{base_url_compute}/virtual_machine/{vm_id}"
         new_name = f"{vm_name} test"
 
-        r_patch = requests.patch(patch_url, headers=api_headers, json={"name": new_name})
+        r_patch = api_client.patch(patch_url, headers=api_headers, json={"name": new_name})
         assert r_patch.status_code == 200, f"VM 이름 수정 실패: {r_patch.status_code}: {r_patch.text}"
 
         # 수정 반영 조회 검증
-        r_get2 = requests.get(get_url, headers=api_headers)
+        r_get2 = api_client.get(get_url, headers=api_headers)
         assert r_get2.status_code == 200, f"⛔ [FAIL] 수정 후 조회 실패 - {r_get2.status_code}: {r_get2.text}"
 
         vm_one2 = r_get2.json()
@@ -69,7 +72,7 @@ class TestComputeCRUD:
 
         # 3) VM 삭제 (직접 삭제 검증도 수행)
         delete_url = f"{base_url_compute}/virtual_machine/{vm_id}"
-        r_delete = requests.delete(delete_url, headers=api_headers)
+        r_delete = api_client.delete(delete_url, headers=api_headers)
         assert r_delete.status_code == 200, f"VM 삭제 실패: {r_delete.status_code}: {r_delete.text}"
     
     # VM-002 다른 인스턴스 타입으로 VM 생성       
@@ -171,26 +174,35 @@ class TestComputeCRUD:
         assert isinstance(vms, list)
     
     # VM-009 VM 단건 조회 (machine_id 기반)
-    def test_VM009_get_vm_one(self, api_headers, base_url_compute):
-        vm_id = self._ensure_vm_id(api_headers, base_url_compute)
+    def test_VM009_get_vm_one(self, api_headers, base_url_compute, inventory):
+        vm_id = self._ensure_vm_id(api_headers, base_url_compute, inventory)
         vm = self._get_vm_by_machine_id(api_headers, base_url_compute, vm_id)
         assert vm is not None
         assert vm.get("machine_id") or vm.get("id")
 
+    def _iter_vms(self, api_headers, base_url_compute):
+        # 첫 페이지뿐 아니라 전체 목록을 페이지 단위로 지연 조회
+        try:
+            yield from paginate(f"{base_url_compute}/virtual_machine_allocation", api_headers)
+        except HTTPError as e:
+            self._xfail_if_expired(e.response)
+            raise
+
     def _list_vms(self, api_headers, base_url_compute):
-        r = self._request(
-            "GET",
-            f"{base_url_compute}/virtual_machine_allocation",
-            headers=api_headers,
-        )
-        return r.json()
+        return list(self._iter_vms(api_headers, base_url_compute))
 
-    def _ensure_vm_id(self, api_headers, base_url_compute):
+    def _ensure_vm_id(self, api_headers, base_url_compute, inventory=None):
         if self.created_vm_id and not self.deleted_vm_verified:
             return self.created_vm_id
 
-        vms = self._list_vms(api_headers, base_url_compute)
-        return vms[0].get("machine_id") or vms[0].get("id")
+        # 세션 인벤토리 스냅샷이 있으면 VM 목록을 다시 조회하지 않음
+        vm = inventory.first("virtual_machine") if inventory is not None else None
+        if vm:
+            return vm.get("machine_id") or vm.get("id")
+
+        # 첫 번째 VM만 필요하므로 다음 페이지는 조회하지 않음
+        vm = next(self._iter_vms(api_headers, base_url_compute))
+        return vm.get("machine_id") or vm.get("id")
 
     def _get_vm_by_machine_id(self, api_headers, base_url_compute, vm_id):
         r = self._request(
@@ -223,9 +235,9 @@ class TestComputeCRUD:
     @allure.story("예외 케이스")
     @allure.story("xfail")
     @pytest.mark.xfail(reason="환경 제한으로 VM 가시성 확인 불가 시도")
-    def test_VM026_wait_vm_visible(self, api_headers, base_url_compute, vm_id, timeout_sec=60):
+    def test_VM026_wait_vm_visible(self, api_headers, base_url_compute, vm_id, inventory, timeout_sec=60):
         # 1. 아까 작성하신 메서드를 통해 vm_id를 내부적으로 가져옵니다.
-        vm_id = self._ensure_vm_id(api_headers, base_url_compute)
+        vm_id = self._ensure_vm_id(api_headers, base_url_compute, inventory)
         
         if not vm_id:
             pytest.fail("테스트에 사용할 VM ID를 찾을 수 없습니다.")
@@ -259,12 +271,16 @@ class TestComputeCRUD:
     # 헬퍼 메서드
 
     def _request(self, method, url, **kwargs):
-        r = requests.request(method, url, **kwargs)
+        # expired_token은 공용 클라이언트가 갱신 후 재전송하므로, 여기까지 오면 갱신 자체가 실패한 경우
+        r = get_client().request(method, url, **kwargs)
+        self._xfail_if_expired(r)
+        return r
+
+    def _xfail_if_expired(self, r):
         if r.status_code == 403:
             try:
                 data = r.json()
                 if data.get("code") == "expired_token":
                     pytest.xfail("expired_token")
             except Exception:
-                pass
-        return r
\ No newline at end of file
+                pass
\ No newline at end of file
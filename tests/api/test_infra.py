@@ -1,18 +1,17 @@
-import requests
 import pytest
 
 
 class TestInfraCRUD:
     """인프라 API 테스트 클래스"""
 
-    def test_INFRA001_get_region_list_success(self, api_headers, base_url_infra):
+    def test_INFRA001_get_region_list_success(self, api_client, api_headers, base_url_infra):
         """
         INFRA-001: Region 목록 조회
         """
         headers = api_headers
         url = f"{base_url_infra}/region"
 
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         # 상태 코드 검증
@@ -26,14 +25,14 @@ class TestInfraCRUD:
         assert "id" in res_data[0]
         assert "name" in res_data[0]
         
-    def test_INFRA002_get_zone_list_success(self, api_headers, base_url_infra):
+    def test_INFRA002_get_zone_list_success(self, api_client, api_headers, base_url_infra):
         """
         INFRA-002: Zone 목록 조회
         """
         headers = api_headers
         url = f"{base_url_infra}/infra/zone"
         
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
         
         # 상태 코드 검증
@@ -48,14 +47,14 @@ class TestInfraCRUD:
         assert "name" in res_data[0]
         assert "region_id" in res_data[0]
     
-    def test_INFRA003_get_instance_type_list_success(self, api_headers, base_url_infra):
+    def test_INFRA003_get_instance_type_list_success(self, api_client, api_headers, base_url_infra):
         """
         INFRA-003: Instance Type 목록 조회
         """
         headers = api_headers
         url = f"{base_url_infra}/infra/instance_type"
 
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         # 상태 코드 검증
@@ -71,7 +70,7 @@ class TestInfraCRUD:
         assert "cpu_vcore" in res_data[0]
         assert "memory_gib" in res_data[0]
         
-    def test_INFRA004_get_block_storage_image_list_success(self, api_headers, base_url_infra):
+    def test_INFRA004_get_block_storage_image_list_success(self, api_client, api_headers, base_url_infra):
         """
         INFRA004: Block Storage Image 목록 조회
         - 데이터가 없는 경우에도 정상 응답(200)인지 확인
@@ -79,7 +78,7 @@ class TestInfraCRUD:
         headers = api_headers
         url = f"{base_url_infra}/infra/block_storage_image"
 
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         # 상태 코드 검증
@@ -95,7 +94,7 @@ class TestInfraCRUD:
             assert "name" in res_data[0]
             assert "status" in res_data[0]
 
-    def test_INFRA005_get_notice_list_success(self, api_headers, base_url_infra):
+    def test_INFRA005_get_notice_list_success(self, api_client, api_headers, base_url_infra):
         """
         INFRA005: 공지사항 및 업데이트 조회
         - 공지가 없는 경우에도 정상 응답(200)인지 확인
@@ -103,7 +102,7 @@ class TestInfraCRUD:
         headers = api_headers
         url = f"{base_url_infra}/notice"
 
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         # 상태 코드 검증
@@ -123,14 +122,14 @@ class TestInfraCRUD:
             if "created" in res_data[0]:
                 assert isinstance(res_data[0]["created"], str)
 
-    def test_INFRA006_get_resource_usage_success(self, api_headers, base_url_infra):
+    def test_INFRA006_get_resource_usage_success(self, api_client, api_headers, base_url_infra):
         """
         INFRA006: 리소스 사용 현황 조회
         """
         headers = api_headers
         url = f"{base_url_infra}/organization/resource_usage"
 
-        response = requests.get(url, headers=headers)
+        response = api_client.get(url, headers=headers)
         res_data = response.json()
 
         # 상태 코드 검증
@@ -1,12 +1,12 @@
 from urllib import response
 import pytest
-import requests
 import uuid
 import allure
 import random
 from loguru import logger
 
 from tests.conftest import api_headers
+from src.utils.pager import find_first
 
 class TestNetworkInterfaceCRUD:
 
@@ -19,15 +19,15 @@ class TestNetworkInterfaceCRUD:
             "dr": False
         }
     
-    def test_NW001_interface_list(self, api_headers, base_url_network):
+    def test_NW001_interface_list(self, api_client, api_headers, base_url_network):
         url = f"{base_url_network}/network_interface?skip=0&count=20"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
-    def test_NW002_interface_list_format(self, api_headers, base_url_network):
+    def test_NW002_interface_list_format(self, api_client, api_headers, base_url_network):
         url = f"{base_url_network}/network_interface?skip=0&count=20"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         
         assert response.status_code == 200, f"목록 조회 실패: {response.text}"
         
@@ -40,27 +40,27 @@ class TestNetworkInterfaceCRUD:
         else:
             allure.step(f"현재 {len(res_data)}개의 리소스가 리스트로 반환되었습니다.")
 
-    def test_NW003_NW006_interface_create_and_get(self, resource_factory, api_headers, base_url_network):
+    def test_NW003_NW006_interface_create_and_get(self, api_client, resource_factory, api_headers, base_url_network):
         payload = self.get_nic_payload()
         resource = resource_factory(f"{base_url_network}/network_interface", payload)
         
         get_url = f"{base_url_network}/network_interface/{resource['id']}"
-        response = requests.get(get_url, headers=api_headers)
+        response = api_client.get(get_url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 200과 다른 상태 코드: {response.status_code}"
         assert response.json()["name"] == payload["name"]
 
     @allure.story("예외 케이스")
     @allure.story("xfail")
     @pytest.mark.xfail(reason="서버 중복 이름 허용 버그")
-    def test_NW004_duplicate_create_fail(self, resource_factory, api_headers, base_url_network):
+    def test_NW004_duplicate_create_fail(self, api_client, resource_factory, api_headers, base_url_network):
         payload = self.get_nic_payload()
         resource_factory(f"{base_url_network}/network_interface", payload)
         
-        response = requests.post(f"{base_url_network}/network_interface", headers=api_headers, json=payload)
+        response = api_client.post(f"{base_url_network}/network_interface", headers=api_headers, json=payload)
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드: {response.status_code}"
 
     @allure.story("예외 케이스")
-    def test_NW_005_ERR_invalid_ids(self, api_headers, base_url_network):
+    def test_NW_005_ERR_invalid_ids(self, api_client, api_headers, base_url_network):
         invalid_uuid = str(uuid.uuid4())
         payload = {
             "name": f"invalid-ref-{uuid.uuid4().hex[:4]}",
@@ -68,42 +68,42 @@ class TestNetworkInterfaceCRUD:
             "attached_subnet_id": invalid_uuid,
             "dr": False
         }
-        response = requests.post(f"{base_url_network}/network_interface", headers=api_headers, json=payload)
+        response = api_client.post(f"{base_url_network}/network_interface", headers=api_headers, json=payload)
         assert response.status_code == 409
 
-    def test_NW008_interface_patch(self, resource_factory, api_headers, base_url_network):
+    def test_NW008_interface_patch(self, api_client, resource_factory, api_headers, base_url_network):
         resource = resource_factory(f"{base_url_network}/network_interface", self.get_nic_payload())
         url = f"{base_url_network}/network_interface/{resource['id']}"
         new_name = f"updated-{uuid.uuid4().hex[:4]}"
         
-        requests.patch(url, headers=api_headers, json={"name": new_name})
-        assert requests.get(url, headers=api_headers).json()["name"] == new_name
+        api_client.patch(url, headers=api_headers, json={"name": new_name})
+        assert api_client.get(url, headers=api_headers).json()["name"] == new_name
 
     @allure.story("예외 케이스")
-    def test_NW_010_ERR_patch_immutable_field(self, resource_factory, api_headers, base_url_network):
+    def test_NW_010_ERR_patch_immutable_field(self, api_client, resource_factory, api_headers, base_url_network):
         resource = resource_factory(f"{base_url_network}/network_interface", self.get_nic_payload())
         url = f"{base_url_network}/network_interface/{resource['id']}"
         
-        original_zone = requests.get(url, headers=api_headers).json()["zone_id"]
+        original_zone = api_client.get(url, headers=api_headers).json()["zone_id"]
         new_zone_id = str(uuid.uuid4())
-        response = requests.patch(url, headers=api_headers, json={"zone_id": new_zone_id})
+        response = api_client.patch(url, headers=api_headers, json={"zone_id": new_zone_id})
     
         # [검증] 시나리오 A: 서버는 요청을 수락(200)해야 함
         assert response.status_code == 200, f"불변 필드 수정 시 200 OK를 기대했으나 {response.status_code}가 반환됨"
 
         # [검증] 응답은 성공이었지만, 실제로 조회를 해봤을 때 값은 바뀌지 않았어야 함
-        current_zone = requests.get(url, headers=api_headers).json()["zone_id"]
+        current_zone = api_client.get(url, headers=api_headers).json()["zone_id"]
         assert current_zone == original_zone, f"불변 필드인 zone_id가 {original_zone}에서 {current_zone}으로 변경됨"
 
-    def test_NW_011_ERR_patch_conflict(self, resource_factory, api_headers, base_url_network):
+    def test_NW_011_ERR_patch_conflict(self, api_client, resource_factory, api_headers, base_url_network):
         res_a = resource_factory(f"{base_url_network}/network_interface", self.get_nic_payload())
         res_b = resource_factory(f"{base_url_network}/network_interface", self.get_nic_payload())
         
         url_a = f"{base_url_network}/network_interface/{res_a['id']}"
-        response = requests.patch(url_a, headers=api_headers, json={"name": res_b["name"]})
+        response = api_client.patch(url_a, headers=api_headers, json={"name": res_b["name"]})
         assert response.status_code == 200, f"⛔ [FAIL] 200과 다른 상태 코드: {response.status_code}"
     
-    def test_NW_012_NW007_network_full_cycle(self, resource_factory, api_headers, base_url_network, api_helpers):
+    def test_NW_012_NW007_network_full_cycle(self, api_client, resource_factory, api_headers, base_url_network, api_helpers):
         zone_id = "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0"
 
         # --- 단계 1: 가상 네트워크 생성 ---
@@ -158,7 +158,7 @@ class TestNetworkInterfaceCRUD:
 
             detach_payload = {"attached_machine_id": None}
 
-            res = requests.patch(target_nic_url, headers=api_headers, json=detach_payload)
+            res = api_client.patch(target_nic_url, headers=api_headers, json=detach_payload)
             assert res.status_code == 200, f"⛔ [FAIL] PATCH 요청 실패: {res.text}"
 
             is_detached = api_helpers.wait_for_status(
@@ -169,24 +169,24 @@ class TestNetworkInterfaceCRUD:
                 timeout=20
             )
 
-            final_data = requests.get(target_nic_url, headers=api_headers).json()
+            final_data = api_client.get(target_nic_url, headers=api_headers).json()
             actual_machine = final_data.get("attached_machine_id")
 
             assert is_detached, f"⛔ [FAIL] NIC 해제 실패 (현재 머신 ID: {actual_machine})"
             logger.success("🎉 가상 네트워크 생성부터 NIC 해제까지 전체 시나리오 성공!")
 
-    def test_NW013_nic_delete(self, api_headers, base_url_network, api_helpers):
+    def test_NW013_nic_delete(self, api_client, api_headers, base_url_network, api_helpers):
         """삭제 테스트: resource_factory 사용하지 않고 직접 생성"""
         url = f"{base_url_network}/network_interface"
         payload = self.get_nic_payload()
         
-        response = requests.post(url, headers=api_headers, json=payload)
+        response = api_client.post(url, headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         resource_id = response.json()["id"]
         target_url = f"{url}/{resource_id}"
 
         logger.info(f"🗑️ [NW13] NIC 삭제 요청: {target_url}")
-        assert requests.delete(target_url, headers=api_headers).status_code == 200
+        assert api_client.delete(target_url, headers=api_headers).status_code == 200
 
         # api_helpers를 사용하여 스마트 대기 (지수 백오프 적용됨)
         success = api_helpers.wait_for_status(target_url, api_headers, expected_status="deleted")
@@ -195,23 +195,23 @@ class TestNetworkInterfaceCRUD:
 
 
     @allure.story("예외 케이스")
-    def test_NW_014_ERR_delete_already_deleted(self, api_headers, base_url_network):
+    def test_NW_014_ERR_delete_already_deleted(self, api_client, api_headers, base_url_network):
         """재삭제 테스트: resource_factory 사용하지 않고 직접 생성"""
         url = f"{base_url_network}/network_interface"
         payload = self.get_nic_payload()
         
         # 1. 직접 생성
-        response = requests.post(url, headers=api_headers, json=payload)
+        response = api_client.post(url, headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         resource_id = response.json()["id"]
         target_url = f"{url}/{resource_id}"
         
         # 2. 1차 삭제
-        requests.delete(target_url, headers=api_headers)
+        api_client.delete(target_url, headers=api_headers)
         allure.step(f"리소스 1차 삭제 완료 (ID: {resource_id})")
 
         # 3. 2차 삭제 시도 (이미 삭제된 상태)
-        response = requests.delete(target_url, headers=api_headers)
+        response = api_client.delete(target_url, headers=api_headers)
         res_body = response.json()
 
         # 4. 검증
@@ -225,13 +225,13 @@ class TestNetworkInterfaceCRUD:
             assert actual_status == "deleted", f"예상 상태는 deleted이나 {actual_status}가 반환됨"
 
     @allure.story("예외 케이스")
-    def test_NW_015_ERR_delete_non_existent_id(self, api_headers, base_url_network):
+    def test_NW_015_ERR_delete_non_existent_id(self, api_client, api_headers, base_url_network):
         # 1. 존재하지 않는 가짜 ID 생성
         fake_id = str(uuid.uuid4())
         target_url = f"{base_url_network}/network_interface/{fake_id}"
         
         # 2. 삭제 시도
-        response = requests.delete(target_url, headers=api_headers)
+        response = api_client.delete(target_url, headers=api_headers)
         
         # 3. 검증
         with allure.step(f"존재하지 않는 ID({fake_id}) 삭제 시도 결과 검증"):
@@ -255,68 +255,68 @@ class TestSubNetCRUD:
             "network_gw": f"192.168.{random_ip_sub}.1/24"
         }
 
-    def test_NW16_subnet_list(self, api_headers, base_url_network):
+    def test_NW16_subnet_list(self, api_client, api_headers, base_url_network):
         url = f"{base_url_network}/subnet?skip=0&count=20"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         assert isinstance(response.json(), list)
 
-    def test_NW017_subnet_create_and_get(self, resource_factory, api_headers, base_url_network):
+    def test_NW017_subnet_create_and_get(self, api_client, resource_factory, api_headers, base_url_network):
         payload = self.get_subnet_payload()
         resource = resource_factory(f"{base_url_network}/subnet", payload)
         
         get_url = f"{base_url_network}/subnet/{resource['id']}"
-        response = requests.get(get_url, headers=api_headers)
+        response = api_client.get(get_url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         assert response.json()["name"] == payload["name"]
 
     @allure.story("예외 케이스")
-    def test_NW018_ERR_duplicate_subnet_create_fail(self, resource_factory, api_headers, base_url_network):
+    def test_NW018_ERR_duplicate_subnet_create_fail(self, api_client, resource_factory, api_headers, base_url_network):
         payload = self.get_subnet_payload()
         resource_factory(f"{base_url_network}/subnet", payload)
         
-        response = requests.post(f"{base_url_network}/subnet", headers=api_headers, json=payload)
+        response = api_client.post(f"{base_url_network}/subnet", headers=api_headers, json=payload)
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드: {response.status_code}"
 
     @allure.story("예외 케이스")
-    def test_NW020_ERR_get_non_existent_subnet(self, api_headers, base_url_network):
+    def test_NW020_ERR_get_non_existent_subnet(self, api_client, api_headers, base_url_network):
         fake_id = str(uuid.uuid4()) 
         url = f"{base_url_network}/subnet/{fake_id}"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드: {response.status_code}"
 
-    def test_NW021_subnet_patch(self, resource_factory, api_headers, base_url_network):
+    def test_NW021_subnet_patch(self, api_client, resource_factory, api_headers, base_url_network):
         resource = resource_factory(f"{base_url_network}/subnet", self.get_subnet_payload())
         url = f"{base_url_network}/subnet/{resource['id']}"
         new_name = f"updated-{uuid.uuid4().hex[:4]}"
         
-        requests.patch(url, headers=api_headers, json={"name": new_name})
-        assert requests.get(url, headers=api_headers).json()["name"] == new_name
+        api_client.patch(url, headers=api_headers, json={"name": new_name})
+        assert api_client.get(url, headers=api_headers).json()["name"] == new_name
 
-    def test_NW022_subnet_repeated_patch(self, resource_factory, api_headers, base_url_network):
+    def test_NW022_subnet_repeated_patch(self, api_client, resource_factory, api_headers, base_url_network):
         resource = resource_factory(f"{base_url_network}/subnet", self.get_subnet_payload())
         url = f"{base_url_network}/subnet/{resource['id']}"
         
         for i in range(3):
             new_name = f"repeated-{i}-{uuid.uuid4().hex[:4]}"
             with allure.step(f"수정 시도 {i+1}: 이름을 '{new_name}'(으)로 변경"):
-                requests.patch(url, headers=api_headers, json={"name": new_name})
-                current_name = requests.get(url, headers=api_headers).json()["name"]
+                api_client.patch(url, headers=api_headers, json={"name": new_name})
+                current_name = api_client.get(url, headers=api_headers).json()["name"]
                 assert current_name == new_name, f"⛔ [FAIL] 수정 {i+1} 실패: 현재 이름은 '{current_name}'"
                 logger.info(f"✅ 수정 {i+1} 성공: 이름이 '{current_name}'(으)로 변경됨")
 
     
-    def test_NW023_subnet_delete(self, api_headers, base_url_network, api_helpers):
+    def test_NW023_subnet_delete(self, api_client, api_headers, base_url_network, api_helpers):
         url = f"{base_url_network}/subnet"
         payload = self.get_subnet_payload()
         
-        response = requests.post(url, headers=api_headers, json=payload)
+        response = api_client.post(url, headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         resource_id = response.json()["id"]
         target_url = f"{url}/{resource_id}"
 
         logger.info(f"🗑️ [NW23] 서브넷 삭제 요청: {target_url}")
-        assert requests.delete(target_url, headers=api_headers).status_code == 200
+        assert api_client.delete(target_url, headers=api_headers).status_code == 200
 
         # api_helpers를 사용하여 스마트 대기
         success = api_helpers.wait_for_status(target_url, api_headers, expected_status="deleted")
@@ -324,7 +324,7 @@ class TestSubNetCRUD:
         logger.success("✅ [NW23] 서브넷 삭제 확인 완료")
 
     @allure.story("예외 케이스")
-    def test_NW024_ERR_delete_subnet_with_attached_nic(self, resource_factory, api_headers, base_url_network):
+    def test_NW024_ERR_delete_subnet_with_attached_nic(self, api_client, resource_factory, api_headers, base_url_network):
         # 1. 서브넷 생성
         subnet_payload = self.get_subnet_payload()
         subnet = resource_factory(f"{base_url_network}/subnet", subnet_payload)
@@ -341,7 +341,7 @@ class TestSubNetCRUD:
             resource_factory(f"{base_url_network}/network_interface", nic_payload)
 
         url = f"{base_url_network}/subnet/{subnet_id}"
-        response = requests.delete(url, headers=api_headers)
+        response = api_client.delete(url, headers=api_headers)
 
         with allure.step("삭제 차단 및 에러 메시지 검증"):
             # 응답 코드 확인
@@ -355,11 +355,11 @@ class TestSubNetCRUD:
             logger.success(f"✅ 검증 성공: 서버가 '{res_body['code']}' 코드로 삭제를 정상적으로 차단함")
 
     @allure.story("예외 케이스")
-    def test_NW025_ERR_delete_non_existent_subnet(self, api_headers, base_url_network):
+    def test_NW025_ERR_delete_non_existent_subnet(self, api_client, api_headers, base_url_network):
         fake_id = str(uuid.uuid4())
         target_url = f"{base_url_network}/subnet/{fake_id}"
         
-        response = requests.delete(target_url, headers=api_headers)
+        response = api_client.delete(target_url, headers=api_headers)
         
         with allure.step(f"존재하지 않는 ID({fake_id}) 삭제 시도 결과 검증"):
             assert response.status_code == 409, (
@@ -379,84 +379,84 @@ class TestVirtualNetworkCRUD:
             "network_cidr": "192.168.0.0/16"
         }
     
-    def test_NW026_vn_list(self, api_headers, base_url_network):
+    def test_NW026_vn_list(self, api_client, api_headers, base_url_network):
         url = f"{base_url_network}/virtual_network?skip=0&count=20"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         assert isinstance(response.json(), list)
 
     #테스트 케이스 30번 포함
-    def test_NW027_NW030_vn_create_and_get(self, resource_factory, api_headers, base_url_network):
+    def test_NW027_NW030_vn_create_and_get(self, api_client, resource_factory, api_headers, base_url_network):
         payload = self.get_vn_payload()
         resource = resource_factory(f"{base_url_network}/virtual_network", payload)
         
         get_url = f"{base_url_network}/virtual_network/{resource['id']}"
-        response = requests.get(get_url, headers=api_headers)
+        response = api_client.get(get_url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         assert response.json()["name"] == payload["name"]
 
     @allure.story("예외 케이스")
-    def test_NW028_ERR_duplicate_vn_create_fail(self, resource_factory, api_headers, base_url_network):
+    def test_NW028_ERR_duplicate_vn_create_fail(self, api_client, resource_factory, api_headers, base_url_network):
         payload = self.get_vn_payload()
         resource_factory(f"{base_url_network}/virtual_network", payload)
         
-        response = requests.post(f"{base_url_network}/virtual_network", headers=api_headers, json=payload)
+        response = api_client.post(f"{base_url_network}/virtual_network", headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 200와 다른 상태 코드: {response.status_code}"
 
         if response.status_code == 200:
             extra_id = response.json().get("id")
-            requests.delete(f"{base_url_network}/virtual_network/{extra_id}", headers=api_headers)
+            api_client.delete(f"{base_url_network}/virtual_network/{extra_id}", headers=api_headers)
         
         assert response.status_code == 200 # 기존 어설션 유지
 
     @allure.story("예외 케이스")
-    def test_NW029_ERR_create_missing_required_field(self, api_headers, base_url_network):
+    def test_NW029_ERR_create_missing_required_field(self, api_client, api_headers, base_url_network):
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "network_cidr": "192.168.0.0/16"
         }
-        response = requests.post(f"{base_url_network}/virtual_network", headers=api_headers, json=payload)
+        response = api_client.post(f"{base_url_network}/virtual_network", headers=api_headers, json=payload)
         assert response.status_code == 422, f"⛔ [FAIL] 422와 다른 상태 코드: {response.status_code}"   
 
     @allure.story("예외 케이스")  
-    def test_NW031_ERR_get_non_existent_vn(self, api_headers, base_url_network):
+    def test_NW031_ERR_get_non_existent_vn(self, api_client, api_headers, base_url_network):
         fake_id = str(uuid.uuid4()) 
         url = f"{base_url_network}/virtual_network/{fake_id}"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드: {response.status_code}"
 
-    def test_NW032_vn_patch(self, resource_factory, api_headers, base_url_network):
+    def test_NW032_vn_patch(self, api_client, resource_factory, api_headers, base_url_network):
         resource = resource_factory(f"{base_url_network}/virtual_network", self.get_vn_payload())
         url = f"{base_url_network}/virtual_network/{resource['id']}"
         new_name = f"updated-{uuid.uuid4().hex[:4]}"
         
-        requests.patch(url, headers=api_headers, json={"name": new_name})
-        assert requests.get(url, headers=api_headers).json()["name"] == new_name
+        api_client.patch(url, headers=api_headers, json={"name": new_name})
+        assert api_client.get(url, headers=api_headers).json()["name"] == new_name
 
     @allure.story("예외 케이스")
-    def test_NW033_vn_repeated_patch(self, resource_factory, api_headers,    base_url_network):
+    def test_NW033_vn_repeated_patch(self, api_client, resource_factory, api_headers,    base_url_network):
         resource = resource_factory(f"{base_url_network}/virtual_network", self.get_vn_payload())
         url = f"{base_url_network}/virtual_network/{resource['id']}"
         
         for i in range(3):
             new_name = f"repeated-{i}-{uuid.uuid4().hex[:4]}"
             with allure.step(f"수정 시도 {i+1}: 이름을 '{new_name}'(으)로 변경"):
-                requests.patch(url, headers=api_headers, json={"name": new_name})
-                current_name = requests.get(url, headers=api_headers).json()["name"]
+                api_client.patch(url, headers=api_headers, json={"name": new_name})
+                current_name = api_client.get(url, headers=api_headers).json()["name"]
                 assert current_name == new_name, f"⛔ [FAIL] 수정 {i+1} 실패: 현재 이름은 '{current_name}'"
                 logger.info(f"✅ 수정 {i+1} 성공: 이름이 '{current_name}'(으)로 변경됨")
 
-    def test_NW034_vn_delete(self, api_headers, base_url_network, api_helpers):
+    def test_NW034_vn_delete(self, api_client, api_headers, base_url_network, api_helpers):
         url = f"{base_url_network}/virtual_network"
         payload = self.get_vn_payload()
         
-        response = requests.post(url, headers=api_headers, json=payload)
+        response = api_client.post(url, headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         resource_id = response.json()["id"]
         target_url = f"{url}/{resource_id}"
 
         logger.info(f"🗑️ [NW33] 가상 네트워크 삭제 요청: {target_url}")
-        assert requests.delete(target_url, headers=api_headers).status_code == 200
+        assert api_client.delete(target_url, headers=api_headers).status_code == 200
 
         # api_helpers를 사용하여 스마트 대기
         success = api_helpers.wait_for_status(target_url, api_headers,expected_status="deleted")
@@ -464,11 +464,11 @@ class TestVirtualNetworkCRUD:
         logger.success("✅ [NW33] 가상 네트워크 삭제 확인 완료")
 
     @allure.story("예외 케이스")
-    def test_NW035_ERR_delete_non_existent_vn(self, api_headers, base_url_network):
+    def test_NW035_ERR_delete_non_existent_vn(self, api_client, api_headers, base_url_network):
         fake_id = str(uuid.uuid4())
         target_url = f"{base_url_network}/virtual_network/{fake_id}"
         
-        response = requests.delete(target_url, headers=api_headers)
+        response = api_client.delete(target_url, headers=api_headers)
         
         with allure.step(f"존재하지 않는 ID({fake_id}) 삭제 시도 결과 검증"):
             assert response.status_code == 409, (
@@ -479,23 +479,23 @@ class TestVirtualNetworkCRUD:
             allure.attach(str(res_body), name="서버 응답 내용") 
 
     @allure.story("예외 케이스")
-    def test_NW036_ERR_delete_already_deleted_vn(self, api_headers, base_url_network, api_helpers):  
+    def test_NW036_ERR_delete_already_deleted_vn(self, api_client, api_headers, base_url_network, api_helpers):  
         """재삭제 테스트: resource_factory 사용하지 않고 직접 생성"""
         url = f"{base_url_network}/virtual_network"
         payload = self.get_vn_payload()
         
         # 1. 직접 생성
-        response = requests.post(url, headers=api_headers, json=payload)
+        response = api_client.post(url, headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
         resource_id = response.json()["id"]
         target_url = f"{url}/{resource_id}"
         
         # 2. 1차 삭제
-        requests.delete(target_url, headers=api_headers)
+        api_client.delete(target_url, headers=api_headers)
         allure.step(f"리소스 1차 삭제 완료 (ID: {resource_id})")
 
         # 3. 2차 삭제 시도 (이미 삭제된 상태)
-        response = requests.delete(target_url, headers=api_headers)
+        response = api_client.delete(target_url, headers=api_headers)
         res_body = response.json()
 
         # 4. 검증
@@ -510,7 +510,7 @@ class TestVirtualNetworkCRUD:
             allure.step("✅ 재삭제 테스트 완료")
 
     @allure.story("예외 케이스")
-    def test_NW037_ERR_delete_vn_with_attached_subnet(self, resource_factory, api_headers, base_url_network):
+    def test_NW037_ERR_delete_vn_with_attached_subnet(self, api_client, resource_factory, api_headers, base_url_network):
         # 1. 가상 네트워크(VN) 생성
         vn_payload = self.get_vn_payload()
         vn = resource_factory(f"{base_url_network}/virtual_network", vn_payload)
@@ -528,7 +528,7 @@ class TestVirtualNetworkCRUD:
 
         # 2. 가상 네트워크 삭제 시도
         url = f"{base_url_network}/virtual_network/{vn_id}"
-        response = requests.delete(url, headers=api_headers)
+        response = api_client.delete(url, headers=api_headers)
         
         with allure.step("삭제 차단 및 에러 메시지 검증"):
             assert response.status_code == 409, (
@@ -554,10 +554,10 @@ class TestPublicIpCRUD:
             "dr": False
         }
 
-    def test_NW038_public_ip_list(self, api_headers, base_url_network):
+    def test_NW038_public_ip_list(self, api_client, api_headers, base_url_network):
         url = f"{base_url_network}/public_ip?skip=0&count=20"
         with allure.step("공인 IP 목록 조회 API 호출"):
-            response = requests.get(url, headers=api_headers)
+            response = api_client.get(url, headers=api_headers)
         
         with allure.step("응답 상태 코드 및 데이터 형식 검증"):
             assert response.status_code == 200, f"⛔ 목록 조회 실패: {response.text}"
@@ -567,37 +567,36 @@ class TestPublicIpCRUD:
 
 
     @allure.story("예외 케이스")
-    def test_NW039_ERR_duplicate_public_ip_create_fail(self, resource_factory, api_headers, base_url_network):
+    def test_NW039_ERR_duplicate_public_ip_create_fail(self, api_client, resource_factory, api_headers, base_url_network):
         payload = self.get_public_ip_payload()
         resource_factory(f"{base_url_network}/public_ip", payload)
         
-        response = requests.post(f"{base_url_network}/public_ip", headers=api_headers, json=payload)
+        response = api_client.post(f"{base_url_network}/public_ip", headers=api_headers, json=payload)
 
         if response.status_code == 200:
             extra_id = response.json().get("id")
-            requests.delete(f"{base_url_network}/public_ip/{extra_id}", headers=api_headers)
+            api_client.delete(f"{base_url_network}/public_ip/{extra_id}", headers=api_headers)
             
         assert response.status_code == 200
 
     @allure.story("예외 케이스")
-    def test_NW040_ERR_create_public_ip_missing_required_field(self, api_headers, base_url_network):
+    def test_NW040_ERR_create_public_ip_missing_required_field(self, api_client, api_headers, base_url_network):
         payload = {"zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0"} # name 누락
-        response = requests.post(f"{base_url_network}/public_ip", headers=api_headers, json=payload)
+        response = api_client.post(f"{base_url_network}/public_ip", headers=api_headers, json=payload)
         assert response.status_code == 422, f"⛔ 예상 코드 422, 실제: {response.status_code}"
 
-    def test_NW041_check_created_public_ip_in_list(self, resource_factory, api_headers, base_url_network):
+    def test_NW041_check_created_public_ip_in_list(self, api_client, resource_factory, api_headers, base_url_network):
         payload = self.get_public_ip_payload()
         created_ip = resource_factory(f"{base_url_network}/public_ip", payload)
         target_id = created_ip['id']
 
         with allure.step("전체 목록에서 생성한 ID 검색"):
-            response = requests.get(f"{base_url_network}/public_ip", headers=api_headers)
-            ip_list = response.json()
-            found = any(ip['id'] == target_id for ip in ip_list)
+            # 페이지 단위로 조회하다가 찾으면 즉시 중단
+            found = find_first(f"{base_url_network}/public_ip", api_headers, lambda ip: ip['id'] == target_id, client=api_client) is not None
             assert found, f"⛔ 생성된 공인 IP {target_id}가 목록에 없습니다."
             logger.success(f"✅ 목록 노출 확인 완료")
 
-    def test_NW042_public_ip_patch(self, resource_factory, api_headers, base_url_network):
+    def test_NW042_public_ip_patch(self, api_client, resource_factory, api_headers, base_url_network):
         """공인 IP의 태그를 수정하고 변경 사항이 반영되는지 확인"""
         # 1. 리소스 생성
         resource = resource_factory(f"{base_url_network}/public_ip", self.get_public_ip_payload())
@@ -609,11 +608,11 @@ class TestPublicIpCRUD:
         }
 
         with allure.step("공인 IP 태그 수정 요청"):
-            response = requests.patch(url, headers=api_headers, json=patch_payload)
+            response = api_client.patch(url, headers=api_headers, json=patch_payload)
             assert response.status_code == 200, f"⛔ PATCH 요청 실패: {response.text}"
 
         with allure.step("수정된 데이터 상세 조회 및 검증"):
-            updated_ip = requests.get(url, headers=api_headers).json()
+            updated_ip = api_client.get(url, headers=api_headers).json()
             
             # tags 필드 검증 (KeyError 방지)
             actual_tags = updated_ip.get("tags", {})
@@ -623,18 +622,18 @@ class TestPublicIpCRUD:
             logger.success(f"✅ 공인 IP 태그 수정 및 반영 확인 완료: {actual_tags}")
 
     @allure.story("예외 케이스")
-    def test_NW043_ERR_attach_public_ip_to_non_existent_nic(self, resource_factory, api_headers, base_url_network):
+    def test_NW043_ERR_attach_public_ip_to_non_existent_nic(self, api_client, resource_factory, api_headers, base_url_network):
         public_ip = resource_factory(f"{base_url_network}/public_ip", self.get_public_ip_payload())
         fake_nic_id = str(uuid.uuid4())
         
         url = f"{base_url_network}/public_ip/{public_ip['id']}"
-        response = requests.patch(url, headers=api_headers, json={"attached_network_interface_id": fake_nic_id})
+        response = api_client.patch(url, headers=api_headers, json={"attached_network_interface_id": fake_nic_id})
         
         # [수정] 서버가 409를 준다면 409로 검증
         assert response.status_code in [409, 422], f"⛔ 예상 코드 409/422, 실제: {response.status_code}"
 
     @allure.story("예외 케이스") 
-    def test_NW044_public_ip_detach(self, resource_factory, api_headers, base_url_network):
+    def test_NW044_public_ip_detach(self, api_client, resource_factory, api_headers, base_url_network):
         public_ip = resource_factory(f"{base_url_network}/public_ip", self.get_public_ip_payload())
         
         # [수정] NIC 생성 시 필수 필드(attached_subnet_id, dr) 추가
@@ -649,37 +648,37 @@ class TestPublicIpCRUD:
         
         url = f"{base_url_network}/public_ip/{public_ip['id']}"
         # 연결 후 해제
-        requests.patch(url, headers=api_headers, json={"attached_network_interface_id": nic["id"]})
-        requests.patch(url, headers=api_headers, json={"attached_network_interface_id": None})
+        api_client.patch(url, headers=api_headers, json={"attached_network_interface_id": nic["id"]})
+        api_client.patch(url, headers=api_headers, json={"attached_network_interface_id": None})
         
-        updated_ip = requests.get(url, headers=api_headers).json()
+        updated_ip = api_client.get(url, headers=api_headers).json()
         val = updated_ip.get("attached_network_interface_id")
         assert val is None or val == "", "⛔ 연결 해제 실패"
 
-    def test_NW045_public_ip_delete(self, api_headers, base_url_network, api_helpers):
-        response = requests.post(f"{base_url_network}/public_ip", headers=api_headers, json=self.get_public_ip_payload())
+    def test_NW045_public_ip_delete(self, api_client, api_headers, base_url_network, api_helpers):
+        response = api_client.post(f"{base_url_network}/public_ip", headers=api_headers, json=self.get_public_ip_payload())
         resource_id = response.json()["id"]
         target_url = f"{base_url_network}/public_ip/{resource_id}"
 
-        requests.delete(target_url, headers=api_headers)
+        api_client.delete(target_url, headers=api_headers)
 
         # [수정] expected_status="deleted" 필수 인자 추가
         success = api_helpers.wait_for_status(target_url, api_headers,expected_status="deleted")
         assert success, "⛔ 삭제 대기 타임아웃"
 
     @allure.story("예외 케이스")
-    def test_NW046_ERR_delete_already_deleted_public_ip(self, api_headers, base_url_network, api_helpers):  
-        response = requests.post(f"{base_url_network}/public_ip", headers=api_headers, json=self.get_public_ip_payload())
+    def test_NW046_ERR_delete_already_deleted_public_ip(self, api_client, api_headers, base_url_network, api_helpers):  
+        response = api_client.post(f"{base_url_network}/public_ip", headers=api_headers, json=self.get_public_ip_payload())
         resource_id = response.json()["id"]
         target_url = f"{base_url_network}/public_ip/{resource_id}"
         
         # 1차 삭제
-        requests.delete(target_url, headers=api_headers)
+        api_client.delete(target_url, headers=api_headers)
         api_helpers.wait_for_status(target_url, api_headers, expected_status="deleted")
         allure.step(f"리소스 1차 삭제 완료 (ID: {resource_id})")
 
         # 2차 삭제 시도 (이미 삭제된 상태)
-        response = requests.delete(target_url, headers=api_headers)
+        response = api_client.delete(target_url, headers=api_headers)
         res_body = response.json()
 
         # 검증
@@ -692,11 +691,11 @@ class TestPublicIpCRUD:
             assert actual_status == "deleted", f"예상 상태는 deleted이나 {actual_status}가 반환됨"
 
     @allure.story("예외 케이스")
-    def test_NW047_ERR_delete_non_existent_public_ip(self, api_headers, base_url_network):
+    def test_NW047_ERR_delete_non_existent_public_ip(self, api_client, api_headers, base_url_network):
         fake_id = str(uuid.uuid4())
         target_url = f"{base_url_network}/public_ip/{fake_id}"
         
-        response = requests.delete(target_url, headers=api_headers)
+        response = api_client.delete(target_url, headers=api_headers)
         
         with allure.step(f"존재하지 않는 ID({fake_id}) 삭제 시도 결과 검증"):
             assert response.status_code == 409, (
@@ -706,7 +705,7 @@ class TestPublicIpCRUD:
             res_body = response.json()
             allure.attach(str(res_body), name="서버 응답 내용")
 
-    def test_NW048_public_ip_nic_integration(self, resource_factory, api_headers, base_url_network, api_helpers):
+    def test_NW048_public_ip_nic_integration(self, api_client, resource_factory, api_headers, base_url_network, api_helpers):
         public_ip = resource_factory(f"{base_url_network}/public_ip", self.get_public_ip_payload())
         
         # [수정] NIC 생성 시 필수 필드 추가
@@ -723,19 +722,19 @@ class TestPublicIpCRUD:
 
         try:
             with allure.step("연결 및 해제"):
-                requests.patch(url, headers=api_headers, json={"attached_network_interface_id": nic["id"]})
-                detach_res = requests.patch(url, headers=api_headers, json={"attached_network_interface_id": None})
+                api_client.patch(url, headers=api_headers, json={"attached_network_interface_id": nic["id"]})
+                detach_res = api_client.patch(url, headers=api_headers, json={"attached_network_interface_id": None})
                 assert detach_res.status_code == 200, "해제 요청 자체가 실패함"
 
             with allure.step("최종 상태 검증"):
-                updated_ip = requests.get(url, headers=api_headers).json()
+                updated_ip = api_client.get(url, headers=api_headers).json()
                 assert not updated_ip.get("attached_network_interface_id"), "⛔ 미해제 상태"
         
         finally:
-            requests.patch(url, headers=api_headers, json={"attached_network_interface_id": None})
+            api_client.patch(url, headers=api_headers, json={"attached_network_interface_id": None})
 
     @allure.story("예외 케이스")
-    def test_NW049_ERR_access_with_expired_token(self, base_url_network):
+    def test_NW049_ERR_access_with_expired_token(self, api_client, base_url_network):
         expired_headers = {"Authorization": "Bearer expired_token", "Content-Type": "application/json"}
-        response = requests.get(f"{base_url_network}/public_ip", headers=expired_headers)
+        response = api_client.get(f"{base_url_network}/public_ip", headers=expired_headers)
         assert response.status_code in [401, 403], f"⛔ 예상 코드 401/403, 실제: {response.status_code}"
\ No newline at end of file
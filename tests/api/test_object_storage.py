@@ -1,5 +1,4 @@
 import pytest
-import requests
 import uuid
 import allure
 
@@ -22,7 +21,7 @@ class TestBucketCRUD:
 
     @allure.story("예외 케이스")
         # 동일 이름 버킷 재생성(예외)
-    def test_OS002_post_duplicate_bucket(self, api_headers, existing_bucket, base_url_object_storage):
+    def test_OS002_post_duplicate_bucket(self, api_client, api_headers, existing_bucket, base_url_object_storage):
         bucket_name = existing_bucket["name"]
         payload = {
             "name": bucket_name,
@@ -30,7 +29,7 @@ class TestBucketCRUD:
             "size_gib": 10,
             "tags": {}
         }
-        response = requests.post(base_url_object_storage, headers=api_headers, json=payload)
+        response = api_client.post(base_url_object_storage, headers=api_headers, json=payload)
         # 상태 코드 검증
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -41,13 +40,13 @@ class TestBucketCRUD:
 
     @allure.story("예외 케이스")
         # 요청 바디 값 누락 생성(예외)
-    def test_OS003_post_with_missing_body(self, api_headers, base_url_object_storage):
+    def test_OS003_post_with_missing_body(self, api_client, api_headers, base_url_object_storage):
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "size_gib": 10,
             "tags": {}
         }
-        response = requests.post(base_url_object_storage, headers=api_headers, json=payload)
+        response = api_client.post(base_url_object_storage, headers=api_headers, json=payload)
         # 상태 코드 검증
         assert response.status_code == 422, f"⛔ [FAIL] 422와 다른 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -56,9 +55,9 @@ class TestBucketCRUD:
         assert "not valid" in response_json["message"]
 
 
-    def test_OS004_get_all_list(self, api_headers, base_url_object_storage):
+    def test_OS004_get_all_list(self, api_client, api_headers, base_url_object_storage):
         url = f"{base_url_object_storage}?count=50"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         # 상태 코드 검증
         assert response.status_code == 200, f"⛔ [FAIL] 버킷 목록 조회 실패 - 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -70,9 +69,9 @@ class TestBucketCRUD:
 
     @allure.story("예외 케이스")
         # 잘못된 URL 입력 조회(예외))
-    def test_OS005_get_with_wrong_url(self, api_headers, base_url_object_storage):
+    def test_OS005_get_with_wrong_url(self, api_client, api_headers, base_url_object_storage):
         url = f"{base_url_object_storage}?count=50.."
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         # 상태 코드 검증
         assert response.status_code == 422, f"⛔ [FAIL] 422와 다른 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -81,12 +80,13 @@ class TestBucketCRUD:
         assert "not valid" in response_json["message"]
 
 
-    def test_OS006_get_new_bucket(self, api_headers, existing_bucket, base_url_object_storage):
+    @pytest.mark.readonly
+    def test_OS006_get_new_bucket(self, api_client, api_headers, existing_bucket, base_url_object_storage):
         bucket_id = existing_bucket["id"]
         bucket_name = existing_bucket["name"]
 
         url = f"{base_url_object_storage}/{bucket_id}"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 버킷 단건 조회 실패 - {response.status_code}: {response.text}"
         # 응답 바디 검증
         response_json = response.json()
@@ -101,13 +101,13 @@ class TestBucketCRUD:
         assert response_json["size_gib"] == 10
 
 
-    def test_OS007_patch_bucket_name(self, api_headers, existing_bucket, base_url_object_storage):
+    def test_OS007_patch_bucket_name(self, api_client, api_headers, existing_bucket, base_url_object_storage):
         bucket_id = existing_bucket["id"]
         bucket_name = existing_bucket["name"]
         url = f"{base_url_object_storage}/{bucket_id}"
         payload = {"name": "team2-01"}
 
-        response = requests.patch(url, headers=api_headers, json=payload)
+        response = api_client.patch(url, headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 버킷 수정 실패 - {response.status_code}: {response.text}"
         response_json = response.json()
         # 응답 바디 검증
@@ -120,12 +120,12 @@ class TestBucketCRUD:
     @allure.story("xfail")
         # default 값이 아닌 필드로 수정(예외)
     @pytest.mark.xfail(reason="PATCH 요청에서 잘못된 필드 전달 시 200 OK 반환되는 문제")
-    def test_OS008_patch_invalid_field(self, api_headers, existing_bucket, base_url_object_storage):
+    def test_OS008_patch_invalid_field(self, api_client, api_headers, existing_bucket, base_url_object_storage):
         bucket_id = existing_bucket["id"]
         url = f"{base_url_object_storage}/{bucket_id}"
         payload = {"id": "team2-01"}
 
-        response = requests.patch(url, headers=api_headers, json=payload)
+        response = api_client.patch(url, headers=api_headers, json=payload)
         # 상태 코드 검증
         assert response.status_code == 422, f"⛔ [FAIL] 422와 다른 상태 코드 - {response.status_code}: {response.text}"
         response_json = response.json()
@@ -134,11 +134,11 @@ class TestBucketCRUD:
         assert "not valid" in response_json["message"]
 
 
-    def test_OS009_delete_bucket(self, api_headers, existing_bucket, base_url_object_storage):
+    def test_OS009_delete_bucket(self, api_client, api_headers, existing_bucket, base_url_object_storage):
         bucket_id = existing_bucket["id"]
         url = f"{base_url_object_storage}/{bucket_id}"
 
-        response = requests.delete(url, headers=api_headers)
+        response = api_client.delete(url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 버킷 삭제 실패 - 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
         response_json = response.json()
@@ -149,11 +149,11 @@ class TestBucketCRUD:
 
     @allure.story("예외 케이스")
         # 동일 버킷 재삭제(예외)
-    def test_OS010_delete_bucket_again(self, api_headers, existing_bucket, base_url_object_storage):
+    def test_OS010_delete_bucket_again(self, api_client, api_headers, existing_bucket, base_url_object_storage):
         bucket_id = existing_bucket["id"]
         # 삭제 후 재삭제 시도
-        requests.delete(f"{base_url_object_storage}/{bucket_id}", headers=api_headers)
-        response = requests.delete(f"{base_url_object_storage}/{bucket_id}", headers=api_headers)
+        api_client.delete(f"{base_url_object_storage}/{bucket_id}", headers=api_headers)
+        response = api_client.delete(f"{base_url_object_storage}/{bucket_id}", headers=api_headers)
         # 상태 코드 검증
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -181,14 +181,14 @@ class TestUserCRUD:
 
     @allure.story("예외 케이스")
         # 동일 사용자 재생성(예외)
-    def test_OS019_post_duplicate_user(self, api_headers, existing_user, base_url_object_storage):
+    def test_OS019_post_duplicate_user(self, api_client, api_headers, existing_user, base_url_object_storage):
         user_name = existing_user["name"]
         payload = {
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
             "name": user_name,
             "tags": {}
         }
-        response = requests.post(f"{base_url_object_storage}/user", headers=api_headers, json=payload)
+        response = api_client.post(f"{base_url_object_storage}/user", headers=api_headers, json=payload)
         # 상태 코드 검증
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -197,9 +197,9 @@ class TestUserCRUD:
         assert "already exists" in response_json["message"]
 
 
-    def test_OS020_get_all_list(self, api_headers, base_url_object_storage):
+    def test_OS020_get_all_list(self, api_client, api_headers, base_url_object_storage):
         url = f"{base_url_object_storage}/user?count=50"
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         # 상태 코드 검증
         assert response.status_code == 200, f"⛔ [FAIL] 사용자 목록 조회 실패 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -209,13 +209,13 @@ class TestUserCRUD:
         assert response_list[0]["id"] is not None
 
 
-    def test_OS021_get_new_user(self, api_headers, existing_user, base_url_object_storage, api_helpers):
+    def test_OS021_get_new_user(self, api_client, api_headers, existing_user, base_url_object_storage, api_helpers):
         user_id = existing_user["id"]
         user_name = existing_user["name"]
         url = f"{base_url_object_storage}/user/{user_id}"
         # 유저 생성시 polling
         api_helpers.wait_for_status(url, api_headers, expected_status="activated", timeout=10)
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 사용자 단건 조회 실패 - {response.status_code}: {response.text}"
         # 응답 바디 검증
         response_json = response.json()
@@ -230,13 +230,13 @@ class TestUserCRUD:
         assert response_json["status"] == "activated", f"⛔ [FAIL] 예상과 다른 상태: {response.text}"
 
 
-    def test_OS022_patch_user_name(self, api_headers, existing_user, base_url_object_storage):
+    def test_OS022_patch_user_name(self, api_client, api_headers, existing_user, base_url_object_storage):
         user_id = existing_user["id"]
         user_name = existing_user["name"]
         url = f"{base_url_object_storage}/user/{user_id}"
         payload = {"name": "team2-01"}
 
-        response = requests.patch(url, headers=api_headers, json=payload)
+        response = api_client.patch(url, headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 사용자 수정 실패  - {response.status_code}: {response.text}"
         response_json = response.json()
         # 응답 바디 검증
@@ -248,12 +248,12 @@ class TestUserCRUD:
     @allure.story("예외 케이스")
     @allure.story("xfail")
     @pytest.mark.xfail(reason="PATCH 요청에서 잘못된 필드 전달 시 200 OK 반환되는 문제")
-    def test_OS023_patch_invalid_field(self, api_headers, existing_user, base_url_object_storage):
+    def test_OS023_patch_invalid_field(self, api_client, api_headers, existing_user, base_url_object_storage):
         user_id = existing_user["id"]
         url = f"{base_url_object_storage}/user/{user_id}"
         payload = {"id": "team2-01"}
 
-        response = requests.patch(url, headers=api_headers, json=payload)
+        response = api_client.patch(url, headers=api_headers, json=payload)
         # 상태 코드 검증
         assert response.status_code == 422, f"⛔ [FAIL] 422와 다른 상태 코드 - {response.status_code}: {response.text}"
         response_json = response.json()
@@ -262,11 +262,11 @@ class TestUserCRUD:
         assert "not valid" in response_json["message"]
 
 
-    def test_OS024_delete_user(self, api_headers, existing_user, base_url_object_storage):
+    def test_OS024_delete_user(self, api_client, api_headers, existing_user, base_url_object_storage):
         user_id = existing_user["id"]
         url = f"{base_url_object_storage}/user/{user_id}"
 
-        response = requests.delete(url, headers=api_headers)
+        response = api_client.delete(url, headers=api_headers)
         # 상태 코드 검증
         assert response.status_code == 200, f"⛔ [FAIL] 사용자 삭제 실패 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -280,26 +280,46 @@ class TestUserCRUD:
 class TestUserGrantCRUD:
 
     @pytest.fixture
-    def existing_user_grant(self, api_headers, existing_bucket, existing_user, base_url_object_storage, api_helpers):
+    def existing_user_grant(self, api_client, api_headers, existing_bucket, existing_user, base_url_object_storage, api_helpers, janitor):
         payload = {
             "object_storage_id": existing_bucket["id"],
             "object_storage_user_id": existing_user["id"],
             "permission": "read_write",
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0"
             }
-        # 버킷/사용자 생성시 polling
-        api_helpers.wait_for_status(f"{base_url_object_storage}/user/{existing_bucket['id']}", api_headers, expected_status="activated",timeout=10)
-        api_helpers.wait_for_status(f"{base_url_object_storage}/user/{existing_user['id']}", api_headers, expected_status="activated",timeout=10)
-        response = requests.post(f"{base_url_object_storage}/user_grant", headers=api_headers, json=payload)
+        # 버킷/사용자 생성시 polling (동시 대기)
+        api_helpers.wait_for_statuses([
+            (f"{base_url_object_storage}/user/{existing_bucket['id']}", "activated"),
+            (f"{base_url_object_storage}/user/{existing_user['id']}", "activated"),
+        ], api_headers, timeout=10)
+        response = api_client.post(f"{base_url_object_storage}/user_grant", headers=api_headers, json=payload)
         assert response.status_code == 200, f"⛔ [FAIL] 사용자 권한 생성 실패 - {response.status_code}: {response.text}"
         grant_id = response.json()["id"]
         yield {"id": grant_id, "bucket_id": existing_bucket["id"], "user_id": existing_user["id"], "payload": payload}
-        requests.delete(f"{base_url_object_storage}/user_grant/{grant_id}", headers=api_headers)
-        # 권한 삭제시 polling
-        api_helpers.wait_for_status(f"{base_url_object_storage}/user_grant/{grant_id}", api_headers, expected_status="deleted",timeout=10)
+        grant_url = f"{base_url_object_storage}/user_grant/{grant_id}"
+
+        # 권한 삭제 요청 후 deleted까지 polling (지연 정리/즉시 정리 모두 같은 순서)
+        def delete_grant():
+            return api_client.delete(grant_url, headers=api_headers).status_code in (200, 404)
+
+        def wait_grant_deleted():
+            return api_helpers.wait_for_status(grant_url, api_headers, expected_status="deleted", timeout=10)
+
+        if janitor is not None:
+            # 지연 정리: 버킷/사용자 삭제는 janitor가 이 권한 삭제 완료 후에 진행
+            janitor.submit(
+                f"user_grant ({grant_url})",
+                delete_grant,
+                wait_deleted=wait_grant_deleted,
+                resource_id=grant_id,
+                references=[existing_bucket["id"], existing_user["id"]],
+            )
+            return
+        if delete_grant():
+            wait_grant_deleted()
 
 
-    def test_OS011_OS017_post_delete_user_grant(self, api_headers, existing_bucket, existing_user, base_url_object_storage, api_helpers):
+    def test_OS011_OS017_post_delete_user_grant(self, api_client, api_headers, existing_bucket, existing_user, base_url_object_storage, api_helpers):
         url= f"{base_url_object_storage}/user_grant"
         payload = {
             "object_storage_id": existing_bucket["id"],
@@ -309,7 +329,7 @@ class TestUserGrantCRUD:
             }
         # 사용자 생성시 polling
         api_helpers.wait_for_status(f"{base_url_object_storage}/user/{existing_user['id']}", api_headers, expected_status="activated",timeout=10)
-        response1 = requests.post(url, headers=api_headers, json=payload)
+        response1 = api_client.post(url, headers=api_headers, json=payload)
         assert response1.status_code == 200, f"⛔ [FAIL] 사용자 권한 생성 실패 - {response1.status_code}: {response1.text}"
         post_json = response1.json()
         assert isinstance(post_json, dict)
@@ -317,7 +337,7 @@ class TestUserGrantCRUD:
         assert post_json["id"] is not None
 
         # OS017_delete_user_grant
-        response2 = requests.delete(url+f"/{post_json['id']}", headers=api_headers)
+        response2 = api_client.delete(url+f"/{post_json['id']}", headers=api_headers)
         assert response2.status_code == 200, f"⛔ [FAIL] 사용자 권한 삭제 실패 - {response2.status_code}: {response2.text}"
         delete_json = response2.json()
         assert isinstance(delete_json, dict)
@@ -329,11 +349,11 @@ class TestUserGrantCRUD:
 
 
     @allure.story("예외 케이스")
-    def test_OS012_post_duplicate_user_grant(self, api_headers, existing_user_grant, base_url_object_storage, api_helpers):
+    def test_OS012_post_duplicate_user_grant(self, api_client, api_headers, existing_user_grant, base_url_object_storage, api_helpers):
         url= f"{base_url_object_storage}/user_grant"
         payload = existing_user_grant["payload"]
 
-        response = requests.post(url, headers=api_headers, json=payload)
+        response = api_client.post(url, headers=api_headers, json=payload)
         # 상태 코드 검증
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -342,10 +362,11 @@ class TestUserGrantCRUD:
         assert "already exists" in response_json["message"]
 
 
-    def test_OS013_get_all_user(self, api_headers, existing_bucket, existing_user, base_url_object_storage):
+    @pytest.mark.readonly
+    def test_OS013_get_all_user(self, api_client, api_headers, existing_bucket, existing_user, base_url_object_storage):
         url = f"{base_url_object_storage}/user?count=100"
 
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         # 상태 코드 검증
         assert response.status_code == 200, f"⛔ [FAIL] 사용자 권한 목록 조회 실패  - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -355,13 +376,13 @@ class TestUserGrantCRUD:
         assert response_list[0]["id"] is not None
 
 
-    def test_OS014_get_user_by_name(self, api_headers, existing_bucket, existing_user, base_url_object_storage, api_helpers):
+    def test_OS014_get_user_by_name(self, api_client, api_headers, existing_bucket, existing_user, base_url_object_storage, api_helpers):
         user_id = existing_user["id"]
         user_name = existing_user["name"]
         url = f"{base_url_object_storage}/user?filter_name_like=%25{user_name}%25&count=100"
         # 사용자 생성시 polling
         api_helpers.wait_for_status(f"{base_url_object_storage}/user/{user_id}", api_headers, expected_status="activated",timeout=10)
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 사용자 권한 단건 조회 실패 - {response.status_code}: {response.text}"
         # 응답 바디 검증
         response_json = response.json()
@@ -375,12 +396,13 @@ class TestUserGrantCRUD:
         assert exact_user[0]["status"] == "activated"
 
     
-    def test_OS015_get_granted_user(self, api_headers, existing_user_grant, base_url_object_storage):
+    @pytest.mark.readonly
+    def test_OS015_get_granted_user(self, api_client, api_headers, existing_user_grant, base_url_object_storage):
         bucket_id = existing_user_grant["bucket_id"]
         user_id = existing_user_grant["user_id"]
         url = f"{base_url_object_storage}/user_grant?filter_object_storage_id={bucket_id}"
 
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         assert response.status_code == 200, f"⛔ [FAIL] 사용자 권한 목록 조회 실패 - {response.status_code}: {response.text}"
         # 응답 바디 검증
         response_list = response.json()
@@ -394,11 +416,11 @@ class TestUserGrantCRUD:
         )
 
 
-    def test_OS025_get_empty_object_grant(self, api_headers, existing_user, base_url_object_storage):
+    def test_OS025_get_empty_object_grant(self, api_client, api_headers, existing_user, base_url_object_storage):
         user_id = existing_user["id"]
         url = f"{base_url_object_storage}/user_grant?filter_object_storage_user_id={user_id}&count=50"
 
-        response = requests.get(url, headers=api_headers)
+        response = api_client.get(url, headers=api_headers)
         # 상태 코드 검증
         assert response.status_code == 200, f"⛔ [FAIL] 오브젝트 권한 목록 조회 실패 - {response.status_code}: {response.text}"
         # 응답 바디 검증
@@ -407,7 +429,7 @@ class TestUserGrantCRUD:
         assert len(response_list) == 0
 
     
-    def test_OS026_OS029_OS032_post_get_delete_object_grant(self, api_headers, existing_bucket, existing_user, base_url_object_storage, api_helpers):
+    def test_OS026_OS029_OS032_post_get_delete_object_grant(self, api_client, api_headers, existing_bucket, existing_user, base_url_object_storage, api_helpers):
         bucket_id = existing_bucket["id"]
         user_id = existing_user["id"]
         url= f"{base_url_object_storage}/user_grant"
@@ -419,7 +441,7 @@ class TestUserGrantCRUD:
             }
         # 사용자 생성시 polling
         api_helpers.wait_for_status(f"{base_url_object_storage}/user/{existing_user['id']}", api_headers, expected_status="activated",timeout=10)
-        response1 = requests.post(url, headers=api_headers, json=payload)
+        response1 = api_client.post(url, headers=api_headers, json=payload)
         assert response1.status_code == 200, f"⛔ [FAIL] 오브젝트 권한 생성 실패 - {response1.status_code}: {response1.text}"
         post_json = response1.json()
         assert isinstance(post_json, dict)
@@ -427,7 +449,7 @@ class TestUserGrantCRUD:
         assert post_json["id"] is not None
 
         # OS026_get_granted_object (생성된 오브젝트 권한 조회)
-        response2 = requests.get(url+f"?filter_object_storage_user_id={user_id}&count=50", headers=api_headers)
+        response2 = api_client.get(url+f"?filter_object_storage_user_id={user_id}&count=50", headers=api_headers)
         assert response2.status_code == 200, f"⛔ [FAIL] 오브젝트 권한 목록 조회 실패 - {response2.status_code}: {response2.text}"
         get_json = response2.json()
         assert isinstance(get_json, list)
@@ -440,7 +462,7 @@ class TestUserGrantCRUD:
             )
 
         # OS032_delete_granted_object (생성된 오브젝트 권한 삭제)
-        response3 = requests.delete(url+f"/{post_json['id']}", headers=api_headers)
+        response3 = api_client.delete(url+f"/{post_json['id']}", headers=api_headers)
         assert response3.status_code == 200, f"⛔ [FAIL] 오브젝트 권한 삭제 실패 - {response3.status_code}: {response3.text}"
         delete_json = response3.json()
         assert isinstance(delete_json, dict)
@@ -452,7 +474,7 @@ class TestUserGrantCRUD:
 
 
     @allure.story("예외 케이스")
-    def test_OS030_post_duplicate_object_grant(self, api_headers, existing_user_grant, base_url_object_storage, api_helpers):
+    def test_OS030_post_duplicate_object_grant(self, api_client, api_headers, existing_user_grant, base_url_object_storage, api_helpers):
         url= f"{base_url_object_storage}/user_grant"
         payload = {
             "object_storage_id": existing_user_grant["bucket_id"],
@@ -460,7 +482,7 @@ class TestUserGrantCRUD:
             "permission": "read_write",    # 읽기/쓰기 전용 
             "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0"
             }
-        response = requests.post(url, headers=api_headers, json=payload)
+        response = api_client.post(url, headers=api_headers, json=payload)
         assert response.status_code == 409, f"⛔ [FAIL] 409와 다른 상태 코드 - {response.status_code}: {response.text}"
         # 응답 바디 검증
         response_json = response.json()
@@ -468,7 +490,7 @@ class TestUserGrantCRUD:
         assert "already exists" in response_json["message"]
 
 
-    def test_OS027_OS031_patch_get_object_grant(self, api_headers, existing_user_grant, base_url_object_storage, api_helpers):
+    def test_OS027_OS031_patch_get_object_grant(self, api_client, api_headers, existing_user_grant, base_url_object_storage, api_helpers):
         bucket_id = existing_user_grant["bucket_id"]
         user_id = existing_user_grant["user_id"]
         grant_id = existing_user_grant["id"]
@@ -477,7 +499,7 @@ class TestUserGrantCRUD:
         
         # 권한 생성시 polling
         api_helpers.wait_for_status(url+f"?filter_object_storage_user_id={user_id}&count=50", api_headers, expected_status="activated",timeout=10)
-        response1 = requests.patch(url, headers=api_headers, json=payload)
+        response1 = api_client.patch(url, headers=api_headers, json=payload)
         assert response1.status_code == 200, f"⛔ [FAIL] 오브젝트 권한 수정 실패 - {response1.status_code}: {response1.text}"
         patch_json = response1.json()
         # 응답 바디 검증
@@ -486,7 +508,7 @@ class TestUserGrantCRUD:
         assert patch_json["id"] is not None
         
         # OS026_get_edited_object_grant
-        response2 = requests.get(f"{base_url_object_storage}/user_grant?filter_object_storage_user_id={user_id}&count=50", headers=api_headers)
+        response2 = api_client.get(f"{base_url_object_storage}/user_grant?filter_object_storage_user_id={user_id}&count=50", headers=api_headers)
         assert response2.status_code == 200, f"⛔ [FAIL] 오브젝트 권한 목록 조회 실패 - {response2.status_code}: {response2.text}"
         get_json = response2.json()
         assert isinstance(get_json, list)
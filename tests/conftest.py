@@ -1,24 +1,39 @@
 # 토큰 로드(Fixture) 및 공통 설정 정의
 import shutil
 import pytest
-import requests
 import os
 import uuid
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from src.utils.api_util import wait_for_status  # 수정된 유틸 함수 임포트
-from src.utils.allure_helper import attach_screenshot
+from src.utils.api_util import wait_for_status, wait_for_statuses  # 수정된 유틸 함수 임포트
+from src.utils.http_client import get_client, close_client
+from src.utils.token_cache import get_cached_token
+from src.utils.resource_pool import ResourcePool
+from src.utils.teardown import build_dependency_graph, delete_in_dependency_order, deletion_order
+from src.utils.janitor import Janitor
+from src.utils.reference_data import load_reference_data
+from src.utils.inventory import Inventory
+from src.utils.deadline import clear_deadline, set_deadline, suspended
+from src.utils.latency import SUMMARY_FILE, LatencyRecorder, get_recorder, report_dir
 from dotenv import load_dotenv
 from loguru import logger
 
 load_dotenv()
 
+# 테스트 리소스를 생성할 기본 zone (ZONE_ID 환경 변수로 변경 가능)
+DEFAULT_ZONE_ID = os.getenv("ZONE_ID", "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0")
+
 def generate_fresh_token():
-    """새로운 토큰을 자동으로 생성"""
+    """
+    새로운 토큰을 자동으로 생성
+    selenium은 토큰 캐시가 비었을 때만 필요하므로 함수 안에서 지연 import
+    (API 테스트만 수집/실행하는 워커는 selenium import 비용을 내지 않음)
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
@@ -50,17 +65,66 @@ def generate_fresh_token():
 
 @pytest.fixture(scope="session")
 def auth_token():
-    """토큰을 자동으로 생성하고 반환"""
-    return generate_fresh_token()
+    """
+    토큰을 반환 (모든 xdist 워커/이후 실행이 공유하는 캐시 사용)
+    캐시가 없거나 만료 임박 시에만 브라우저 로그인으로 새로 생성
+    """
+    return get_cached_token(generate_fresh_token)
 
 @pytest.fixture(scope="session")
 def api_headers(auth_token):
-       return {
+    headers = {
         "Authorization": f"Bearer {auth_token}",
         "Host": "portal.gov.elice.cloud",
         "Content-Type": "application/json",
         # "Accept": "application/json"
     }
+    # 장시간 실행 중 토큰이 만료되면 공용 클라이언트가 갱신 후 이 dict를 in-place로 수정
+    get_client().enable_token_refresh(headers, generate_fresh_token)
+    return headers
+
+@pytest.fixture(scope="session")
+def api_client():
+    """
+    커넥션 풀/keep-alive 기반 공용 HTTP 클라이언트
+    (헬퍼 함수들도 동일한 클라이언트를 공유하며, 세션 종료 시 재사용 통계를 출력)
+    """
+    client = get_client()
+    yield client
+    client.log_stats()
+    if client.latency is not None and client.latency.endpoints:
+        # allure는 첨부할 내용이 있을 때만 import (conftest 로드 시간 단축)
+        from src.utils.allure_helper import attach_text
+        attach_text(client.latency.format_table(), name="HTTP 응답 시간 (엔드포인트별, ms)")
+    close_client()
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--deferred-cleanup",
+        action="store_true",
+        default=os.getenv("DEFERRED_CLEANUP", "").lower() in ("1", "true", "yes"),
+        help="테스트 리소스 삭제를 백그라운드 janitor로 넘기고 세션 종료 시 한 번에 대기 (환경 변수 DEFERRED_CLEANUP=1과 동일)",
+    )
+    parser.addoption(
+        "--test-deadline",
+        type=float,
+        default=float(os.getenv("TEST_DEADLINE", "0")),
+        help="테스트 하나(setup + 본문)에 허용하는 최대 시간(초), 0이면 사용 안 함. @pytest.mark.deadline(초)가 우선 (환경 변수 TEST_DEADLINE과 동일)",
+    )
+
+@pytest.fixture(scope="session")
+def janitor(request, api_client):
+    """
+    --deferred-cleanup 사용 시 백그라운드 삭제 큐(Janitor), 미사용 시 None
+    (api_client보다 먼저 종료되도록 api_client에 의존하며, 세션 종료 시 남은 삭제를 모두 기다림)
+    """
+    if not request.config.getoption("--deferred-cleanup"):
+        yield None
+        return
+    janitor = Janitor()
+    logger.info(f"🧹 지연 정리 모드 사용 (워커 {janitor.max_workers}개)")
+    yield janitor
+    janitor.drain()
 
 # API Base URL Fixtures
 @pytest.fixture(scope="session")
@@ -88,47 +152,103 @@ def base_url_object_storage():
     """오브젝트 스토리지 API Base URL"""
     return os.getenv("BASE_URL_OBJECT_STORAGE", "https://portal.gov.elice.cloud/api/user/resource/storage/object_storage")
 
+# 참조 데이터(region/zone/instance_type/image) Fixtures
+@pytest.fixture(scope="session")
+def reference_data(api_headers, api_client, base_url_infra):
+    """
+    실행당 한 번(디스크 캐시가 유효하면 0번) 조회하는 참조 데이터
+    reference_data.zone(id 또는 name), reference_data.instance_type(id 또는 name) 형태로 조회
+    """
+    return load_reference_data(base_url_infra, api_headers, client=api_client)
+
+@pytest.fixture(scope="session")
+def zone_id(reference_data):
+    """DEFAULT_ZONE_ID가 존재하면 그 zone, 없으면 조회된 첫 번째 zone의 id"""
+    return reference_data.zone_id(DEFAULT_ZONE_ID)
+
+@pytest.fixture(scope="session")
+def instance_type(reference_data):
+    """instance type 조회 함수: instance_type("C-16") / instance_type(<id>) → 항목 dict (없으면 None)"""
+    return reference_data.instance_type
+
+@pytest.fixture(scope="session")
+def inventory(api_headers, api_client, base_url_compute, base_url_block_storage, base_url_network, base_url_object_storage):
+    """
+    모든 리소스 종류의 목록을 세션 시작 시 한 번 동시에 조회한 인덱스 스냅샷
+    (예: inventory.first("block_storage", status="prepared"), inventory.find("network_interface", attached_subnet_id=...))
+    """
+    return Inventory(api_headers, client=api_client).register_defaults({
+        "compute": base_url_compute,
+        "block_storage": base_url_block_storage,
+        "network": base_url_network,
+        "object_storage": base_url_object_storage,
+    }).load()
+
 # Setup/Teardown 공통 Fixture
 @pytest.fixture
-def resource_factory(api_headers):
+def resource_factory(request, api_headers, api_client, janitor):
     
     """
     1. 리소스 생성/삭제 공통 Fixture
     2. 반환값: {"id": resource_id, "name": resource_name}
     3. 이미 삭제된 리소스는 teardown 단계에서 제외
+    4. 테스트가 inventory를 사용하면 삭제한 리소스를 인벤토리 인덱스에서도 제거
     """
     created_resources = []
+    inventory = request.getfixturevalue("inventory") if "inventory" in request.fixturenames else None
 
     def _create(base_url, payload):
-        data = create_resource(base_url, api_headers, payload)
+        data = create_resource(base_url, api_headers, payload, client=api_client)
         resource_id = data["id"]
         resource_name = payload["name"]
-        # 나중에 지울 리스트에 저장 (URL과 ID 쌍)
-        created_resources.append({"url": base_url, "id": resource_id, "name": resource_name, "deleting": False})
+        # 나중에 지울 리스트에 저장 (URL/ID 및 의존 관계 계산용 payload)
+        created_resources.append({"url": base_url, "id": resource_id, "name": resource_name, "payload": payload, "deleting": False})
         return {"id": resource_id, "name": resource_name}
 
     yield _create
 
-    # Teardown: 생성된 역순으로 삭제
-    for resource in reversed(created_resources):
-            try:
-                delete_resource(resource["url"], api_headers, resource["id"])
-            except Exception as e:
-                if hasattr(e, 'response') and e.response.status_code == 404:
-                    continue
+    def _delete(resource):
+        try:
+            delete_resource(resource["url"], api_headers, resource["id"], client=api_client)
+        except Exception as e:
+            if not (hasattr(e, 'response') and e.response.status_code == 404):
                 logger.exception(f"Teardown 실패: 리소스 ID {resource['id']} (이름: {resource['name']}) 삭제 중 에러 발생")
-                # pass를 유지하여 다음 리소스 삭제 시도에 영향 주지 않음
-                pass
+                return False
+        if inventory is not None:
+            inventory.discard(resource["id"])
+        return True
+
+    def _wait_deleted(resource):
+        return wait_for_status(f"{resource['url']}/{resource['id']}", api_headers, expected_status="deleted", client=api_client)
 
-def create_resource(url, headers, payload):
+    if janitor is not None:
+        # 지연 정리: 의존하는 리소스부터 큐에 넣고 바로 다음 테스트로 진행
+        depends_on = build_dependency_graph(created_resources)
+        for idx in deletion_order(depends_on):
+            resource = created_resources[idx]
+            janitor.submit(
+                f"{resource['name']} ({resource['url']}/{resource['id']})",
+                lambda resource=resource: _delete(resource),
+                wait_deleted=(lambda resource=resource: _wait_deleted(resource)) if depends_on[idx] else None,
+                resource_id=resource["id"],
+                references=[v for v in resource["payload"].values() if isinstance(v, str)],
+            )
+        return
+
+    # Teardown: 의존 관계(NIC → 서브넷 → 가상 네트워크, 권한 → 버킷/사용자)를 지키며 독립 리소스는 동시에 삭제
+    delete_in_dependency_order(created_resources, _delete, _wait_deleted)
+
+def create_resource(url, headers, payload, client=None):
     """리소스 생성을 위한 공통 함수"""
-    response = requests.post(url, headers=headers, json=payload)
+    client = client or get_client()
+    response = client.post(url, headers=headers, json=payload)
     assert response.status_code == 200, f"⛔ [FAIL] 생성 실패: {response.text}"
     return response.json()
 
-def delete_resource(url, headers,resource_id):
+def delete_resource(url, headers,resource_id, client=None):
     """리소스 삭제를 위한 공통 함수"""
-    response = requests.delete(f"{url}/{resource_id}", headers=headers)
+    client = client or get_client()
+    response = client.delete(f"{url}/{resource_id}", headers=headers)
     assert response.status_code == 200, f"⛔ [FAIL] 삭제 실패, {response.status_code}: {response.text}"
 
 # --- Helpers Fixture (유틸 함수 연결) ---
@@ -137,27 +257,133 @@ def api_helpers():
     class Helpers:
         # api_util.py에 정의된 지수 백오프 기반 함수를 그대로 사용
         wait_for_status = staticmethod(wait_for_status)
+        # 여러 리소스를 동시에 폴링 (전체 대기 시간 = 가장 느린 리소스 기준)
+        wait_for_statuses = staticmethod(wait_for_statuses)
     return Helpers()
 
 # --- 기타 공통 Fixtures (Object Storage 등) ---
-@pytest.fixture
-def existing_bucket(resource_factory, base_url_object_storage):
-    payload = {
+def bucket_payload():
+    return {
         "name": f"team2-{uuid.uuid4().hex[:6]}",
-        "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
+        "zone_id": DEFAULT_ZONE_ID,
         "size_gib": 10,
         "tags": {}
     }
-    return resource_factory(base_url_object_storage, payload)
 
-@pytest.fixture
-def existing_user(resource_factory, base_url_object_storage):
-    payload = {
-        "zone_id": "0a89d6fa-8588-4994-a6d6-a7c3dc5d5ad0",
+def user_payload():
+    return {
+        "zone_id": DEFAULT_ZONE_ID,
         "name": f"team2-{uuid.uuid4().hex[:6]}",
         "tags": {}
         }
-    return resource_factory(f"{base_url_object_storage}/user", payload)
+
+@pytest.fixture(scope="session")
+def resource_pool(api_headers, api_client, base_url_object_storage, janitor):
+    """
+    @pytest.mark.readonly 테스트에 대여할 사전 생성 리소스 풀
+    처음 요청될 때 종류별 RESOURCE_POOL_SIZE개를 동시에 생성하고, 세션 종료 시 일괄 삭제
+    (지연 정리 모드에서는 janitor에 삭제를 넘겨, 풀 리소스를 참조하는 권한 삭제가 끝난 뒤 삭제되도록 함
+     janitor는 이 fixture보다 나중에 종료되므로 drain()에서 풀 삭제까지 기다림)
+    """
+    pool = ResourcePool(api_headers, client=api_client)
+    pool.register("bucket", base_url_object_storage, bucket_payload)
+    pool.register("user", f"{base_url_object_storage}/user", user_payload, ready_status="activated")
+    pool.provision()
+    yield pool
+    pool.teardown(janitor)
+
+@pytest.fixture
+def existing_bucket(request, resource_factory, base_url_object_storage):
+    # 읽기 전용 테스트는 매번 생성/삭제하지 않고 풀에서 대여
+    if request.node.get_closest_marker("readonly"):
+        with request.getfixturevalue("resource_pool").lease("bucket") as bucket:
+            yield bucket
+        return
+    yield resource_factory(base_url_object_storage, bucket_payload())
+
+@pytest.fixture
+def existing_user(request, resource_factory, base_url_object_storage):
+    if request.node.get_closest_marker("readonly"):
+        with request.getfixturevalue("resource_pool").lease("user") as user:
+            yield user
+        return
+    yield resource_factory(f"{base_url_object_storage}/user", user_payload())
+
+# 테스트가 사용하는 base_url fixture → 서킷 브레이커 엔드포인트 계열
+BASE_URL_FAMILIES = {
+    "base_url_infra": ("infra", "default"),
+    "base_url_compute": ("compute",),
+    "base_url_block_storage": ("block_storage",),
+    "base_url_network": ("network",),
+    "base_url_object_storage": ("object_storage",),
+}
+
+def pytest_runtest_setup(item):
+    """
+    - 테스트별 요청 재시도 예산 초기화
+    - 테스트 deadline 설정 (이후 모든 요청/폴링/대기는 남은 시간 안에서만 수행, teardown 정리와 공유 fixture 준비는 제외)
+    - 플랫폼 장애로 서킷이 열려 있으면 해당 base URL을 쓰는 테스트는 타임아웃을 기다리지 않고 바로 skip
+      (복구 확인 시점이 지나면 다시 실행되어 half-open 요청으로 복구 여부를 확인)
+    """
+    client = get_client()
+    if client.retry_policy is not None:
+        # 요청 재시도 예산은 테스트마다 새로 시작
+        client.retry_policy.begin_test()
+
+    marker = item.get_closest_marker("deadline")
+    seconds = marker.args[0] if marker else item.config.getoption("--test-deadline")
+    if seconds:
+        item._deadline_token = set_deadline(seconds, label="테스트 deadline")
+
+    breaker = client.circuit_breaker
+    if breaker is None:
+        return
+    families = {family for name in item.fixturenames for family in BASE_URL_FAMILIES.get(name, ())}
+    if not families:
+        return
+    open_circuits = breaker.open_circuits(families)
+    if open_circuits:
+        key, reason = open_circuits[0]
+        pytest.skip(f"⛔ 플랫폼 장애로 서킷 오픈 [{key}]: {reason}")
+
+class SharedFixtureDeadline:
+    """
+    session/module 등 여러 테스트가 공유하는 fixture는 처음 요청한 테스트의 deadline과 무관하게 생성
+    (deadline 초과로 실패하면 pytest가 오류를 캐시해 이후 모든 테스트가 함께 실패하므로)
+    session scope fixture 준비 hook은 하위 디렉터리 conftest에 전달되지 않아 플러그인으로 등록
+    """
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        if fixturedef.scope == "function":
+            yield
+            return
+        with suspended():
+            yield
+
+def pytest_configure(config):
+    config.pluginmanager.register(SharedFixtureDeadline(), "shared-fixture-deadline")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item):
+    """리소스 정리는 deadline과 무관하게 끝까지 수행"""
+    token = getattr(item, "_deadline_token", None)
+    if token is not None:
+        clear_deadline(token)
+        item._deadline_token = None
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """각 단계(setup/call/teardown)에서 발생한 요청 재시도를 리포트 섹션과 Allure에 기록"""
+    outcome = yield
+    report = outcome.get_result()
+    policy = get_client().retry_policy
+    events = policy.drain_events() if policy is not None else []
+    if events:
+        from src.utils.allure_helper import attach_text
+        text = "\n".join(events)
+        report.sections.append((f"HTTP retries ({report.when})", text))
+        attach_text(text, name=f"HTTP 재시도 ({report.when})")
 
 @pytest.hookimpl
 def pytest_sessionstart(session):
@@ -177,15 +403,28 @@ def pytest_sessionstart(session):
     os.makedirs(allure_reports_dir, exist_ok=True)
     print("📁 Allure reports 폴더 생성 완료!")
 
+    # 응답 시간 집계는 xdist 컨트롤러(또는 단일 프로세스)에서만 초기화
+    if not hasattr(session.config, "workerinput"):
+        shutil.rmtree(report_dir(), ignore_errors=True)
 
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """테스트 실패 시 자동으로 스크린샷 첨부"""
-    outcome = yield
-    result = outcome.get_result()
+@pytest.hookimpl
+def pytest_sessionfinish(session):
+    """
+    워커별 엔드포인트 응답 시간을 reports/latency/<워커 ID>.json으로 저장하고,
+    컨트롤러(또는 단일 프로세스)에서 모두 병합해 summary.json으로 저장
+    """
+    recorder = get_recorder()
+    if recorder is None:
+        return
+    directory = report_dir()
+    if recorder.endpoints:
+        recorder.write(directory / f"{os.getenv('PYTEST_XDIST_WORKER', 'main')}.json")
+    if hasattr(session.config, "workerinput"):
+        return
 
-    # 테스트 단계가 실패(FAILED)일 때만
-    if result.when == "call" and result.failed:
-        driver = item.funcargs.get("driver")
-        if driver:
-            attach_screenshot(driver, name=item.name)
+    paths = sorted(p for p in directory.glob("*.json") if p.name != SUMMARY_FILE)
+    if not paths:
+        return
+    merged = LatencyRecorder.merge_files(paths)
+    merged.write(directory / SUMMARY_FILE)
+    logger.info(f"⏱️ 엔드포인트별 응답 시간 (ms, 워커 {len(paths)}개 병합) → {directory / SUMMARY_FILE}\n{merged.format_table()}")
@@ -0,0 +1,73 @@
+import pytest
+
+from src.utils.capacity import ConcurrencySweep, find_knee, parse_steps
+
+
+def _points(curve):
+    return [{"step": step, "throughput": throughput} for step, throughput in curve]
+
+
+def test_find_knee_on_plateau_curve():
+    knee = find_knee(_points([(1, 10), (2, 20), (4, 38), (8, 40), (16, 41)]))
+    assert knee["step"] == 4
+
+
+def test_find_knee_none_on_linear_curve():
+    assert find_knee(_points([(1, 10), (2, 20), (4, 40), (8, 80)])) is None
+
+
+def test_find_knee_none_with_too_few_or_flat_points():
+    assert find_knee(_points([(1, 10), (2, 20)])) is None
+    assert find_knee(_points([(1, 10), (2, 10), (4, 10)])) is None
+
+
+def test_parse_steps_sorts_and_dedupes():
+    assert parse_steps("8, 2,4,2,1,") == [1, 2, 4, 8]
+    assert parse_steps("0.5,1") == [0.5, 1]
+
+
+@pytest.mark.parametrize("value", ["", "0,1,2", "-1,4"])
+def test_parse_steps_rejects_non_positive(value):
+    with pytest.raises(ValueError):
+        parse_steps(value)
+
+
+def _report(throughput, error_rate=0.0, p99_ms=100.0, count=100):
+    return {"total": {"count": count, "throughput": throughput, "error_rate": error_rate,
+                      "mean_ms": 50.0, "p50_ms": 40.0, "p90_ms": 80.0, "p99_ms": p99_ms, "max_ms": p99_ms}}
+
+
+def test_sweep_stops_at_first_breach():
+    reports = {1: _report(10), 2: _report(20), 4: _report(38), 8: _report(40), 16: _report(30, error_rate=12.0),
+               32: _report(5)}
+    ran = []
+
+    def run_step(step, hold):
+        ran.append((step, hold))
+        return reports[step]
+
+    result = ConcurrencySweep(run_step, [1, 2, 4, 8, 16, 32], hold=5, max_error_rate=5).run()
+
+    assert ran == [(1, 5), (2, 5), (4, 5), (8, 5), (16, 5)]
+    assert result["stopped"]["step"] == 16
+    assert "오류율" in result["stopped"]["reason"]
+    assert result["last_healthy_step"] == 8
+    assert result["knee"] == 4
+    assert result["capacity"] == {"step": 4, "throughput": 38}
+
+
+def test_sweep_p99_breach_and_linear_capacity():
+    reports = {1: _report(10), 2: _report(20), 4: _report(40), 8: _report(80, p99_ms=5000)}
+    result = ConcurrencySweep(lambda step, hold: reports[step], [1, 2, 4, 8], hold=1, max_p99_ms=1000).run()
+
+    assert "p99" in result["stopped"]["reason"]
+    assert result["knee"] is None
+    # 꺾임이 없으면 마지막 정상 단계를 용량으로 사용
+    assert result["capacity"] == {"step": 4, "throughput": 40}
+
+
+def test_sweep_first_step_without_iterations():
+    result = ConcurrencySweep(lambda step, hold: _report(0, count=0), [1, 2], hold=1).run()
+    assert result["stopped"] == {"step": 1, "reason": "완료된 반복 없음"}
+    assert result["last_healthy_step"] is None
+    assert result["capacity"] is None
@@ -0,0 +1,145 @@
+import time
+
+import pytest
+import requests
+
+from src.utils import deadline
+from src.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, circuit_key
+from src.utils.http_client import ApiClient
+
+COMPUTE_URL = "https://portal.example/api/user/resource/compute/virtual_machine"
+NETWORK_URL = "https://portal.example/api/user/resource/network/subnet"
+
+
+def _fail(breaker, url, times):
+    for _ in range(times):
+        key = breaker.before_request(url)
+        breaker.record(key, failed=True, reason="503")
+
+
+def _state(breaker, url):
+    return breaker._circuits[circuit_key(url)].state
+
+
+def test_circuit_key_is_host_and_family():
+    assert circuit_key(COMPUTE_URL) == "portal.example/compute"
+    assert circuit_key(f"{NETWORK_URL}/123") == "portal.example/network"
+
+
+def test_stays_closed_below_min_requests():
+    breaker = CircuitBreaker(window=10, min_requests=5, failure_rate=0.5)
+    _fail(breaker, COMPUTE_URL, 4)
+    assert _state(breaker, COMPUTE_URL) == CLOSED
+
+
+def test_opens_at_failure_rate_and_rejects_requests():
+    breaker = CircuitBreaker(window=10, min_requests=4, failure_rate=0.5, reset_timeout=60)
+    for failed in (False, False, True, True):
+        breaker.record(breaker.before_request(COMPUTE_URL), failed=failed)
+    assert _state(breaker, COMPUTE_URL) == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(COMPUTE_URL)
+    assert breaker.rejected == 1
+    assert [key for key, _ in breaker.open_circuits()] == ["portal.example/compute"]
+    # 다른 계열은 영향 없음
+    breaker.before_request(NETWORK_URL)
+    assert breaker.open_circuits(families={"network"}) == []
+
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker(window=5, min_requests=2, failure_rate=0.5, reset_timeout=0.05)
+    _fail(breaker, COMPUTE_URL, 2)
+    time.sleep(0.06)
+
+    key = breaker.before_request(COMPUTE_URL)
+    assert _state(breaker, COMPUTE_URL) == HALF_OPEN
+    # 복구 확인 요청이 끝나기 전의 다른 요청은 즉시 실패
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(COMPUTE_URL)
+
+    breaker.record(key, failed=False)
+    assert _state(breaker, COMPUTE_URL) == CLOSED
+    breaker.before_request(COMPUTE_URL)
+
+
+def test_failed_probe_reopens_circuit():
+    breaker = CircuitBreaker(window=5, min_requests=2, failure_rate=0.5, reset_timeout=0.05)
+    _fail(breaker, COMPUTE_URL, 2)
+    time.sleep(0.06)
+
+    key = breaker.before_request(COMPUTE_URL)
+    breaker.record(key, failed=True, reason="timeout")
+    assert _state(breaker, COMPUTE_URL) == OPEN
+    assert "복구 확인 실패" in breaker.open_circuits()[0][1]
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(COMPUTE_URL)
+
+
+def test_release_hands_probe_to_next_request():
+    breaker = CircuitBreaker(window=5, min_requests=2, failure_rate=0.5, reset_timeout=0.05)
+    _fail(breaker, COMPUTE_URL, 2)
+    time.sleep(0.06)
+
+    breaker.release(breaker.before_request(COMPUTE_URL))
+    assert _state(breaker, COMPUTE_URL) == HALF_OPEN
+    # 결과 없이 반환된 복구 확인 대신 다음 요청이 복구 확인
+    breaker.record(breaker.before_request(COMPUTE_URL), failed=False)
+    assert _state(breaker, COMPUTE_URL) == CLOSED
+
+
+def test_release_while_closed_records_nothing():
+    breaker = CircuitBreaker(window=4, min_requests=2, failure_rate=0.5)
+    _fail(breaker, COMPUTE_URL, 1)
+    breaker.release(breaker.before_request(COMPUTE_URL))
+    assert list(breaker._circuits[circuit_key(COMPUTE_URL)].outcomes) == [True]
+
+
+class RaisingSession:
+    def __init__(self, error, delay=0.0):
+        self.error = error
+        self.delay = delay
+
+    def request(self, method, url, **kwargs):
+        time.sleep(self.delay)
+        raise self.error
+
+
+def _half_open_client(session):
+    client = ApiClient()
+    client.rate_limiter = client.retry_policy = client.hedger = client.latency = None
+    client.circuit_breaker = CircuitBreaker(window=5, min_requests=2, failure_rate=0.5, reset_timeout=0.05)
+    _fail(client.circuit_breaker, COMPUTE_URL, 2)
+    time.sleep(0.06)
+    client.session = session
+    return client
+
+
+@pytest.mark.parametrize("error", [ValueError("bad payload"), deadline.DeadlineExceeded("rate limit wait")])
+def test_client_does_not_settle_probe_on_unrelated_error(error):
+    client = _half_open_client(RaisingSession(error))
+    with pytest.raises(type(error)):
+        client.post(COMPUTE_URL, json={})
+    circuit = client.circuit_breaker._circuits[circuit_key(COMPUTE_URL)]
+    assert (circuit.state, circuit.probing) == (HALF_OPEN, False)
+
+
+def test_client_does_not_settle_probe_on_deadline_timeout():
+    client = _half_open_client(RaisingSession(requests.Timeout("read timeout"), delay=0.06))
+    with deadline.deadline(0.05):
+        with pytest.raises(deadline.DeadlineExceeded):
+            client.post(COMPUTE_URL, json={})
+    circuit = client.circuit_breaker._circuits[circuit_key(COMPUTE_URL)]
+    assert (circuit.state, circuit.probing) == (HALF_OPEN, False)
+
+
+def test_client_reopens_on_transport_failure():
+    client = _half_open_client(RaisingSession(requests.ConnectionError("refused")))
+    with pytest.raises(requests.ConnectionError):
+        client.post(COMPUTE_URL, json={})
+    assert _state(client.circuit_breaker, COMPUTE_URL) == OPEN
+
+
+def test_from_env_disabled(monkeypatch):
+    monkeypatch.setenv("CIRCUIT_BREAKER", "0")
+    assert CircuitBreaker.from_env() is None
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from src.utils import deadline as dl
+
+
+@pytest.fixture(autouse=True)
+def _default_timeout_env(monkeypatch):
+    monkeypatch.delenv("HTTP_CONNECT_TIMEOUT", raising=False)
+    monkeypatch.delenv("HTTP_READ_TIMEOUT", raising=False)
+
+
+def test_request_timeout_without_deadline():
+    assert dl.remaining() is None
+    assert dl.request_timeout() == (dl.DEFAULT_CONNECT_TIMEOUT, dl.DEFAULT_READ_TIMEOUT)
+    assert dl.request_timeout((2, 7)) == (2, 7)
+    assert dl.request_timeout(3) == (3, 3)
+
+
+def test_default_timeout_from_env(monkeypatch):
+    monkeypatch.setenv("HTTP_CONNECT_TIMEOUT", "1.5")
+    monkeypatch.setenv("HTTP_READ_TIMEOUT", "9")
+    assert dl.request_timeout() == (1.5, 9.0)
+
+
+def test_request_timeout_is_clamped_to_remaining_time():
+    with dl.deadline(0.5):
+        connect, read = dl.request_timeout()
+        assert 0 < connect <= 0.5
+        assert 0 < read <= 0.5
+        # 남은 시간보다 짧은 값은 그대로
+        assert dl.request_timeout((0.1, 0.2)) == (0.1, 0.2)
+    assert dl.remaining() is None
+
+
+def test_expired_deadline_raises():
+    with dl.deadline(0, label="test_x"):
+        with pytest.raises(dl.DeadlineExceeded, match="test_x"):
+            dl.request_timeout(action="GET /x")
+        with pytest.raises(dl.DeadlineExceeded):
+            dl.check()
+
+
+def test_nested_longer_deadline_keeps_earlier_one():
+    with dl.deadline(0.5):
+        outer = dl.remaining()
+        with dl.deadline(60):
+            assert dl.remaining() <= outer
+        with dl.deadline(0.1):
+            assert dl.remaining() <= 0.1
+
+
+def test_sleep_stops_at_deadline():
+    with dl.deadline(0.05):
+        started = time.monotonic()
+        with pytest.raises(dl.DeadlineExceeded):
+            dl.sleep(5)
+        assert time.monotonic() - started < 1
+
+
+def test_suspended_lifts_and_extends_deadline():
+    with dl.deadline(0.2):
+        before = dl.remaining()
+        with dl.suspended():
+            assert dl.remaining() is None
+            time.sleep(0.3)
+            dl.check()
+        # 해제되어 있던 시간은 남은 시간에서 빠지지 않음
+        assert 0 < dl.remaining() <= before
+        dl.check()
+    assert dl.remaining() is None
+
+
+def test_suspended_without_deadline():
+    with dl.suspended():
+        assert dl.remaining() is None
+    assert dl.remaining() is None
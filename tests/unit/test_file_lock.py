@@ -0,0 +1,72 @@
+import os
+import threading
+import time
+
+import pytest
+
+from src.utils.file_lock import FileLock
+
+
+def test_lock_is_exclusive_until_released(tmp_path):
+    path = tmp_path / "a.lock"
+    first = FileLock(path)
+    second = FileLock(path)
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    first.release()
+    assert second.try_acquire()
+    second.release()
+    assert not path.exists()
+
+
+def test_stale_lock_is_reclaimed(tmp_path):
+    """비정상 종료한 프로세스가 남긴 오래된 락 파일은 stale_after가 지나면 회수"""
+    path = tmp_path / "stale.lock"
+    path.write_text("12345")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    lock = FileLock(path, stale_after=60)
+    assert lock.try_acquire()
+    assert path.read_text() == str(os.getpid())
+    lock.release()
+
+
+def test_fresh_lock_is_not_reclaimed(tmp_path):
+    path = tmp_path / "fresh.lock"
+    path.write_text("12345")
+    lock = FileLock(path, timeout=0.1, stale_after=60, poll_interval=0.01)
+    assert not lock.try_acquire()
+    with pytest.raises(TimeoutError):
+        lock.acquire()
+    assert path.read_text() == "12345"
+
+
+def test_acquire_waits_for_release(tmp_path):
+    path = tmp_path / "wait.lock"
+    holder = FileLock(path)
+    holder.acquire()
+    threading.Timer(0.05, holder.release).start()
+
+    started = time.monotonic()
+    with FileLock(path, timeout=5, poll_interval=0.01):
+        assert time.monotonic() - started >= 0.04
+    assert not path.exists()
+
+
+def test_context_manager_serializes_threads(tmp_path):
+    path = tmp_path / "counter.lock"
+    counter = tmp_path / "counter"
+    counter.write_text("0")
+
+    def increment():
+        for _ in range(20):
+            with FileLock(path, poll_interval=0.001):
+                counter.write_text(str(int(counter.read_text()) + 1))
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    assert counter.read_text() == "80"
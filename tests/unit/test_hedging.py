@@ -0,0 +1,151 @@
+import itertools
+import threading
+import time
+
+import pytest
+
+from src.utils.hedging import Hedger
+from src.utils.http_client import ApiClient
+
+KEY = "GET /api/user/resource/compute/{id}"
+VM_URL = "https://portal.example/api/user/resource/compute/virtual_machine"
+
+
+def _warm(hedger, key=KEY, elapsed=0.01, n=None):
+    for _ in range(n or hedger.min_samples):
+        hedger.record(key, elapsed)
+
+
+class Sender:
+    """호출 순서대로 delays[i]초 뒤 응답 (errors[i]가 있으면 예외)"""
+
+    def __init__(self, delays, errors=None):
+        self.delays = delays
+        self.errors = errors or {}
+        self.calls = 0
+        self.finished = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            index = self.calls
+            self.calls += 1
+        time.sleep(self.delays[index])
+        self.finished.append(index)
+        if index in self.errors:
+            raise self.errors[index]
+        return f"response-{index}"
+
+
+def test_no_hedge_until_enough_samples():
+    hedger = Hedger(min_samples=5, max_rate=1.0, min_delay=0.01)
+    _warm(hedger, n=4)
+    assert hedger.hedge_delay(KEY) is None
+    sender = Sender([0.1])
+    assert hedger.run(KEY, sender) == "response-0"
+    assert sender.calls == 1
+    assert hedger.hedges == 0
+    # 방금 요청까지 5건이 모여 이후부터 p95 계산
+    assert hedger.hedge_delay(KEY) is not None
+
+
+def test_hedge_delay_is_p95_with_floor():
+    hedger = Hedger(min_samples=20, quantile=0.95, min_delay=0.05)
+    for elapsed in [i / 100 for i in range(1, 101)]:
+        hedger.record(KEY, elapsed)
+    assert hedger.hedge_delay(KEY) == pytest.approx(0.95)
+    _warm(hedger, key="GET /fast", elapsed=0.001, n=20)
+    assert hedger.hedge_delay("GET /fast") == 0.05
+
+
+def test_slow_primary_is_hedged_and_faster_hedge_wins():
+    hedger = Hedger(min_samples=5, max_rate=1.0, min_delay=0.02)
+    _warm(hedger, elapsed=0.02)
+    sender = Sender([0.5, 0.01])
+
+    started = time.monotonic()
+    assert hedger.run(KEY, sender) == "response-1"
+    assert time.monotonic() - started < 0.3
+    assert sender.calls == 2
+    assert (hedger.hedges, hedger.hedge_wins) == (1, 1)
+    # 늦은 원래 요청은 기다리지 않고 결과를 버림
+    assert 0 not in sender.finished
+
+
+def test_fast_primary_is_not_hedged():
+    hedger = Hedger(min_samples=5, max_rate=1.0, min_delay=0.2)
+    _warm(hedger, elapsed=0.2)
+    sender = Sender([0.01])
+    assert hedger.run(KEY, sender) == "response-0"
+    assert sender.calls == 1
+    assert hedger.hedges == 0
+
+
+def test_failed_hedge_falls_back_to_primary():
+    hedger = Hedger(min_samples=5, max_rate=1.0, min_delay=0.02)
+    _warm(hedger, elapsed=0.02)
+    sender = Sender([0.2, 0.01], errors={1: ConnectionError("reset")})
+    assert hedger.run(KEY, sender) == "response-0"
+    assert hedger.hedge_wins == 0
+
+
+def test_both_failing_raise_primary_error():
+    hedger = Hedger(min_samples=5, max_rate=1.0, min_delay=0.02)
+    _warm(hedger, elapsed=0.02)
+    sender = Sender([0.1, 0.01], errors={0: TimeoutError("primary"), 1: ConnectionError("hedge")})
+    with pytest.raises(TimeoutError, match="primary"):
+        hedger.run(KEY, sender)
+
+
+def test_hedge_rate_is_capped():
+    hedger = Hedger(min_samples=5, max_rate=0.25, min_delay=0.01)
+    # 느린 요청이 섞여도 p95가 바뀌지 않도록 빠른 표본으로 창을 채움
+    _warm(hedger, elapsed=0.01, n=hedger.window)
+    for _ in range(8):
+        hedger.run(KEY, Sender([0.05, 0.01]))
+    assert hedger.requests == 8
+    assert hedger.hedges == 2
+
+
+class SlowSession:
+    def __init__(self, delay):
+        self.delay = delay
+        self.methods = []
+        self._counter = itertools.count()
+
+    def request(self, method, url, **kwargs):
+        self.methods.append(method)
+        time.sleep(self.delay if next(self._counter) == 0 else 0.0)
+        return _Response()
+
+
+class _Response:
+    status_code = 200
+
+
+def _hedging_client(session):
+    client = ApiClient()
+    client.rate_limiter = client.circuit_breaker = client.retry_policy = client.latency = None
+    client.coalesce = False
+    client.hedger = Hedger(min_samples=5, max_rate=1.0, min_delay=0.02)
+    client.session = session
+    return client
+
+
+def test_client_hedges_slow_get():
+    session = SlowSession(0.3)
+    client = _hedging_client(session)
+    _warm(client.hedger, key="GET /api/user/resource/compute/virtual_machine/{id}", elapsed=0.02)
+    client.get(f"{VM_URL}/123")
+    assert session.methods == ["GET", "GET"]
+
+
+@pytest.mark.parametrize("method", ["POST", "PATCH", "PUT", "DELETE"])
+def test_client_never_hedges_non_get(method):
+    session = SlowSession(0.1)
+    client = _hedging_client(session)
+    for key_method in ("GET", method):
+        _warm(client.hedger, key=f"{key_method} /api/user/resource/compute/virtual_machine/{{id}}", elapsed=0.001)
+    client.request(method, f"{VM_URL}/123", json={})
+    assert session.methods == [method]
+    assert client.hedger.requests == 0
@@ -0,0 +1,190 @@
+import threading
+import time
+
+import pytest
+
+from src.utils import deadline
+from src.utils.http_client import ApiClient
+
+REGION_URL = "https://portal.example/api/user/region"
+VM_URL = "https://portal.example/api/user/resource/compute/virtual_machine"
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None):
+        self.status_code = status_code
+        self._body = body if body is not None else {}
+
+    def json(self):
+        return self._body
+
+
+class FakeSession:
+    """요청을 기록하고, blocking이면 release()까지 응답을 보류하는 requests.Session 대용"""
+
+    def __init__(self, status_code=200, error=None, blocking=False):
+        self.status_code = status_code
+        self.error = error
+        self.calls = []
+        self._release = threading.Event()
+        if not blocking:
+            self._release.set()
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self.calls.append((method, url, kwargs.get("params")))
+        self._release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return FakeResponse(self.status_code, {"url": url})
+
+    def release(self):
+        self._release.set()
+
+
+def _client(session):
+    client = ApiClient()
+    client.rate_limiter = client.circuit_breaker = client.retry_policy = client.hedger = client.latency = None
+    client.coalesce = True
+    client.micro_ttl = 0
+    client.session = session
+    return client
+
+
+def _wait_until(condition, timeout=5):
+    started = time.monotonic()
+    while not condition():
+        assert time.monotonic() - started < timeout, "조건 대기 시간 초과"
+        time.sleep(0.005)
+
+
+def _run_concurrently(n, target):
+    results = [None] * n
+
+    def run(i):
+        try:
+            results[i] = target(i)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_identical_concurrent_gets_hit_upstream_once():
+    session = FakeSession(blocking=True)
+    client = _client(session)
+    threads, results = _run_concurrently(8, lambda i: client.get(VM_URL, headers={"A": "1"}, params={"skip": 0}))
+    _wait_until(lambda: client.coalesced == 7)
+    session.release()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(session.calls) == 1
+    assert all(response.status_code == 200 for response in results)
+    # 호출부마다 독립된 응답 객체
+    assert len({id(response) for response in results}) == 8
+
+
+def test_gets_with_different_kwargs_are_not_coalesced():
+    session = FakeSession(blocking=True)
+    client = _client(session)
+    variants = [
+        {"params": {"skip": 0}},
+        {"params": {"skip": 10}},
+        {"params": {"skip": 0}, "headers": {"Authorization": "Bearer other"}},
+    ]
+    threads, results = _run_concurrently(3, lambda i: client.get(VM_URL, **variants[i]))
+    _wait_until(lambda: len(session.calls) == 3)
+    session.release()
+    for thread in threads:
+        thread.join(5)
+
+    assert client.coalesced == 0
+    assert all(response.status_code == 200 for response in results)
+
+
+def test_non_coalescable_kwargs_and_methods_are_sent_directly():
+    session = FakeSession()
+    client = _client(session)
+    client.get(VM_URL, stream=True)
+    client.get(VM_URL, stream=True)
+    client.post(VM_URL, json={})
+    assert len(session.calls) == 3
+    assert client.coalesced == 0
+
+
+def test_leader_error_is_shared_with_followers():
+    session = FakeSession(error=ValueError("boom"), blocking=True)
+    client = _client(session)
+    threads, results = _run_concurrently(4, lambda i: client.get(VM_URL))
+    _wait_until(lambda: client.coalesced == 3)
+    session.release()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(session.calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_follower_stops_waiting_at_deadline():
+    session = FakeSession(blocking=True)
+    client = _client(session)
+    leader, _ = _run_concurrently(1, lambda i: client.get(VM_URL))
+    _wait_until(lambda: len(session.calls) == 1)
+
+    def follow(i):
+        with deadline.deadline(0.1):
+            started = time.monotonic()
+            try:
+                client.get(VM_URL)
+            finally:
+                follow.elapsed = time.monotonic() - started
+
+    followers, results = _run_concurrently(1, follow)
+    followers[0].join(5)
+    session.release()
+    leader[0].join(5)
+
+    assert isinstance(results[0], deadline.DeadlineExceeded)
+    assert follow.elapsed < 1
+
+
+def test_micro_ttl_caches_only_listed_paths_and_200():
+    session = FakeSession()
+    client = _client(session)
+    client.micro_ttl = 60
+    client.get(REGION_URL)
+    client.get(REGION_URL)
+    assert len(session.calls) == 1
+    assert client.micro_cache_hits == 1
+
+    client.get(VM_URL)
+    client.get(VM_URL)
+    assert len(session.calls) == 3
+
+    failing = _client(FakeSession(status_code=503))
+    failing.micro_ttl = 60
+    failing.get(REGION_URL)
+    failing.get(REGION_URL)
+    assert len(failing.session.calls) == 2
+    assert failing.micro_cache_hits == 0
+
+
+def test_micro_ttl_expires():
+    session = FakeSession()
+    client = _client(session)
+    client.micro_ttl = 0.05
+    client.get(REGION_URL)
+    time.sleep(0.06)
+    client.get(REGION_URL)
+    assert len(session.calls) == 2
+
+
+@pytest.mark.parametrize("value", ["0", "false"])
+def test_coalescing_can_be_disabled(monkeypatch, value):
+    monkeypatch.setenv("HTTP_COALESCE", value)
+    assert ApiClient().coalesce is False
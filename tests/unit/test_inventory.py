@@ -0,0 +1,81 @@
+import requests
+
+from src.utils.inventory import Inventory
+
+LIST_URL = "https://portal.example/api/user/resource/network/subnet"
+VM_URL = "https://portal.example/api/user/resource/compute/virtual_machine"
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+
+class FakeListClient:
+    """URL별 목록을 skip/count로 잘라 반환 (failing에 포함된 URL은 500)"""
+
+    def __init__(self, lists, failing=()):
+        self.lists = lists
+        self.failing = set(failing)
+
+    def get(self, url, headers=None, params=None):
+        if url in self.failing:
+            return FakeResponse(500, {"message": "boom"})
+        items = self.lists.get(url, [])
+        return FakeResponse(200, items[params["skip"]:params["skip"] + params["count"]])
+
+
+SUBNETS = [
+    {"id": "sn-1", "name": "team2-a", "status": "active", "zone_id": "z1", "gateway": None, "cidr_prefix": 24.0},
+    {"id": "sn-2", "name": "team2-b", "status": "active", "zone_id": "z2", "tags": ["x"]},
+    {"id": "sn-3", "name": "other", "status": "deleting", "zone_id": "z1"},
+]
+
+
+def _inventory(failing=()):
+    client = FakeListClient({LIST_URL: SUBNETS, VM_URL: [{"id": "vm-1", "name": "vm-a"}]}, failing)
+    return Inventory({}, client=client).register("subnet", LIST_URL).register("virtual_machine", VM_URL).load()
+
+
+def test_find_uses_index_and_combines_filters():
+    inventory = _inventory()
+    assert [item["id"] for item in inventory.find("subnet", zone_id="z1")] == ["sn-1", "sn-3"]
+    assert [item["id"] for item in inventory.find("subnet", zone_id="z1", status="active")] == ["sn-1"]
+    assert inventory.first("subnet", name="missing") is None
+
+
+def test_non_indexable_filter_values_fall_back_to_scan():
+    """인덱싱하지 않는 값(None, float, list)은 인덱스에 없다고 "없음"으로 판단하지 않음"""
+    inventory = _inventory()
+    assert [item["id"] for item in inventory.find("subnet", gateway=None)] == ["sn-1", "sn-2", "sn-3"]
+    assert inventory.first("subnet", cidr_prefix=24)["id"] == "sn-1"
+    assert inventory.first("subnet", tags=["x"])["id"] == "sn-2"
+    assert inventory.first("subnet", status="active", gateway=None)["id"] == "sn-1"
+
+
+def test_discard_and_refresh_item_update_index():
+    inventory = _inventory()
+    inventory.discard("sn-1")
+    assert inventory.get("subnet", "sn-1") is None
+    assert [item["id"] for item in inventory.find("subnet", zone_id="z1")] == ["sn-3"]
+
+
+def test_failed_kinds_are_reported():
+    inventory = _inventory(failing={LIST_URL})
+    assert inventory.failed_kinds == ["subnet"]
+    assert inventory.all("subnet") == []
+    assert inventory.get("virtual_machine", "vm-1") is not None
+
+    # 다시 조회에 성공하면 실패 목록에서 빠짐
+    inventory.client.failing.clear()
+    inventory.load()
+    assert inventory.failed_kinds == []
+    assert len(inventory.all("subnet")) == 3
@@ -0,0 +1,77 @@
+import threading
+import time
+
+from src.utils.janitor import Janitor
+
+
+def test_dependent_delete_finishes_before_referenced_resource():
+    """권한(user_grant) 삭제 + 삭제 완료 대기가 끝난 뒤에 버킷 삭제"""
+    events = []
+    lock = threading.Lock()
+
+    def log(event):
+        with lock:
+            events.append(event)
+
+    def delete_grant():
+        time.sleep(0.05)
+        log("delete grant")
+        return True
+
+    def wait_grant_deleted():
+        time.sleep(0.05)
+        log("grant deleted")
+        return True
+
+    janitor = Janitor(max_workers=4, retry_delay=0)
+    janitor.submit("grant", delete_grant, wait_deleted=wait_grant_deleted, resource_id="grant", references=["bucket"])
+    janitor.submit("bucket", lambda: log("delete bucket") or True, resource_id="bucket")
+    assert janitor.drain() == []
+
+    assert events == ["delete grant", "grant deleted", "delete bucket"]
+    assert janitor.completed == 2
+
+
+def test_unrelated_deletes_are_not_blocked():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_delete():
+        started.set()
+        release.wait(5)
+        return True
+
+    janitor = Janitor(max_workers=2, retry_delay=0)
+    janitor.submit("slow", slow_delete, resource_id="a", references=["x"])
+    started.wait(5)
+    other = janitor.submit("other", lambda: True, resource_id="b")
+    assert other.result(timeout=5) is True
+    release.set()
+    assert janitor.drain() == []
+
+
+def test_failed_delete_is_retried():
+    attempts = []
+
+    def flaky_delete():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("503")
+        return True
+
+    janitor = Janitor(max_workers=1, max_attempts=3, retry_delay=0)
+    future = janitor.submit("flaky", flaky_delete)
+    assert future.result(timeout=5) is True
+    assert len(attempts) == 3
+    assert janitor.drain() == []
+
+
+def test_failures_are_reported_by_drain():
+    janitor = Janitor(max_workers=2, max_attempts=2, retry_delay=0)
+    janitor.submit("always fails", lambda: False)
+    janitor.submit("never deleted", lambda: True, wait_deleted=lambda: False)
+
+    failures = dict(janitor.drain())
+    assert failures["always fails"] == "삭제 요청 실패"
+    assert "deleted" in failures["never deleted"]
+    assert janitor.completed == 0
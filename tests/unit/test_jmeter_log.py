@@ -0,0 +1,110 @@
+import pytest
+
+from src.utils.jmeter_log import AnomalyDetector, analyze_intervals, describe_flag, parse_log
+
+
+def _feed(detector, rows, interval=30):
+    """(error_pct, avg_ms) 목록을 interval초 간격 구간으로 입력"""
+    for i, (error_pct, avg_ms) in enumerate(rows):
+        detector.feed(i * interval, (i + 1) * interval, error_pct, avg_ms, count=100, errors=int(error_pct))
+
+
+def test_error_cliff_spans_consecutive_intervals():
+    detector = AnomalyDetector(error_threshold=10)
+    _feed(detector, [(0, 100), (15, 100), (40, 100), (12, 100), (0, 100)])
+    flags = detector.finish()
+    assert len(flags) == 1
+    cliff = flags[0]
+    assert cliff["type"] == "error_cliff"
+    assert (cliff["start"], cliff["end"]) == (30, 120)
+    assert cliff["intervals"] == 3
+    assert cliff["peak_error_pct"] == 40
+    assert (cliff["count"], cliff["errors"]) == (300, 67)
+
+
+def test_finish_closes_open_cliff():
+    detector = AnomalyDetector(error_threshold=10)
+    _feed(detector, [(0, 100), (50, 100), (60, 100)])
+    assert detector.flags == []
+    flags = detector.finish()
+    assert [(flag["type"], flag["start"], flag["end"]) for flag in flags] == [("error_cliff", 30, 90)]
+    assert "오류 급증" in describe_flag(flags[0], relative=True)
+
+
+def test_latency_shift_flagged_after_min_intervals():
+    detector = AnomalyDetector(latency_factor=2, min_intervals=2)
+    _feed(detector, [(0, 100)] * 5 + [(0, 300), (0, 310), (0, 320)])
+    flags = detector.finish()
+    assert len(flags) == 1
+    shift = flags[0]
+    assert shift["type"] == "latency_shift"
+    assert shift["direction"] == "up"
+    assert shift["start"] == 150
+    assert shift["baseline_ms"] == 100
+    assert shift["level_ms"] == pytest.approx(305)
+
+
+def test_single_interval_spike_is_not_a_shift():
+    detector = AnomalyDetector(latency_factor=2, min_intervals=2)
+    _feed(detector, [(0, 100)] * 5 + [(0, 900)] + [(0, 100)] * 3)
+    assert detector.finish() == []
+
+
+def test_latency_drop_is_flagged():
+    detector = AnomalyDetector(latency_factor=2, min_intervals=2)
+    _feed(detector, [(0, 400)] * 4 + [(0, 100)] * 2)
+    flags = detector.finish()
+    assert [flag["direction"] for flag in flags] == ["down"]
+
+
+SAMPLE_LOG = """\
+2026-01-02 17:49:00,001 INFO o.a.j.t.JMeterThread: Thread started: Thread Group 1-1
+2026-01-02 17:49:00,002 INFO o.a.j.t.JMeterThread: Thread started: Thread Group 1-2
+2026-01-02 17:49:10,000 INFO o.a.j.t.JMeterThread: Thread started: Thread Group 1-3
+2026-01-02 17:49:20,000 INFO o.a.j.t.JMeterThread: Thread finished: Thread Group 1-1
+2026-01-02 17:49:30,546 INFO o.a.j.r.Summariser: summary +     61 in 00:00:30 =    2.0/s Avg:   870 Min:   106 Max: 21192 Err:     1 (1.64%) Active: 2 Started: 81 Finished: 79
+2026-01-02 17:49:30,547 INFO o.a.j.r.Summariser: summary =     61 in 00:00:30 =    2.0/s Avg:   870 Min:   106 Max: 21192 Err:     1 (1.64%)
+2026-01-02 17:49:40,000 INFO o.a.j.t.JMeterThread: Thread finished: Thread Group 1-2
+2026-01-02 17:50:00,546 INFO o.a.j.r.Summariser: summary +     30 in 00:00:30 =    1.0/s Avg:   500 Min:   100 Max:  2000 Err:    15 (50.00%) Active: 1 Started: 81 Finished: 80
+"""
+
+
+def test_parse_log_builds_series_from_summary_lines():
+    detector = AnomalyDetector(error_threshold=10)
+    series = parse_log(SAMPLE_LOG.splitlines(), detector=detector)
+
+    assert len(series) == 2
+    columns = series.to_columns()
+    assert columns["count"] == [61, 30]
+    assert columns["avg_ms"] == [870, 500]
+    assert columns["max_ms"] == [21192, 2000]
+    assert columns["errors"] == [1, 15]
+    assert columns["error_pct"] == [1.64, 50.0]
+    assert columns["end"][0] - columns["start"][0] == pytest.approx(30)
+    # 스레드 이벤트로 다시 계산한 동시 실행 수
+    assert columns["active"] == [2, 1]
+    assert columns["peak_active"] == [3, 2]
+
+    total = series.total()
+    assert (total["count"], total["errors"]) == (91, 16)
+    assert total["min_ms"] == 100
+
+    flags = detector.finish()
+    assert [flag["type"] for flag in flags] == ["error_cliff"]
+    assert flags[0]["intervals"] == 1
+
+
+def test_parse_log_uses_reported_active_without_thread_events():
+    lines = [line for line in SAMPLE_LOG.splitlines() if "Thread " not in line]
+    series = parse_log(lines)
+    assert series.to_columns()["active"] == [2, 1]
+
+
+def test_analyze_intervals_uses_relative_times():
+    intervals = [
+        {"count": 100, "errors": 0, "error_rate": 0.0, "mean_ms": 100, "at": 10.0, "duration": 10.0},
+        {"count": 0, "errors": 0, "error_rate": 0.0, "mean_ms": None, "at": 20.0, "duration": 10.0},
+        {"count": 100, "errors": 30, "error_rate": 30.0, "mean_ms": 100, "at": 30.0, "duration": 10.0},
+    ]
+    flags = analyze_intervals(intervals)
+    assert [(flag["type"], flag["start"], flag["end"]) for flag in flags] == [("error_cliff", 20.0, 30.0)]
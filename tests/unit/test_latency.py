@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from src.utils.latency import LatencyHistogram, LatencyRecorder, endpoint_key
+
+
+def _histogram(values):
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+@pytest.mark.parametrize("p", [50, 90, 99])
+def test_percentile_within_bucket_error(p):
+    values = list(range(1, 1001))
+    random.shuffle(values)
+    histogram = _histogram(values)
+    assert histogram.percentile(p) == pytest.approx(p * 10, rel=0.02)
+
+
+def test_percentile_is_clamped_to_min_max():
+    histogram = _histogram([42.0] * 10)
+    assert histogram.percentile(0) == 42.0
+    assert histogram.percentile(100) == 42.0
+    assert histogram.mean == 42.0
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.mean is None
+
+
+def test_merge_equals_recording_everything():
+    left_values = [random.uniform(1, 500) for _ in range(300)]
+    right_values = [random.uniform(100, 5000) for _ in range(200)]
+    merged = _histogram(left_values).merge(_histogram(right_values))
+    expected = _histogram(left_values + right_values)
+
+    assert merged.buckets == expected.buckets
+    assert merged.count == expected.count == 500
+    assert merged.min == expected.min
+    assert merged.max == expected.max
+    assert merged.total == pytest.approx(expected.total)
+    for p in (50, 90, 99):
+        assert merged.percentile(p) == expected.percentile(p)
+
+
+def test_merge_with_empty_histogram_keeps_min_max():
+    histogram = _histogram([5, 10]).merge(LatencyHistogram())
+    assert (histogram.min, histogram.max, histogram.count) == (5, 10, 2)
+    empty = LatencyHistogram().merge(_histogram([7]))
+    assert (empty.min, empty.max, empty.count) == (7, 7, 1)
+
+
+def test_dict_round_trip():
+    histogram = _histogram([0.05, 3, 250, 9000])
+    restored = LatencyHistogram.from_dict(histogram.to_dict())
+    assert restored.buckets == histogram.buckets
+    assert (restored.count, restored.min, restored.max) == (histogram.count, histogram.min, histogram.max)
+    assert restored.percentile(90) == histogram.percentile(90)
+
+
+def test_endpoint_key_templates_ids():
+    url = "https://portal.example/api/user/resource/storage/block_storage/12345?verbose=1"
+    assert endpoint_key("delete", url) == "DELETE /api/user/resource/storage/block_storage/{id}"
+
+
+def test_recorder_merge_combines_endpoints():
+    url = "https://portal.example/api/user/resource/compute/virtual_machine"
+    first, second = LatencyRecorder(), LatencyRecorder()
+    first.record("GET", url, 0.1, 200, size=100)
+    second.record("GET", url, 0.3, 503, size=50)
+    second.record("POST", url, 0.2, "ConnectionError")
+
+    summary = first.merge(second).summary()
+    get_summary = summary[endpoint_key("GET", url)]
+    assert get_summary["count"] == 2
+    assert get_summary["errors"] == 1
+    assert get_summary["bytes"] == 150
+    assert get_summary["statuses"] == {"200": 1, "503": 1}
+    assert summary[endpoint_key("POST", url)]["errors"] == 1
@@ -0,0 +1,148 @@
+import json
+
+import pytest
+
+from src.utils import load
+from src.utils.latency import LatencyHistogram
+from src.utils.load import OTHER_ERRORS, Summariser, parse_duration, write_snapshot
+
+
+class FakeClock:
+    """Summariser가 사용하는 time.monotonic 대용 (advance로만 시간이 흐름)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(load, "time", fake)
+    return fake
+
+
+def _interval(summariser, clock, latencies, errors=(), seconds=30):
+    """구간 하나를 채우고 seconds초 뒤 flush"""
+    for i, elapsed in enumerate(latencies):
+        summariser.record("scenario", elapsed, errors[i] if i < len(errors) else None)
+    clock.advance(seconds)
+    return summariser.flush()
+
+
+def test_interval_boundaries(clock):
+    summariser = Summariser(interval=30)
+    summariser.start()
+    summariser.record("scenario", 0.1)
+    clock.advance(29.9)
+    assert not summariser.due()
+    clock.advance(0.1)
+    assert summariser.due()
+
+    first = summariser.flush()
+    # flush 이후 기록은 다음 구간에만 포함
+    summariser.record("scenario", 0.2)
+    summariser.record("scenario", 0.3, "scenario: AssertionError")
+    clock.advance(10)
+    second = summariser.flush()
+
+    assert (first["count"], first["at"], first["duration"]) == (1, 30.0, 30.0)
+    assert (second["count"], second["errors"], second["at"], second["duration"]) == (2, 1, 40.0, 10.0)
+    assert not summariser.due()
+
+
+def test_interval_ring_keeps_latest_history(clock):
+    summariser = Summariser(interval=30, history=3)
+    summariser.start()
+    for n in range(1, 6):
+        _interval(summariser, clock, [0.1] * n)
+
+    report = summariser.report()
+    assert [entry["count"] for entry in report["intervals"]] == [3, 4, 5]
+    assert report["interval_count"] == 5
+    # 버린 구간도 누적 통계에는 포함
+    assert report["total"]["count"] == 15
+
+
+def test_report_includes_unflushed_window(clock):
+    summariser = Summariser(interval=30)
+    summariser.start()
+    _interval(summariser, clock, [0.1, 0.1])
+    summariser.record("scenario", 0.1)
+    assert summariser.report()["total"]["count"] == 3
+
+
+def test_rolling_window_covers_only_recent_intervals(clock):
+    summariser = Summariser(interval=30, rolling=2)
+    summariser.start()
+    _interval(summariser, clock, [5.0, 0.1])
+    _interval(summariser, clock, [0.1, 0.2, 0.3], seconds=20)
+    _interval(summariser, clock, [0.2], errors=["scenario: TimeoutError"], seconds=10)
+
+    report = summariser.report()
+    rolling = report["rolling"]
+    assert rolling["intervals"] == 2
+    assert rolling["count"] == 4
+    assert rolling["errors"] == 1
+    # 첫 구간의 5초 응답은 이동 통계에서 빠지고 전체 통계에만 남음
+    assert rolling["max_ms"] < 1000
+    assert report["total"]["max_ms"] == 5000
+    # 이동 통계 처리량은 최근 구간 길이(20 + 10초) 기준
+    assert rolling["throughput"] == pytest.approx(4 / 30, abs=0.001)
+
+
+def test_rolling_disabled_by_default(clock):
+    summariser = Summariser(interval=30)
+    summariser.start()
+    _interval(summariser, clock, [0.1])
+    assert "rolling" not in summariser.report()
+
+
+def test_error_types_are_capped(clock, monkeypatch):
+    monkeypatch.setattr(load, "MAX_ERROR_TYPES", 3)
+    summariser = Summariser(interval=30)
+    summariser.start()
+    for i in range(6):
+        summariser.record("scenario", 0.1, f"scenario: HTTPError: 404 for id-{i}")
+    summariser.record("scenario", 0.1, "scenario: HTTPError: 404 for id-0")
+
+    errors = summariser.report()["errors"]
+    assert len(errors) == 4
+    assert errors[OTHER_ERRORS] == 3
+    assert errors["scenario: HTTPError: 404 for id-0"] == 2
+
+
+def test_report_histograms_are_mergeable(clock):
+    summariser = Summariser(interval=30)
+    summariser.start()
+    _interval(summariser, clock, [0.1, 0.2, 0.4])
+    histograms = summariser.report(histograms=True)["histograms"]
+
+    total = LatencyHistogram.from_dict(histograms["total"]["histogram"])
+    scenario = LatencyHistogram.from_dict(histograms["scenarios"]["scenario"]["histogram"])
+    assert total.count == scenario.count == 3
+    assert total.max == 400
+
+
+def test_write_snapshot_replaces_file(tmp_path):
+    path = tmp_path / "load" / "soak.json"
+    write_snapshot(path, {"status": "running"})
+    write_snapshot(path, {"status": "finished"})
+    assert json.loads(path.read_text()) == {"status": "finished"}
+    assert [p.name for p in path.parent.iterdir()] == ["soak.json"]
+
+
+@pytest.mark.parametrize("value, seconds", [("3600", 3600), ("90m", 5400), ("4h", 14400), ("1h30m", 5400), ("45s", 45)])
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == seconds
+
+
+@pytest.mark.parametrize("value", ["0", "abc", "1h30", "-5"])
+def test_parse_duration_rejects_invalid(value):
+    with pytest.raises(ValueError):
+        parse_duration(value)
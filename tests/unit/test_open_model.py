@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from src.utils.open_model import OpenModelGenerator
+
+
+class FakeScenario:
+    """service_time초 동안 응답을 기다리는 요청 하나 (실제 시작 시각 기록)"""
+
+    def __init__(self, service_time, name="fake", fail_every=0):
+        self.name = name
+        self.service_time = service_time
+        self.fail_every = fail_every
+        self.started = []
+        self._lock = threading.Lock()
+
+    def run(self, instances):
+        with self._lock:
+            self.started.append(time.monotonic())
+            calls = len(self.started)
+        time.sleep(self.service_time)
+        if self.fail_every and calls % self.fail_every == 0:
+            raise AssertionError("unexpected status")
+
+
+def _recording(generator):
+    """summariser.record에 전달되는 응답 시간(초) 기록"""
+    recorded = []
+    original = generator.summariser.record
+
+    def record(scenario, elapsed, error=None):
+        recorded.append(elapsed)
+        original(scenario, elapsed, error)
+
+    generator.summariser.record = record
+    return recorded
+
+
+def test_latency_is_measured_from_scheduled_time():
+    """실행 대기열이 밀리면 그 대기 시간도 응답 시간에 포함 (coordinated omission 보정)"""
+    scenario = FakeScenario(service_time=0.1)
+    # 초당 20건 예정이지만 동시 실행 1개로는 초당 10건만 처리 → 뒤로 갈수록 시작이 밀림
+    generator = OpenModelGenerator([scenario], rate=20, duration=0.25, max_in_flight=1, interval=60)
+    recorded = _recording(generator)
+    report = generator.run()
+
+    assert generator.scheduled == generator.completed == 5
+    assert len(recorded) == 5
+    # 마지막 요청은 예정 시각(0.2초) 대비 약 0.2초 늦게 시작해 0.1초 실행 → 보정값 약 0.3초
+    assert recorded[-1] >= 0.25
+    assert recorded == sorted(recorded)
+    # 보정 전(실제 시작 기준) 응답 시간은 실행 시간과 비슷
+    assert report["uncorrected"]["max_ms"] < 200
+    assert report["total"]["max_ms"] >= 250
+    assert report["schedule_lag"]["max_ms"] >= 150
+    spacing = [b - a for a, b in zip(scenario.started, scenario.started[1:])]
+    assert min(spacing) >= 0.09
+
+
+def test_unsaturated_run_matches_uncorrected_latency():
+    scenario = FakeScenario(service_time=0.02)
+    generator = OpenModelGenerator([scenario], rate=20, duration=0.25, max_in_flight=5, interval=60)
+    report = generator.run()
+
+    assert report["total"]["count"] == 5
+    assert report["target_rate"] == 20
+    assert report["model"] == "open"
+    assert report["total"]["max_ms"] == pytest.approx(report["uncorrected"]["max_ms"], abs=30)
+    assert report["schedule_lag"]["max_ms"] < 30
+    # 응답을 기다리지 않고 예정 시각마다 시작
+    spacing = [b - a for a, b in zip(scenario.started, scenario.started[1:])]
+    assert all(abs(gap - 0.05) < 0.03 for gap in spacing)
+
+
+def test_failures_are_counted():
+    scenario = FakeScenario(service_time=0.0, fail_every=2)
+    report = OpenModelGenerator([scenario], rate=40, duration=0.1, interval=60).run()
+    assert report["total"]["count"] == 4
+    assert report["total"]["errors"] == 2
+    assert list(report["errors"]) == ["fake: AssertionError: unexpected status"]
+
+
+def test_constant_arrivals_are_evenly_spaced():
+    generator = OpenModelGenerator([FakeScenario(0)], rate=4, duration=1)
+    assert list(generator._arrival_times()) == [0.0, 0.25, 0.5, 0.75]
+
+
+@pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 1, "arrival": "burst"}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        OpenModelGenerator([FakeScenario(0)], duration=1, **kwargs)
+    with pytest.raises(ValueError):
+        OpenModelGenerator([], rate=1, duration=1)
@@ -0,0 +1,73 @@
+import pytest
+import requests
+
+from src.utils.pager import find_first, iter_pages, paginate
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+
+class FakeListClient:
+    """skip/count 페이지네이션 목록 API (ignore_skip=True면 skip과 무관하게 첫 페이지만 반환)"""
+
+    def __init__(self, total, ignore_skip=False, status_code=200):
+        self.items = [{"id": f"item-{i}"} for i in range(total)]
+        self.ignore_skip = ignore_skip
+        self.status_code = status_code
+        self.requested_skips = []
+
+    def get(self, url, headers=None, params=None):
+        skip = 0 if self.ignore_skip else params["skip"]
+        self.requested_skips.append(params["skip"])
+        return FakeResponse(self.status_code, self.items[skip:skip + params["count"]])
+
+
+def test_paginate_returns_every_item():
+    client = FakeListClient(total=7)
+    items = list(paginate("http://api/list", {}, page_size=3, client=client, prefetch=False))
+    assert [item["id"] for item in items] == [f"item-{i}" for i in range(7)]
+    assert client.requested_skips == [0, 3, 6]
+
+
+def test_paginate_with_prefetch_returns_every_item():
+    client = FakeListClient(total=10)
+    items = list(paginate("http://api/list", {}, page_size=5, client=client))
+    assert len(items) == 10
+    # 마지막 페이지가 가득 차 있으면 빈 페이지를 한 번 더 조회해 끝을 확인
+    assert sorted(client.requested_skips) == [0, 5, 10]
+
+
+def test_endpoint_ignoring_skip_stops_after_repeated_page():
+    client = FakeListClient(total=10, ignore_skip=True)
+    pages = list(iter_pages("http://api/list", {}, page_size=5, client=client, prefetch=False))
+    assert len(pages) == 1
+    assert client.requested_skips == [0, 5]
+
+
+def test_find_first_stops_fetching_once_found():
+    client = FakeListClient(total=100)
+    found = find_first("http://api/list", {}, lambda item: item["id"] == "item-2", page_size=5, client=client)
+    assert found == {"id": "item-2"}
+    # 미리 조회한 다음 페이지 하나 외에는 더 조회하지 않음
+    assert len(client.requested_skips) <= 2
+
+
+def test_find_first_returns_none_when_missing():
+    client = FakeListClient(total=4)
+    assert find_first("http://api/list", {}, lambda item: False, page_size=3, client=client) is None
+
+
+def test_error_status_raises_http_error():
+    client = FakeListClient(total=3, status_code=500)
+    with pytest.raises(requests.HTTPError):
+        list(paginate("http://api/list", {}, client=client))
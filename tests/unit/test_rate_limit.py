@@ -0,0 +1,173 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from src.utils import deadline
+from src.utils.rate_limit import SLOT_STALE_AFTER, SharedRateLimiter, endpoint_family, template_path
+
+COMPUTE_URL = "https://portal.example/api/user/resource/compute/virtual_machine"
+NETWORK_URL = "https://portal.example/api/user/resource/network/subnet"
+
+
+def _slot_times(limiter, url, n):
+    """n개 스레드가 동시에 slot에 들어간 시각 (정렬)"""
+    times = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(n)
+
+    def enter():
+        barrier.wait()
+        with limiter.slot(url):
+            with lock:
+                times.append(time.monotonic())
+
+    threads = [threading.Thread(target=enter) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return sorted(times)
+
+
+def test_endpoint_family_and_template():
+    assert endpoint_family(COMPUTE_URL) == "compute"
+    assert endpoint_family("https://portal.example/api/user/region") == "default"
+    assert template_path(f"{NETWORK_URL}/123") == "/api/user/resource/network/subnet/{id}"
+
+
+def test_burst_is_spaced_at_rate(tmp_path):
+    limiter = SharedRateLimiter(default_rate=20, state_dir=tmp_path)
+    times = _slot_times(limiter, COMPUTE_URL, 6)
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert min(gaps) >= 0.04
+    assert times[-1] - times[0] >= 0.24
+    assert limiter.metrics["compute"]["requests"] == 6
+    assert limiter.metrics["compute"]["throttled"] >= 5
+
+
+def test_burst_allowance(tmp_path):
+    limiter = SharedRateLimiter(default_rate=10, burst=3, state_dir=tmp_path)
+    times = _slot_times(limiter, COMPUTE_URL, 4)
+    # 처음 burst개는 바로 통과, 그다음부터 간격 적용
+    assert times[2] - times[0] < 0.05
+    assert times[3] - times[0] >= 0.08
+
+
+def test_families_are_limited_independently(tmp_path):
+    limiter = SharedRateLimiter(limits={"compute": 5}, state_dir=tmp_path)
+    with limiter.slot(COMPUTE_URL):
+        pass
+    started = time.monotonic()
+    with limiter.slot(NETWORK_URL):
+        pass
+    with limiter.slot(COMPUTE_URL, family="network"):
+        pass
+    assert time.monotonic() - started < 0.05
+
+
+def _enter_slots(state_dir, n, queue):
+    limiter = SharedRateLimiter(default_rate=20, state_dir=state_dir)
+    for _ in range(n):
+        with limiter.slot(COMPUTE_URL):
+            queue.put(time.time())
+
+
+def test_spacing_is_shared_across_processes(tmp_path):
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    workers = [context.Process(target=_enter_slots, args=(str(tmp_path), 3, queue)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    times = sorted(queue.get(timeout=10) for _ in range(9))
+    for worker in workers:
+        worker.join(10)
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert min(gaps) >= 0.04
+
+
+def _in_flight_limiter(tmp_path, **kwargs):
+    return SharedRateLimiter(max_in_flight=1, state_dir=tmp_path, **kwargs)
+
+
+def test_in_flight_slot_is_released_on_exception(tmp_path):
+    limiter = _in_flight_limiter(tmp_path, slot_timeout=0.1)
+    with pytest.raises(ValueError):
+        with limiter.slot(COMPUTE_URL):
+            assert (tmp_path / "compute.slot0").exists()
+            raise ValueError("request failed")
+    assert not (tmp_path / "compute.slot0").exists()
+    with limiter.slot(COMPUTE_URL):
+        pass
+
+
+def test_in_flight_limit_waits_then_times_out(tmp_path):
+    holder = _in_flight_limiter(tmp_path)
+    waiter = _in_flight_limiter(tmp_path, slot_timeout=0.1)
+    with holder.slot(COMPUTE_URL):
+        with pytest.raises(TimeoutError):
+            with waiter.slot(COMPUTE_URL):
+                pass
+        # 다른 계열은 별도 슬롯
+        with waiter.slot(NETWORK_URL):
+            pass
+
+
+def test_in_flight_wait_stops_at_deadline(tmp_path):
+    holder = _in_flight_limiter(tmp_path)
+    waiter = _in_flight_limiter(tmp_path)
+    with holder.slot(COMPUTE_URL):
+        started = time.monotonic()
+        with deadline.deadline(0.1):
+            with pytest.raises(deadline.DeadlineExceeded):
+                with waiter.slot(COMPUTE_URL):
+                    pass
+        assert time.monotonic() - started < 1
+
+
+def test_rate_wait_stops_at_deadline(tmp_path):
+    limiter = SharedRateLimiter(default_rate=0.5, state_dir=tmp_path)
+    with limiter.slot(COMPUTE_URL):
+        pass
+    started = time.monotonic()
+    with deadline.deadline(0.1):
+        with pytest.raises(deadline.DeadlineExceeded):
+            with limiter.slot(COMPUTE_URL):
+                pass
+    assert time.monotonic() - started < 1
+
+
+def test_stale_slot_is_reclaimed(tmp_path):
+    """비정상 종료한 워커가 남긴 슬롯 파일은 SLOT_STALE_AFTER가 지나면 회수"""
+    slot = tmp_path / "compute.slot0"
+    slot.write_text("99999")
+    old = time.time() - SLOT_STALE_AFTER - 10
+    os.utime(slot, (old, old))
+
+    limiter = _in_flight_limiter(tmp_path, slot_timeout=0.1)
+    with limiter.slot(COMPUTE_URL):
+        assert slot.read_text() == str(os.getpid())
+    assert not slot.exists()
+
+
+def test_fresh_slot_is_not_reclaimed(tmp_path):
+    (tmp_path / "compute.slot0").write_text("99999")
+    limiter = _in_flight_limiter(tmp_path, slot_timeout=0.05)
+    with pytest.raises(TimeoutError):
+        with limiter.slot(COMPUTE_URL):
+            pass
+
+
+def test_from_env(monkeypatch, tmp_path):
+    for name in ("RATE_LIMIT_RPS", "RATE_LIMITS", "RATE_LIMIT_MAX_IN_FLIGHT"):
+        monkeypatch.delenv(name, raising=False)
+    assert SharedRateLimiter.from_env() is None
+
+    monkeypatch.setenv("RATE_LIMITS", "network=5, compute=2")
+    monkeypatch.setenv("RATE_LIMIT_STATE_DIR", str(tmp_path))
+    limiter = SharedRateLimiter.from_env()
+    assert limiter.rate_for("network") == 5
+    assert limiter.rate_for("compute") == 2
+    assert limiter.rate_for("infra") == 0
@@ -0,0 +1,61 @@
+from src.utils.retry import MAX_EVENTS, RetryPolicy
+
+
+def test_only_idempotent_requests_are_retryable():
+    assert RetryPolicy.is_idempotent("get", None)
+    assert RetryPolicy.is_idempotent("HEAD", {})
+    assert not RetryPolicy.is_idempotent("POST", {})
+    assert not RetryPolicy.is_idempotent("DELETE", None)
+    assert RetryPolicy.is_idempotent("POST", {"Idempotency-Key": "abc"})
+
+
+def test_should_retry_respects_max_attempts_and_method():
+    policy = RetryPolicy(max_attempts=3, budget_per_test=10)
+    assert policy.should_retry("GET", None, attempt=1)
+    assert policy.should_retry("GET", None, attempt=2)
+    assert not policy.should_retry("GET", None, attempt=3)
+    assert not policy.should_retry("POST", {}, attempt=1)
+
+
+def test_budget_is_shared_per_test_and_reset_by_begin_test():
+    policy = RetryPolicy(max_attempts=5, budget_per_test=2)
+    assert policy.should_retry("GET", None, attempt=1)
+    assert policy.should_retry("GET", None, attempt=1)
+    assert not policy.should_retry("GET", None, attempt=1)
+
+    policy.begin_test()
+    assert policy.should_retry("GET", None, attempt=1)
+
+
+def test_rejected_request_does_not_spend_budget():
+    policy = RetryPolicy(max_attempts=3, budget_per_test=1)
+    assert not policy.should_retry("POST", {}, attempt=1)
+    assert not policy.should_retry("GET", None, attempt=3)
+    assert policy.should_retry("GET", None, attempt=1)
+
+
+def test_backoff_uses_capped_full_jitter():
+    policy = RetryPolicy(backoff_base=0.5, backoff_cap=2.0)
+    for attempt, upper in ((1, 0.5), (2, 1.0), (3, 2.0), (10, 2.0)):
+        delays = [policy.backoff(attempt) for _ in range(200)]
+        assert all(0 <= delay <= upper for delay in delays)
+
+
+def test_events_are_drained_and_bounded():
+    policy = RetryPolicy()
+    for attempt in range(MAX_EVENTS + 50):
+        policy.record("GET", "http://api/x", attempt, "503", 0.1)
+    events = policy.drain_events()
+    assert len(events) == MAX_EVENTS
+    assert policy.total_retries == MAX_EVENTS + 50
+    assert policy.drain_events() == []
+
+
+def test_from_env_disabled_with_single_attempt(monkeypatch):
+    monkeypatch.setenv("RETRY_MAX_ATTEMPTS", "1")
+    assert RetryPolicy.from_env() is None
+    monkeypatch.setenv("RETRY_MAX_ATTEMPTS", "4")
+    monkeypatch.setenv("RETRY_STATUSES", "500,503")
+    policy = RetryPolicy.from_env()
+    assert policy.max_attempts == 4
+    assert policy.retry_statuses == (500, 503)
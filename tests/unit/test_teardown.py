@@ -0,0 +1,70 @@
+import threading
+
+from src.utils.teardown import build_dependency_graph, delete_in_dependency_order, deletion_order
+
+
+def _network_resources():
+    """가상 네트워크 ← 서브넷 ← NIC 순으로 참조하는 리소스 + 독립 리소스 하나"""
+    return [
+        {"id": "vn", "payload": {"name": "vn"}},
+        {"id": "sn", "payload": {"name": "sn", "attached_network_id": "vn"}},
+        {"id": "nic", "payload": {"name": "nic", "attached_subnet_id": "sn"}},
+        {"id": "ip", "payload": {"name": "ip"}},
+    ]
+
+
+def test_build_dependency_graph_uses_payload_references():
+    depends_on = build_dependency_graph(_network_resources())
+    assert depends_on == {0: set(), 1: {0}, 2: {1}, 3: set()}
+
+
+def test_build_dependency_graph_ignores_self_and_unknown_ids():
+    resources = [{"id": "a", "payload": {"self_id": "a", "other_id": "zzz", "size": 10}}]
+    assert build_dependency_graph(resources) == {0: set()}
+
+
+def test_deletion_order_puts_dependents_first():
+    order = deletion_order(build_dependency_graph(_network_resources()))
+    assert sorted(order) == [0, 1, 2, 3]
+    assert order.index(2) < order.index(1) < order.index(0)
+
+
+def test_deletion_order_appends_cycles():
+    """순환 의존은 정렬할 수 없으므로 원래 순서대로 뒤에 붙임"""
+    order = deletion_order({0: {1}, 1: {0}, 2: set()})
+    assert order == [2, 0, 1]
+
+
+def test_delete_in_dependency_order_waits_for_dependents():
+    deleted = []
+    waited = []
+    lock = threading.Lock()
+
+    def delete_one(resource):
+        with lock:
+            deleted.append(resource["id"])
+        return True
+
+    def wait_deleted(resource):
+        with lock:
+            waited.append(resource["id"])
+
+    delete_in_dependency_order(_network_resources(), delete_one, wait_deleted)
+
+    assert sorted(deleted) == ["ip", "nic", "sn", "vn"]
+    assert deleted.index("nic") < deleted.index("sn") < deleted.index("vn")
+    # 삭제 완료 대기는 의존 대상이 남아 있는 리소스(NIC, 서브넷)만
+    assert sorted(waited) == ["nic", "sn"]
+
+
+def test_delete_in_dependency_order_continues_after_failure():
+    deleted = []
+
+    def delete_one(resource):
+        if resource["id"] == "nic":
+            raise RuntimeError("boom")
+        deleted.append(resource["id"])
+        return True
+
+    delete_in_dependency_order(_network_resources(), delete_one, lambda resource: None, max_workers=1)
+    assert sorted(deleted) == ["ip", "sn", "vn"]
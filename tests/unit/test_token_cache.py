@@ -0,0 +1,180 @@
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from src.utils import token_cache
+from src.utils.http_client import ApiClient
+
+VM_URL = "https://portal.example/api/user/resource/compute/virtual_machine"
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "token_cache.json"
+    monkeypatch.setenv("TOKEN_CACHE_PATH", str(path))
+    monkeypatch.delenv("TOKEN_REFRESH_MARGIN", raising=False)
+    return path
+
+
+def _jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class CountingFetch:
+    def __init__(self, prefix="token"):
+        self.prefix = prefix
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            return f"{self.prefix}-{self.calls}"
+
+
+def test_decode_jwt_expiry():
+    assert token_cache.decode_jwt_expiry(_jwt(1700000000)) == 1700000000
+    assert token_cache.decode_jwt_expiry("opaque-token") is None
+
+
+def test_cached_token_is_reused_until_near_expiry():
+    fetch = CountingFetch()
+    assert token_cache.get_cached_token(fetch) == "token-1"
+    assert token_cache.get_cached_token(fetch) == "token-1"
+    assert fetch.calls == 1
+
+
+def test_expiring_jwt_is_refetched():
+    tokens = iter([_jwt(time.time() + 60), _jwt(time.time() + 3600)])
+    first = token_cache.get_cached_token(lambda: next(tokens))
+    # 만료까지 TOKEN_REFRESH_MARGIN(300초)보다 적게 남은 토큰은 새로 발급
+    second = token_cache.get_cached_token(lambda: next(tokens))
+    assert first != second
+
+
+def test_refresh_skips_login_when_another_worker_already_refreshed():
+    fetch = CountingFetch()
+    current = token_cache.get_cached_token(fetch)
+    # 다른 워커가 먼저 갱신해 캐시 토큰이 stale_token과 다르면 재로그인하지 않음
+    assert token_cache.refresh_token(fetch, stale_token="expired-token") == current
+    assert fetch.calls == 1
+    # 캐시 토큰 자체가 만료로 확인되면 새로 발급
+    assert token_cache.refresh_token(fetch, stale_token=current) == "token-2"
+    assert fetch.calls == 2
+
+
+def test_failed_fetch_raises():
+    with pytest.raises(RuntimeError):
+        token_cache.refresh_token(lambda: None)
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class ExpiringSession:
+    """valid_auth 외의 Authorization에는 403 expired_token 응답 (응답 전 barrier로 동시 만료 재현)"""
+
+    def __init__(self, valid_auth, parties):
+        self.valid_auth = valid_auth
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, **kwargs):
+        auth = headers.get("Authorization")
+        with self._lock:
+            self.sent.append(auth)
+        if auth != self.valid_auth():
+            self.barrier.wait()
+            return FakeResponse(403, {"code": "expired_token"})
+        return FakeResponse(200, {"ok": True})
+
+
+def test_concurrent_expired_token_responses_refresh_once():
+    fetch = CountingFetch(prefix="fresh")
+    headers = {"Authorization": "Bearer stale"}
+    client = ApiClient()
+    client.rate_limiter = client.circuit_breaker = client.retry_policy = client.hedger = client.latency = None
+    client.session = ExpiringSession(lambda: headers["Authorization"] if headers["Authorization"] != "Bearer stale" else None, 6)
+    client.enable_token_refresh(headers, fetch)
+
+    results = [None] * 6
+
+    def send(i):
+        # api_headers처럼 모든 스레드가 같은 헤더 dict를 사용 (갱신 시 in-place 수정)
+        results[i] = client.post(VM_URL, headers=headers, json={"n": i})
+
+    threads = [threading.Thread(target=send, args=(i,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert fetch.calls == 1
+    assert client.token_refreshes == 1
+    assert headers["Authorization"] == "Bearer fresh-1"
+    assert all(response.status_code == 200 for response in results)
+
+
+def test_unknown_authorization_is_not_refreshed():
+    """테스트가 일부러 만든 가짜 토큰의 403은 갱신하지 않고 그대로 반환"""
+    fetch = CountingFetch()
+    client = ApiClient()
+    client.rate_limiter = client.circuit_breaker = client.retry_policy = client.hedger = client.latency = None
+    client.session = ExpiringSession(lambda: "Bearer valid", 1)
+    client.enable_token_refresh({"Authorization": "Bearer valid"}, fetch)
+
+    response = client.post(VM_URL, headers={"Authorization": "Bearer forged"}, json={})
+    assert response.status_code == 403
+    assert fetch.calls == 0
+
+
+class LateExpiredSession:
+    """
+    stale 토큰으로 보낸 요청에 403 expired_token 응답
+    late 요청은 공유 헤더 dict가 새 토큰으로 바뀐 뒤에 응답 (응답이 늦게 도착하는 사이 다른 요청이 먼저 갱신한 상황)
+    """
+
+    def __init__(self, headers):
+        self.headers = headers
+        self.late_sent = threading.Event()
+
+    def request(self, method, url, headers=None, json=None, **kwargs):
+        if headers.get("Authorization") != "Bearer stale":
+            return FakeResponse(200, {"ok": True})
+        if json == {"late": True}:
+            self.late_sent.set()
+            started = time.monotonic()
+            while self.headers["Authorization"] == "Bearer stale" and time.monotonic() - started < 5:
+                time.sleep(0.001)
+        return FakeResponse(403, {"code": "expired_token"})
+
+
+def test_late_expired_response_after_refresh_does_not_refresh_again():
+    headers = {"Authorization": "Bearer stale"}
+    fetch = CountingFetch(prefix="fresh")
+    client = ApiClient()
+    client.rate_limiter = client.circuit_breaker = client.retry_policy = client.hedger = client.latency = None
+    session = client.session = LateExpiredSession(headers)
+    client.enable_token_refresh(headers, fetch)
+
+    late = threading.Thread(target=lambda: setattr(late, "response", client.post(VM_URL, headers=headers, json={"late": True})))
+    late.start()
+    session.late_sent.wait(5)
+    assert client.post(VM_URL, headers=headers, json={}).status_code == 200
+    late.join(10)
+
+    assert late.response.status_code == 200
+    # 늦게 온 403은 이미 갱신된 토큰으로 재전송만 하고 다시 로그인하지 않음
+    assert fetch.calls == 1
+    assert headers["Authorization"] == "Bearer fresh-1"